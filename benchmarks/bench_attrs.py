@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+'''Benchmark of the storage of the dot attributes of the nodes.
+
+Loads the same graph (nodes with a few repeated attributes, completed with the
+empty attributes set by TextGraphController.checkAndCleanAttrs) in a Graph
+keeping the attributes in a DotAttrsStore and in a Graph keeping a dictionary
+per node, then looks for the nodes of a color in each one.
+The memory is measured with tracemalloc.
+
+Usage:
+python benchmarks/bench_attrs.py [nbNodes]
+'''
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from doted.major_1.minor_0.enumeration.NodeDotAttrs import NodeDotAttrs
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+from doted.major_1.minor_0.model.Graph import Graph
+from doted.major_1.minor_0.model.Node import Node
+from doted.major_1.minor_0.model.NodeArgs import NodeArgs
+from doted.major_1.minor_0.utils.NodeDotPosUtils import NodeDotPosUtils
+
+
+class DictNode(Node):
+    '''Node keeping its dot attributes in a dictionary (behaviour before the
+    DotAttrsStore).'''
+
+    # Dot attributes kept in a dictionary per node
+    dotAttrs = None
+
+    def __init__(self, id, dicDotAttrs={}, x=0.0, y=0.0):
+        self.dotAttrs = {}
+        Node.__init__(self, id, dicDotAttrs, x, y)
+
+    def edit(self, dicDotAttrs):
+        '''Edit dot attributes of the node.
+
+        Argument(s):
+        dicDotAttrs (Dictionary[]): Dot attributes of the node
+        '''
+        dotAttrs = self.dotAttrs.copy()
+        for attr, val in dicDotAttrs.items():
+            if attr == NodeDotAttrs.pos.value:
+                pos = NodeDotPosUtils.getPos(val) if val else None
+                self.x, self.y = pos if pos else (0.0, 0.0)
+
+            dotAttrs[attr] = val
+
+        self.dotAttrs = dotAttrs
+
+    def getArgs(self):
+        '''Return the arguments (NodeArgs) of the node.'''
+        return NodeArgs(self.id, self.dotAttrs, self.x, self.y)
+
+
+class DictGraph(Graph):
+    '''Graph of DictNode.'''
+
+    def addNode(self, id, dicDotAttrs={}, x=None, y=None):
+        '''Add a Node to the graph and notify this.
+
+        Argument(s):
+        id (str): id of the node
+        dicDotAttrs (Dictionary[]): Dot attributes of the node (default {})
+        x (float): x coordinate of the node (default None)
+        y (float): y coordinate of the node (default None)
+        '''
+        if not self.nodeExists(id):
+            node = DictNode(id, dicDotAttrs, x if x else 0, y if y else 0)
+            self.nodes[node.id] = node
+            self.notify(node.getArgs(), None, UpdateModeView.add)
+
+    def findNodes(self, attr, value):
+        '''Return the IDs of the nodes whose dot attribute has a value.
+
+        Argument(s):
+        attr (str): Name of the dot attribute
+        value (str): Value of the dot attribute
+        '''
+        return [node.id for node in self.nodes.values()
+                if node.dotAttrs.get(attr) == value]
+
+
+colors = ["red", "green", "blue", "black", "yellow"]
+shapes = ["box", "ellipse", "circle"]
+
+
+def loadGraph(graph, nbNodes):
+    '''Load nbNodes nodes into a graph. As with a parsed text, each node has
+    its own copy of the attribute values.
+
+    Argument(s):
+    graph (Graph): Graph to load
+    nbNodes (int): Number of nodes
+    '''
+    rand = random.Random(nbNodes)
+    for i in range(nbNodes):
+        dotAttrs = dict.fromkeys((attr.value for attr in NodeDotAttrs))
+
+        # join() returns new strings, as pydot does when it parses a text
+        dotAttrs.update({
+            "label": "n" + str(i),
+            "color": "".join(rand.choice(colors)),
+            "fillcolor": "".join(rand.choice(colors)),
+            "shape": "".join(rand.choice(shapes)),
+            "style": "".join("filled")
+        })
+        graph.addNode(str(i), dotAttrs, rand.uniform(0, 1000),
+                      rand.uniform(0, 1000))
+
+
+def measure(graphClass, nbNodes):
+    '''Return the memory (in bytes) held by the loaded graph and the time (in
+    seconds) needed to find the red nodes.
+
+    Argument(s):
+    graphClass (type): Class of the graph
+    nbNodes (int): Number of nodes
+    '''
+    gc.collect()
+    tracemalloc.start()
+    graph = graphClass()
+    loadGraph(graph, nbNodes)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    graph.findNodes("color", "red")
+    elapsed = time.perf_counter() - start
+
+    # Keep the graph alive until the measure is done
+    del graph
+
+    return size, elapsed
+
+
+def main(nbNodes=100000):
+    '''Run the benchmark.
+
+    Argument(s):
+    nbNodes (int): Number of nodes of the graph (default 100000)
+    '''
+    print("{0:>8} {1:>12} {2:>14} {3:>12}".format(
+        "storage", "memory (MB)", "bytes/node", "find (ms)"))
+    for name, graphClass in [("columns", Graph), ("dicts", DictGraph)]:
+        size, elapsed = measure(graphClass, nbNodes)
+        print("{0:>8} {1:>12.1f} {2:>14.0f} {3:>12.1f}".format(
+            name, size / 2 ** 20, size / nbNodes, elapsed * 1000))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+'''Benchmark of the memory used by the Graph and CompactGraph models.
+
+Loads the same graph (nodes with a label and a position, then edges) in each
+model and measures the memory it holds with tracemalloc.
+
+Usage:
+python benchmarks/bench_memory.py [nbNodes]
+'''
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from doted.major_1.minor_0.model.CompactGraph import CompactGraph
+from doted.major_1.minor_0.model.Graph import Graph
+
+
+def loadGraph(graph, nbNodes):
+    '''Load nbNodes nodes and as many edges into a graph.
+
+    Argument(s):
+    graph (Graph or CompactGraph): Graph to load
+    nbNodes (int): Number of nodes
+    '''
+    rand = random.Random(nbNodes)
+    for i in range(nbNodes):
+        graph.addNode(str(i), {"label": "n" + str(i % 100)},
+                      rand.uniform(0, 1000), rand.uniform(0, 1000))
+    for i in range(nbNodes):
+        graph.addEdge(str(i), str(rand.randrange(nbNodes)))
+
+
+def measure(graphClass, nbNodes):
+    '''Return the memory (in bytes) held by a loaded graph and the time (in
+    seconds) needed to load it.
+
+    Argument(s):
+    graphClass (type): Class of the graph
+    nbNodes (int): Number of nodes
+    '''
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = graphClass()
+    loadGraph(graph, nbNodes)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Keep the graph alive until the measure is done
+    del graph
+
+    return size, elapsed
+
+
+def main(nbNodes=200000):
+    '''Run the benchmark.
+
+    Argument(s):
+    nbNodes (int): Number of nodes of the graph (default 200000)
+    '''
+    print("{0:>14} {1:>12} {2:>14} {3:>10}".format("model", "memory (MB)",
+                                                   "bytes/node", "load (s)"))
+    for graphClass in (Graph, CompactGraph):
+        size, elapsed = measure(graphClass, nbNodes)
+        print("{0:>14} {1:>12.1f} {2:>14.0f} {3:>10.2f}".format(
+            graphClass.__name__, size / 2 ** 20, size / nbNodes, elapsed))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
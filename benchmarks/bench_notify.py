@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+'''Benchmark of the model events sent during the import of a graph.
+
+Imports the same graph (nodes with a label and a position, then edges) in a
+Graph observed like the textual view does, once with the NodeArgs/EdgeArgs
+records and once with the former Enum-keyed dictionaries copied by the view.
+The memory is measured with tracemalloc.
+
+Usage:
+python benchmarks/bench_notify.py [nbNodes]
+'''
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from enum import Enum
+
+from doted.major_1.minor_0.enumeration.NodeDotAttrs import NodeDotAttrs
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+from doted.major_1.minor_0.model.Edge import Edge
+from doted.major_1.minor_0.model.Graph import Graph
+from doted.major_1.minor_0.model.Node import Node
+from doted.major_1.minor_0.observer.Observer import Observer
+from doted.major_1.minor_0.utils.EdgeUtils import EdgeUtils
+from doted.major_1.minor_0.utils.NodeDotPosUtils import NodeDotPosUtils
+
+
+class DictNodeArgs(Enum):
+    '''Keys of the former dictionary of the arguments of a node.'''
+    id = 0
+    dotAttrs = 1
+    x = 2
+    y = 3
+
+
+class DictEdgeArgs(Enum):
+    '''Keys of the former dictionary of the arguments of an edge.'''
+    id = 0
+    sourceId = 1
+    destId = 2
+
+
+class DictNode(Node):
+    '''Node without slots, edited in place and sending a dictionary of its
+    arguments (behaviour before the NodeArgs records).'''
+
+    # Dot attributes kept in a dictionary per node
+    dotAttrs = None
+
+    def __init__(self, id, dicDotAttrs={}, x=0.0, y=0.0):
+        self.dotAttrs = {}
+        Node.__init__(self, id, dicDotAttrs, x, y)
+
+    def edit(self, dicDotAttrs):
+        '''Edit dot attributes of the node.
+
+        Argument(s):
+        dicDotAttrs (Dictionary[]): Dot attributes of the node
+        '''
+        for attr, val in dicDotAttrs.items():
+            if attr == NodeDotAttrs.pos.value:
+                pos = NodeDotPosUtils.getPos(val) if val else None
+                self.x, self.y = pos if pos else (0.0, 0.0)
+
+            self.dotAttrs[attr] = val
+
+    def getArgs(self):
+        '''Return a dictionary of the arguments of the node.'''
+        return {
+            DictNodeArgs.id: self.id,
+            DictNodeArgs.dotAttrs: self.dotAttrs,
+            DictNodeArgs.x: self.x,
+            DictNodeArgs.y: self.y
+        }
+
+
+class DictEdge(Edge):
+    '''Edge without slots sending a dictionary of its arguments (behaviour
+    before the EdgeArgs records).'''
+
+    def getArgs(self):
+        '''Return a dictionary of the arguments of the edge.'''
+        return {
+            DictEdgeArgs.id: self.id,
+            DictEdgeArgs.sourceId: self.source.id,
+            DictEdgeArgs.destId: self.dest.id
+        }
+
+
+class DictGraph(Graph):
+    '''Graph of DictNode and DictEdge.'''
+
+    def addNode(self, id, dicDotAttrs={}, x=None, y=None):
+        '''Add a Node to the graph and notify this.
+
+        Argument(s):
+        id (str): id of the node
+        dicDotAttrs (Dictionary[]): Dot attributes of the node (default {})
+        x (float): x coordinate of the node (default None)
+        y (float): y coordinate of the node (default None)
+        '''
+        if not self.nodeExists(id):
+            node = DictNode(id, dicDotAttrs, x if x else 0, y if y else 0)
+            self.nodes[node.id] = node
+            self.notify(node.getArgs(), None, UpdateModeView.add)
+
+    def addEdge(self, idSourceNode, idDestNode):
+        '''Add an Edge to the graph and notify this.
+
+        Argument(s):
+        idSourceNode (str): ID of the source node
+        idDestNode (str): ID of the destination node
+        '''
+        self.addNode(idSourceNode)
+        self.addNode(idDestNode)
+
+        idEdge = EdgeUtils.createEdgeId(idSourceNode, idDestNode,
+                                        self.directed)
+        if idEdge not in self.edges:
+            edge = DictEdge(self.nodes[idSourceNode], self.nodes[idDestNode],
+                            idEdge)
+            self.edges[edge.id] = edge
+            self.notify(None, edge.getArgs(), UpdateModeView.add)
+
+
+class TextModel(Observer):
+    '''Observer keeping the nodes and edges like the textual view does.
+
+
+    Argument(s):
+    graph (Graph): Observed graph
+    '''
+
+    def __init__(self, graph):
+        self.nodes = {}
+        self.edges = {}
+        Observer.__init__(self, graph)
+
+    def update(self, argsNode, argsEdge, updateModeView):
+        '''Keep the arguments of the added items.
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node
+        argsEdge (EdgeArgs): Arguments of the edge
+        updateModeView (UpdateModeView): Update mode
+        '''
+        if argsNode:
+            self.nodes[argsNode.id] = argsNode.dotAttrs
+        else:
+            self.edges[argsEdge.id] = argsEdge
+
+
+class DictTextModel(TextModel):
+    '''Observer keeping the nodes and edges like the textual view did with
+    dictionaries.'''
+
+    def update(self, dictArgsNode, dictArgsEdge, updateModeView):
+        '''Keep a copy of the arguments of the added items.
+
+        Argument(s):
+        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        updateModeView (UpdateModeView): Update mode
+        '''
+        if dictArgsNode:
+            self.nodes[dictArgsNode[DictNodeArgs.id]] = \
+                dictArgsNode[DictNodeArgs.dotAttrs].copy()
+        else:
+            self.edges[dictArgsEdge[DictEdgeArgs.id]] = {
+                DictEdgeArgs.sourceId: dictArgsEdge[DictEdgeArgs.sourceId],
+                DictEdgeArgs.destId: dictArgsEdge[DictEdgeArgs.destId]
+            }
+
+
+def importGraph(graph, nbNodes):
+    '''Import nbNodes nodes and as many edges into a graph.
+
+    Argument(s):
+    graph (Graph): Graph
+    nbNodes (int): Number of nodes
+    '''
+    rand = random.Random(nbNodes)
+    for i in range(nbNodes):
+        graph.addNode(str(i), {"label": "n" + str(i % 100)},
+                      rand.uniform(0, 1000), rand.uniform(0, 1000))
+    for i in range(nbNodes):
+        graph.addEdge(str(i), str(rand.randrange(nbNodes)))
+
+
+def measure(graphClass, observerClass, nbNodes):
+    '''Return the memory (in bytes) held after the import, the peak of memory
+    during the import and the time (in seconds) needed to import.
+
+    Argument(s):
+    graphClass (type): Class of the graph
+    observerClass (type): Class of the observer
+    nbNodes (int): Number of nodes
+    '''
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = graphClass()
+    observer = observerClass(graph)
+    importGraph(graph, nbNodes)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Keep the graph and the observer alive until the measure is done
+    del graph, observer
+
+    return size, peak, elapsed
+
+
+def main(nbNodes=100000):
+    '''Run the benchmark.
+
+    Argument(s):
+    nbNodes (int): Number of nodes of the graph (default 100000)
+    '''
+    print("{0:>8} {1:>12} {2:>12} {3:>14} {4:>10}".format(
+        "payload", "memory (MB)", "peak (MB)", "bytes/node", "import (s)"))
+    for name, graphClass, observerClass in [("records", Graph, TextModel),
+                                            ("dicts", DictGraph,
+                                             DictTextModel)]:
+        size, peak, elapsed = measure(graphClass, observerClass, nbNodes)
+        print("{0:>8} {1:>12.1f} {2:>12.1f} {3:>14.0f} {4:>10.2f}".format(
+            name, size / 2 ** 20, peak / 2 ** 20, size / nbNodes, elapsed))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+'''Benchmark of the search of the declaration of an item in a dot text.
+
+Finds the span of node and edge statements spread over a generated dot text,
+once with the former path of TextGraphView.findPosItem (the text split on
+{, } and ; with a pydot parse per statement) and once with the DotParser
+(one pass over the tokens of the text).
+
+Usage:
+python benchmarks/bench_parser.py [nbNodes]
+'''
+
+import random
+import re
+import sys
+import time
+
+from pydot_ng import graph_from_dot_data
+
+from doted.major_1.minor_0.utils.DotParser import DotParser
+from doted.major_1.minor_0.utils.EdgeUtils import EdgeUtils
+
+
+def createText(nbNodes):
+    '''Return the dot text of a graph of nbNodes nodes and as many edges.
+
+    Argument(s):
+    nbNodes (int): Number of nodes
+    '''
+    rand = random.Random(nbNodes)
+    statements = []
+    for i in range(nbNodes):
+        statements.append("    n{0} [label=l{1}, pos=\"{2},{3}!\"];".format(
+            i, i % 100, rand.randrange(1000), rand.randrange(1000)))
+    for i in range(nbNodes):
+        statements.append("    n{0} -- n{1};".format(
+            i, rand.randrange(nbNodes)))
+
+    return "graph g {\n" + "\n".join(statements) + "\n}"
+
+
+def findPosItemPydot(text, id, directed):
+    '''Return index of start and end of the item's declaration like
+    TextGraphView.findPosItem did with pydot.
+
+    Argument(s):
+    text (str): Dot text
+    id (str or Tuple[str]): ID of the item we want to find
+    directed (boolean): Graph directed or not
+    '''
+    index = 0
+    graphType = EdgeUtils.graphType(directed)
+
+    text = [e + '{' for e in text.split('{') if e != ""]
+    index += len(text[0]) + 1
+    text.pop(0)
+    text = ''.join(text)
+    text = [e + '}' for e in text.split('}') if e != ""]
+    text.pop(len(text) - 1)
+    stats = re.split(';', ''.join(text))
+
+    for s in stats:
+        pydotG = graph_from_dot_data(graphType + " {" + s + "}")
+        if pydotG:
+            for node in pydotG.get_nodes():
+                if node.get_name() == id:
+                    return([index, index + len(s)])
+
+            for edge in pydotG.get_edges():
+                if EdgeUtils.createEdgeId(edge.get_source(),
+                                          edge.get_destination(),
+                                          directed) == id:
+                    return([index, index + len(s)])
+
+            index += len(s) + 1
+
+
+def findPosItemParser(text, id, directed):
+    '''Return index of start and end of the item's declaration with the
+    DotParser.
+
+    Argument(s):
+    text (str): Dot text
+    id (str or Tuple[str]): ID of the item we want to find
+    directed (boolean): Graph directed or not
+    '''
+    parser = DotParser(directed)
+    parser.parse(text)
+
+    if isinstance(id, tuple):
+        return parser.edgeSpans.get(id)
+
+    return parser.nodeSpans.get(id)
+
+
+def measure(findPosItem, text, id):
+    '''Return the time (in seconds) needed to find an item.
+
+    Argument(s):
+    findPosItem (function): Function finding the item
+    text (str): Dot text
+    id (str or Tuple[str]): ID of the item
+    '''
+    start = time.perf_counter()
+    findPosItem(text, id, False)
+
+    return time.perf_counter() - start
+
+
+def main(nbNodes=1000):
+    '''Run the benchmark.
+
+    Argument(s):
+    nbNodes (int): Number of nodes of the graph (default 1000)
+    '''
+    text = createText(nbNodes)
+    parser = DotParser()
+    parser.parse(text)
+    edges = list(parser.edgeSpans)
+
+    items = [("first node", "n0"),
+             ("middle node", "n" + str(nbNodes // 2)),
+             ("last node", "n" + str(nbNodes - 1)),
+             ("first edge", edges[0]),
+             ("last edge", edges[-1])]
+
+    print("{0:>12} {1:>10} {2:>10} {3:>9}".format(
+        "item", "pydot (s)", "parser (s)", "speedup"))
+    for name, id in items:
+        pydotTime = measure(findPosItemPydot, text, id)
+        parserTime = measure(findPosItemParser, text, id)
+        print("{0:>12} {1:>10.4f} {2:>10.4f} {3:>9.1f}".format(
+            name, pydotTime, parserTime, pydotTime / parserTime))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
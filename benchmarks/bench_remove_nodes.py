@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+'''Benchmark of node removal in the Graph model.
+
+Removes a selection of nodes from graphs of growing size, once with the
+incident-edge index of Node and once with the former scan of every edge of
+the graph.
+
+Usage:
+python benchmarks/bench_remove_nodes.py [nbRemovedNodes]
+'''
+
+import random
+import sys
+import time
+
+from doted.major_1.minor_0.model.Graph import Graph
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+
+
+class ScanGraph(Graph):
+    '''Graph removing the edges of a node by scanning all edges of the graph
+    (behaviour before the incident-edge index).'''
+
+    def removeNode(self, idNode):
+        '''Remove a Node from the graph.
+
+        Argument(s):
+        idNode (str): ID of the node to remove
+        '''
+        if self.nodeExists(idNode):
+            node = self.nodes.pop(idNode)
+            self.idAllocator.removeId(idNode)
+            self.notify(node.getArgs(), None, UpdateModeView.remove)
+
+            for edge in list(self.edges.values()):
+                if node == edge.source or node == edge.dest:
+                    self.removeEdge(edge.id)
+
+            if not self.nodes:
+                self.idAllocator.reset()
+
+
+def buildGraph(graphClass, nbNodes, nbEdges):
+    '''Build a random graph.
+
+    Argument(s):
+    graphClass (type): Class of the graph to build
+    nbNodes (int): Number of nodes
+    nbEdges (int): Number of edges
+    '''
+    rand = random.Random(nbNodes + nbEdges)
+    graph = graphClass()
+    for i in range(nbNodes):
+        graph.addNode(str(i))
+    while len(graph.edges) < nbEdges:
+        graph.addEdge(str(rand.randrange(nbNodes)),
+                      str(rand.randrange(nbNodes)))
+
+    return graph
+
+
+def timeRemoval(graph, idNodes):
+    '''Return the time (in seconds) needed to remove nodes from a graph.
+
+    Argument(s):
+    graph (Graph): Graph
+    idNodes (List[str]): IDs of the nodes to remove
+    '''
+    start = time.perf_counter()
+    for idNode in idNodes:
+        graph.removeNode(idNode)
+
+    return time.perf_counter() - start
+
+
+def main(nbRemovedNodes=200):
+    '''Run the benchmark.
+
+    Argument(s):
+    nbRemovedNodes (int): Number of nodes removed in each graph (default 200)
+    '''
+    print("{0:>8} {1:>8} {2:>12} {3:>12}".format("nodes", "edges",
+                                                 "index (s)", "scan (s)"))
+    for nbNodes, nbEdges in [(5000, 10000), (25000, 50000),
+                             (100000, 200000)]:
+        idNodes = random.Random(0).sample([str(i) for i in range(nbNodes)],
+                                          nbRemovedNodes)
+        results = [
+            timeRemoval(buildGraph(graphClass, nbNodes, nbEdges), idNodes)
+            for graphClass in (Graph, ScanGraph)
+        ]
+        print("{0:>8} {1:>8} {2:>12.4f} {3:>12.4f}".format(nbNodes, nbEdges,
+                                                           *results))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
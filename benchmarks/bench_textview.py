@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+'''Benchmark of the text widgets for large dot texts.
+
+Loads a generated dot text in a rich text QTextEdit (former base class of
+TextGraphView) and in a QPlainTextEdit and shows its end, then reads the line
+of a statement in the middle of the text, once with the whole text copied
+(former TextGraphView.removeStatement) and once with the block of the
+statement.
+
+Usage:
+python benchmarks/bench_textview.py [nbNodes]
+'''
+
+import sys
+import time
+
+from PyQt5.QtGui import QTextCursor
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit, QTextEdit
+
+
+def createText(nbNodes):
+    '''Return a dot text with nbNodes node statements and as many edges.
+
+    Argument(s):
+    nbNodes (int): Number of nodes
+    '''
+    lines = ["graph g {"]
+    for i in range(nbNodes):
+        lines.append("    n{0} [label=l{0}];".format(i))
+    for i in range(nbNodes):
+        lines.append("    n{0} -- n{1};".format(i, (i * 7 + 1) % nbNodes))
+    lines.append("}")
+
+    return "\n".join(lines)
+
+
+def readLineText(widget, position):
+    '''Return the line of a position from a copy of the whole text.
+
+    Argument(s):
+    widget (QWidget): Text widget
+    position (int): Position in the text
+    '''
+    text = widget.toPlainText()
+    return text[text.rfind("\n", 0, position) + 1:text.find("\n", position)]
+
+
+def readLineBlock(widget, position):
+    '''Return the line of a position from its block.
+
+    Argument(s):
+    widget (QWidget): Text widget
+    position (int): Position in the text
+    '''
+    return widget.document().findBlock(position).text()
+
+
+def main(nbNodes=50000):
+    '''Run the benchmark.
+
+    Argument(s):
+    nbNodes (int): Number of nodes of the graph (default 50000)
+    '''
+    app = QApplication.instance() or QApplication(sys.argv)
+    text = createText(nbNodes)
+    position = len(text) // 2
+
+    print("{0:>14} {1:>9} {2:>16} {3:>17}".format(
+        "widget", "load (s)", "read text (ms)", "read block (ms)"))
+    for widgetClass in [QTextEdit, QPlainTextEdit]:
+        widget = widgetClass()
+        widget.resize(600, 800)
+        widget.show()
+
+        # The text is laid out up to the end to show it
+        start = time.perf_counter()
+        widget.setPlainText(text)
+        widget.moveCursor(QTextCursor.End)
+        widget.ensureCursorVisible()
+        app.processEvents()
+        loadTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(10):
+            line = readLineText(widget, position)
+        textTime = (time.perf_counter() - start) / 10
+
+        start = time.perf_counter()
+        for i in range(10):
+            assert readLineBlock(widget, position) == line
+        blockTime = (time.perf_counter() - start) / 10
+
+        print("{0:>14} {1:>9.2f} {2:>16.3f} {3:>17.3f}".format(
+            widgetClass.__name__, loadTime, textTime * 1000,
+            blockTime * 1000))
+        widget.close()
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -32,7 +32,9 @@ def main(args=None):
     app = QApplication(sys.argv)
 
     # Initialisation
-    doted = Doted()
+    doted = Doted(compact="--compact" in sys.argv[1:],
+                  queued="--queued" in sys.argv[1:],
+                  threaded="--sync" not in sys.argv[1:])
     doted.run()
 
     sys.exit(app.exec_())
@@ -16,8 +16,15 @@
 # You should have received a copy of the GNU General Public License
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
-from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
 from doted.major_1.minor_0.observer.Observer import Observer
+from doted.major_1.minor_0.observer.event.EdgeAdded import EdgeAdded
+from doted.major_1.minor_0.observer.event.EdgeEdited import EdgeEdited
+from doted.major_1.minor_0.observer.event.EdgeRemoved import EdgeRemoved
+from doted.major_1.minor_0.observer.event.NodeAdded import NodeAdded
+from doted.major_1.minor_0.observer.event.NodeAttrChanged import \
+    NodeAttrChanged
+from doted.major_1.minor_0.observer.event.NodeMoved import NodeMoved
+from doted.major_1.minor_0.observer.event.NodeRemoved import NodeRemoved
 
 
 class Controller(Observer):
@@ -41,28 +48,89 @@ class Controller(Observer):
         self.view = view
         self.view.setController(self)
 
-    def update(self, dictArgsNode, dictArgsEdge, updateModeView):
-        '''Update the view.
+    def getHandlers(self):
+        '''Return the handler of each type of event updating the view.'''
+        return {
+            NodeAdded: self.onNodeAdded,
+            NodeMoved: self.onNodeEdited,
+            NodeAttrChanged: self.onNodeEdited,
+            NodeRemoved: self.onNodeRemoved,
+            EdgeAdded: self.onEdgeAdded,
+            EdgeEdited: self.onEdgeEdited,
+            EdgeRemoved: self.onEdgeRemoved
+        }
+
+    def onNodeAdded(self, event):
+        '''Add a node to the view.
+
+        Argument(s):
+        event (NodeAdded): Event
+        '''
+        self.view.addNode(event.args)
+
+    def onNodeEdited(self, event):
+        '''Edit a node of the view.
+
+        Argument(s):
+        event (NodeAttrChanged): Event
+        '''
+        self.view.editNode(event.args, event.changedAttrs)
+
+    def onNodeRemoved(self, event):
+        '''Remove a node from the view.
+
+        Argument(s):
+        event (NodeRemoved): Event
+        '''
+        self.view.removeNode(event.args)
+
+    def onEdgeAdded(self, event):
+        '''Add an edge to the view.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
-        updateModeView (UpdateModeView) : Update mode
+        event (EdgeAdded): Event
         '''
-        # Update node
-        if dictArgsNode:
-            if updateModeView == UpdateModeView.add:
-                self.view.addNode(dictArgsNode)
-            elif updateModeView == UpdateModeView.edit:
-                self.view.editNode(dictArgsNode)
-            elif updateModeView == UpdateModeView.remove:
-                self.view.removeNode(dictArgsNode)
-
-        # Update edge
-        else:
-            if updateModeView == UpdateModeView.add:
-                self.view.addEdge(dictArgsEdge)
-            elif updateModeView == UpdateModeView.edit:
-                self.view.editEdge(dictArgsEdge)
-            elif updateModeView == UpdateModeView.remove:
-                self.view.removeEdge(dictArgsEdge)
+        self.view.addEdge(event.args)
+
+    def onEdgeEdited(self, event):
+        '''Edit an edge of the view.
+
+        Argument(s):
+        event (EdgeEdited): Event
+        '''
+        self.view.editEdge(event.args)
+
+    def onEdgeRemoved(self, event):
+        '''Remove an edge from the view.
+
+        Argument(s):
+        event (EdgeRemoved): Event
+        '''
+        self.view.removeEdge(event.args)
+
+    def updateVisibility(self, idNodes, idEdges, visible):
+        '''Hide or show items of the view.
+
+        Argument(s):
+        idNodes (Iterable[str]): IDs of the nodes
+        idEdges (Iterable[Tuple[str]]): IDs of the edges
+        visible (boolean): Items shown or hidden
+        '''
+        self.view.setItemsVisible(idNodes, idEdges, visible)
+
+    def updateBatch(self, changeSet):
+        '''Update the view with a set of changes.
+
+        Argument(s):
+        changeSet (ChangeSet): Changes made during a batch
+        '''
+        self.view.applyChanges(changeSet)
+
+    def batch(self):
+        '''Return a context manager buffering the changes of the model until
+        the end of a with statement.'''
+        return self.model.batch()
+
+    def flush(self):
+        '''Apply at once the changes of the model queued by its dispatcher.'''
+        self.model.flush()
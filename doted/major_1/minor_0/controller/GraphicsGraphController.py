@@ -63,8 +63,13 @@ class GraphicsGraphController(Controller):
         Argument(s):
         idNode (str): ID of the node to remove
         '''
+        self.textGraphController.syncPendingText(idNode)
         self.model.removeNode(idNode)
 
+    def onEndMove(self):
+        '''Callback function when the user ends moving nodes.'''
+        self.model.closeUndoGroup()
+
     def onCreateEdge(self, idSourceNode, idDestNode):
         '''Callback function when creating an edge.
 
@@ -78,16 +83,51 @@ class GraphicsGraphController(Controller):
         '''Callback function when removing an edge.
 
         Argument(s):
-        idEdge (str): ID of the edge to remove
+        idEdge (Tuple[str]): ID of the edge to remove
         '''
+        self.textGraphController.syncPendingText(idEdge)
         self.model.removeEdge(idEdge)
 
-    def onSelectItem(self, id):
-        '''Inform the controller of textual view that an item (node/edge) has
-        been selected for that the controller of textual view highlight this
-        item in the text.
+    def onCollapseClusters(self, idNodes):
+        '''Callback function when collapsing the clusters of nodes.
+
+        Argument(s):
+        idNodes (List[str]): IDs of the nodes
+        '''
+        with self.model.batch():
+            for idNode in idNodes:
+                idCluster = self.model.getNodeCluster(idNode)
+                if idCluster:
+                    self.model.collapseCluster(idCluster)
+
+    def onExpandClusters(self):
+        '''Callback function when expanding all the clusters.'''
+        self.model.expandClusters()
+
+    def getComponents(self, idNodes):
+        '''Return the IDs of the nodes of the connected components of nodes.
+
+        Argument(s):
+        idNodes (List[str]): IDs of the nodes
+        '''
+        idComponentNodes = set()
+        for idNode in idNodes:
+            if idNode not in idComponentNodes:
+                idComponentNodes.update(self.model.getComponent(idNode))
+
+        return idComponentNodes
+
+    def getExtremeNodes(self):
+        '''Return the IDs of the leftmost, topmost, rightmost and bottommost
+        nodes (None if the graph is empty).'''
+        return self.model.getExtremeNodes()
+
+    def onSelectItems(self, ids):
+        '''Inform the controller of textual view that items (nodes/edges) have
+        been selected for that the controller of textual view highlight these
+        items in the text.
 
         Argument(s):
-        id (str): ID of the node
+        ids (List[str or Tuple[str]]): IDs of the nodes and of the edges
         '''
-        self.textGraphController.highlightItem(id)
+        self.textGraphController.highlightItems(ids)
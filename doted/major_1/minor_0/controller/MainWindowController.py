@@ -19,6 +19,9 @@
 from PyQt5.Qt import QFile, QIODevice, QByteArray, QFileDialog
 from PyQt5.QtWidgets import QMessageBox
 
+from doted.major_1.minor_0.model.GraphStatistics import GraphStatistics
+from doted.major_1.minor_0.observer.DispatchProfiler import DispatchProfiler
+
 
 class MainWindowController(object):
     '''The MainWindowController class defines the controller to manage
@@ -34,10 +37,15 @@ class MainWindowController(object):
     model (Model): Model of the controller
     view (View): View of the controller
     textGraphController (TextGraphController): Ref to the TextGraphController
+    statistics (GraphStatistics): Statistics of the graph shown by the view
+    profiler (DispatchProfiler): Time spent by the observers of the model
+    (recorded when profiling is enabled)
     dotFilter (str): Filter to only show dot files
+    jsonFilter (str): Filter to only show JSON files
     '''
 
     dotFilter = "Dot files (*.dot)"
+    jsonFilter = "JSON files (*.json)"
 
     def __init__(self, model, view, textGraphController):
         self.view = view
@@ -45,6 +53,8 @@ class MainWindowController(object):
         self.model = model
 
         self.textGraphController = textGraphController
+        self.statistics = GraphStatistics(model)
+        self.profiler = DispatchProfiler()
 
     def onImportFile(self):
         '''Import a file which contains a graph and build or rebuild the model
@@ -66,12 +76,13 @@ class MainWindowController(object):
     # If importGraph() is clean or change you could remove comments of theses
     # lines to build the model
 #             # Create nodes from pydot nodes
-#             for node in pydotGraph.get_nodes():
-#                 self.model.addNode(node.get_name(), node.get_attributes())
+#             self.model.addNodes((node.get_name(), node.get_attributes(),
+#                                  None, None)
+#                                 for node in pydotGraph.get_nodes())
 #
 #             # Create edges from pydot edges
-#             for edge in pydotGraph.get_edges():
-#                 self.model.addEdge(edge.get_source(), edge.get_destination())
+#             self.model.addEdges((edge.get_source(), edge.get_destination())
+#                                 for edge in pydotGraph.get_edges())
 
             # Send graph's textual representation to the textual controller
             with open(result[0], "r") as file:
@@ -101,3 +112,64 @@ class MainWindowController(object):
     def onClearGraph(self):
         '''Clear the graph.'''
         self.model.clear()
+
+    def onUndo(self):
+        '''Undo the last changes of the graph.'''
+        self.model.undo()
+
+    def onRedo(self):
+        '''Redo the last undone changes of the graph.'''
+        self.model.redo()
+
+    def onRefreshStatistics(self):
+        '''Send the statistics of the graph to the view if they changed since
+        the last refresh, and whether the text is being parsed.'''
+        self.view.showParsing(self.textGraphController.isParsing())
+
+        if self.statistics.clearChanged():
+            self.view.showStatistics(
+                self.statistics.nbNodes,
+                self.statistics.nbEdges,
+                self.statistics.getNbIsolatedNodes(),
+                self.statistics.getDensity(),
+                self.statistics.getDegreeDistribution()
+            )
+
+    def onLiveSync(self, enabled):
+        '''Enable or disable the synchronisation of the model while typing in
+        the textual view.
+
+        Argument(s):
+        enabled (boolean): Live synchronisation enabled or not
+        '''
+        self.textGraphController.setLiveSync(enabled)
+
+    def onProfile(self, enabled):
+        '''Enable or disable the profiling of the observers of the model.
+
+        Argument(s):
+        enabled (boolean): Profiling enabled or not
+        '''
+        self.model.setProfiler(self.profiler if enabled else None)
+
+    def onShowProfile(self):
+        '''Send the time spent by the observers of the model to the view.'''
+        self.view.showProfile(self.profiler.getStats())
+
+    def onResetProfile(self):
+        '''Forget the time spent by the observers of the model.'''
+        self.profiler.reset()
+
+    def onDumpProfile(self):
+        '''Save in a JSON file the time spent by the observers of the
+        model.'''
+        result = QFileDialog.getSaveFileName(None, "Dump profile", None,
+                                             MainWindowController.jsonFilter)
+
+        # Check if Save button has been pressed
+        if len(result[0]) > 0:
+            try:
+                with open(result[0], "w") as file:
+                    self.profiler.dump(file)
+            except OSError:
+                QMessageBox.warning(None, "Dump profile", "Dump failed.")
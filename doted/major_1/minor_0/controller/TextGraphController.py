@@ -20,7 +20,6 @@ from pydot_ng import NODE_ATTRIBUTES
 
 from doted.major_1.minor_0.utils.NodeDotPosUtils import NodeDotPosUtils
 from doted.major_1.minor_0.controller.Controller import Controller
-from doted.major_1.minor_0.enumeration.NodeArgs import NodeArgs
 from doted.major_1.minor_0.enumeration.NodeDotAttrs import NodeDotAttrs
 
 
@@ -53,17 +52,19 @@ class TextGraphController(Controller):
         idNode (str): ID of the node
         dicDotAttrs (Dictionary[]): Dot attributes of the node
         '''
-        self.checkAndCleanAttrs(dicDotAttrs)
+        x, y = self.cleanAttrsAndGetPos(dicDotAttrs)
+        self.model.addNode(idNode, dicDotAttrs, x, y)
+
+    def onCreateNodes(self, nodes):
+        '''Callback function when creating nodes together.
 
-        if NodeDotAttrs.pos.value in dicDotAttrs:
-            if dicDotAttrs[NodeDotAttrs.pos.value]:
-                # Get position
-                coords = NodeDotPosUtils.getPos(
-                    dicDotAttrs[NodeDotAttrs.pos.value])
-                self.model.addNode(idNode, dicDotAttrs, coords[NodeArgs.x],
-                                   coords[NodeArgs.y])
-            else:
-                self.model.addNode(idNode, dicDotAttrs)
+        Argument(s):
+        nodes (Iterable[Tuple]): ID and dot attributes of each node
+        '''
+        self.model.addNodes(
+            (idNode, dicDotAttrs) + self.cleanAttrsAndGetPos(dicDotAttrs)
+            for idNode, dicDotAttrs in nodes
+        )
 
     def onEditNode(self, idNode, dicDotAttrs):
         '''Callback function when editing a label a node.
@@ -93,6 +94,15 @@ class TextGraphController(Controller):
         '''
         self.model.addEdge(idSourceNode, idDestNode)
 
+    def onCreateEdges(self, edges):
+        '''Callback function when creating edges together.
+
+        Argument(s):
+        edges (Iterable[Tuple[str]]): IDs of the source and destination nodes
+        of each edge
+        '''
+        self.model.addEdges(edges)
+
     def onRemoveEdge(self, idSourceNode, idDestNode):
         '''Callback function when removing an edge.
 
@@ -102,6 +112,83 @@ class TextGraphController(Controller):
         '''
         self.model.removeEdgeByIdNodes(idSourceNode, idDestNode)
 
+    def onCreateCluster(self, idCluster, idParentCluster):
+        '''Callback function when creating a cluster (subgraph).
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        idParentCluster (str): ID of the parent cluster (None if it is a
+        top-level cluster)
+        '''
+        self.model.addCluster(idCluster, idParentCluster)
+
+    def onCreateClusters(self, clusters, nodeClusters):
+        '''Callback function when creating clusters together.
+
+        Argument(s):
+        clusters (Iterable[Tuple[str]]): IDs of each cluster and of its parent
+        (parents first)
+        nodeClusters (Iterable[Tuple[str]]): IDs of each node in a cluster and
+        of its cluster
+        '''
+        with self.model.batch():
+            for idCluster, idParentCluster in clusters:
+                self.model.addCluster(idCluster, idParentCluster)
+            for idNode, idCluster in nodeClusters:
+                self.model.setNodeCluster(idNode, idCluster)
+
+    def onMoveCluster(self, idCluster, idParentCluster):
+        '''Callback function when moving a cluster into another one.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        idParentCluster (str): ID of the new parent cluster (None to move it at
+        the top-level)
+        '''
+        self.model.moveCluster(idCluster, idParentCluster)
+
+    def onRemoveCluster(self, idCluster):
+        '''Callback function when removing a cluster.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        self.model.removeCluster(idCluster)
+
+    def onSetNodeCluster(self, idNode, idCluster):
+        '''Callback function when moving a node into a cluster.
+
+        Argument(s):
+        idNode (str): ID of the node
+        idCluster (str): ID of the cluster (None to move the node out of any
+        cluster)
+        '''
+        self.model.setNodeCluster(idNode, idCluster)
+
+    def onSetDirected(self, directed):
+        '''Callback function when the type of the graph (graph or digraph) is
+        known or changed.
+
+        Argument(s):
+        directed (boolean): Graph directed or not
+        '''
+        self.model.setDirected(directed)
+
+    def cleanAttrsAndGetPos(self, dicDotAttrs):
+        '''Clean the dot attributes of a new node and return its coordinates
+        ((None, None) if it has no position).
+
+        Argument(s):
+        dicDotAttrs (Dictionary[]): Dot attributes of the node
+        '''
+        # A new node has no attribute to reset: empty ones are not added
+        self.removeUnknownAttrs(dicDotAttrs)
+
+        if dicDotAttrs.get(NodeDotAttrs.pos.value):
+            return NodeDotPosUtils.getPos(dicDotAttrs[NodeDotAttrs.pos.value])
+
+        return None, None
+
     def checkAndCleanAttrs(self, dicDotAttrs):
         '''Delete unknown attributes and set known empty attributes as None
 
@@ -113,6 +200,14 @@ class TextGraphController(Controller):
             if attr.value not in dicDotAttrs:
                 dicDotAttrs[attr.value] = None
 
+        self.removeUnknownAttrs(dicDotAttrs)
+
+    def removeUnknownAttrs(self, dicDotAttrs):
+        '''Delete unknown attributes.
+
+        Argument(s):
+        dicDotAttrs (Dictionary[]): Dot attributes of the Item
+        '''
         # Delete all attrs which are not node's attrs according to pydot
         attrToRemove = []
         for attr in dicDotAttrs:
@@ -121,10 +216,40 @@ class TextGraphController(Controller):
         for attr in attrToRemove:
             dicDotAttrs.pop(attr)
 
+    def setLiveSync(self, enabled):
+        '''Enable or disable the synchronisation of the model while the user
+        types in the view.
+
+        Argument(s):
+        enabled (boolean): Live synchronisation enabled or not
+        '''
+        self.view.setLiveSync(enabled)
+
+    def isParsing(self):
+        '''Return True if the text of the view is being parsed.'''
+        return self.view.isParsing()
+
+    def syncPendingText(self, id):
+        '''Inform the view that an item will be changed by another view, for
+        that the view sends first the text changed by the user around it.
+
+        Argument(s):
+        id (str or Tuple[str]): ID of the node or of the edge
+        '''
+        self.view.syncPendingText(id)
+
     def highlightItem(self, id):
         '''Inform the view that it must highlight an Item.
 
         Argument(s):
-        id (str): ID of the node
+        id (str or Tuple[str]): ID of the node or of the edge
         '''
         self.view.highlightItem(id)
+
+    def highlightItems(self, ids):
+        '''Inform the view that it must highlight items (and only them).
+
+        Argument(s):
+        ids (List[str or Tuple[str]]): IDs of the nodes and of the edges
+        '''
+        self.view.highlightItems(ids)
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+from doted.major_1.minor_0.enumeration.NodeDotAttrs import NodeDotAttrs
+from doted.major_1.minor_0.model.ClusterTree import ClusterTree
+from doted.major_1.minor_0.model.ComponentTracker import ComponentTracker
+from doted.major_1.minor_0.model.CopyOnWriteDict import CopyOnWriteDict
+from doted.major_1.minor_0.model.GraphSnapshot import GraphSnapshot
+from doted.major_1.minor_0.model.IdAllocator import IdAllocator
+from doted.major_1.minor_0.model.Journal import Journal
+from doted.major_1.minor_0.model.SpatialIndex import SpatialIndex
+from doted.major_1.minor_0.observer.Subject import Subject
+from doted.major_1.minor_0.observer.event.EventFactory import EventFactory
+from doted.major_1.minor_0.utils.NodeDotPosUtils import NodeDotPosUtils
+
+
+class AbstractGraph(Subject):
+    '''The AbstractGraph class defines the part of a graph (model) which does
+    not depend on how the nodes and the edges are stored: clusters, undo/redo,
+    indexes, snapshots and notification of the changes. Graph and CompactGraph
+    store the nodes and the edges.
+
+
+    Argument(s):
+    directed (boolean): Graph directed or not (default False)
+
+    Attribute(s):
+    idAllocator (IdAllocator): Allocator of the IDs of the nodes created
+    without ID
+    directed (boolean): Graph directed or not
+    journal (Journal): Changes which can be undone and redone
+    clusterTree (ClusterTree): Hierarchy of the clusters (subgraphs)
+    state (GraphSnapshot): State shared with the snapshots (None until the
+    first snapshot)
+    spatialIndex (SpatialIndex): Index of the positions of the nodes (None
+    until the first spatial query)
+    componentTracker (ComponentTracker): Connected components of the graph
+    (None until the first component query)
+    '''
+
+    def __init__(self, directed=False):
+        # Parent constructor(s)
+        Subject.__init__(self)
+
+        self.idAllocator = IdAllocator()
+        self.directed = directed
+        self.journal = Journal()
+        self.clusterTree = ClusterTree()
+        self.state = None
+        self.spatialIndex = None
+        self.componentTracker = None
+
+    def nodeExists(self, idNode):
+        '''Check if a node exists.
+
+        Argument(s):
+        idNode (str): ID of the node to check
+        '''
+        return False
+
+    def getNodeIds(self):
+        '''Return the IDs of the nodes.'''
+        return []
+
+    def getNodesPos(self):
+        '''Return the ID and the coordinates (id, x, y) of each node.'''
+        return []
+
+    def getNodesArgs(self):
+        '''Return the arguments (NodeArgs) of the nodes.'''
+        return []
+
+    def getEdgesArgs(self):
+        '''Return the arguments (EdgeArgs) of the edges.'''
+        return []
+
+    def addNode(self, id, dicDotAttrs={}, x=None, y=None):
+        '''Add a Node to the graph and notify this.
+
+        Argument(s):
+        id (str): id of the node
+        dicDotAttrs (Dictionary[]): Dot attributes of the node (default {})
+        x (float): x coordinate of the node (default None)
+        y (float): y coordinate of the node (default None)
+        '''
+        pass
+
+    def editNode(self, idNode, dicDotAttrs):
+        '''Edit attributes of a node of the graph.
+
+        Argument(s):
+        idNode (str): ID of the node to edit
+        dicDotAttrs (Dictionary[]): Dot attributes of the node
+        '''
+        pass
+
+    def restoreNode(self, argsNode):
+        '''Add a Node with the arguments it had (used to undo its removal).
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node
+        '''
+        self.addNode(argsNode.id, argsNode.dotAttrs, argsNode.x, argsNode.y)
+
+        # The pos attribute may not be the one given by the coordinates
+        pos = argsNode.dotAttrs.get(NodeDotAttrs.pos.value)
+        if pos != NodeDotPosUtils.formatPos(argsNode.x, argsNode.y):
+            self.editNode(argsNode.id, {NodeDotAttrs.pos.value: pos})
+
+    def linkNodes(self, idSourceNode, idDestNode):
+        '''Create an Edge between two existing nodes if it doesn't exist and
+        notify this.
+
+        Argument(s):
+        idSourceNode (str): ID of the source node
+        idDestNode (str): ID of the destination node
+        '''
+        pass
+
+    def getIncidentEdges(self, idNode):
+        '''Return the arguments (EdgeArgs) of the edges of a node.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        return []
+
+    def addEdge(self, idSourceNode, idDestNode):
+        '''Add an Edge to the graph and notify this.
+
+        Argument(s):
+        idSourceNode (str): ID of the source node
+        idDestNode (str): ID of the destination node
+        '''
+        # Add the two nodes
+        with self.journal.grouping():
+            self.addNode(idSourceNode)
+            self.addNode(idDestNode)
+
+            self.linkNodes(idSourceNode, idDestNode)
+
+    def clusterExists(self, idCluster):
+        '''Check if a cluster exists.
+
+        Argument(s):
+        idCluster (str): ID of the cluster to check
+        '''
+        return self.clusterTree.clusterExists(idCluster)
+
+    def getNodeCluster(self, idNode):
+        '''Return the ID of the cluster of a node (None if it is in no
+        cluster).
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        return self.clusterTree.getNodeCluster(idNode)
+
+    def addCluster(self, idCluster, idParentCluster=None):
+        '''Add an empty cluster (subgraph) to the graph.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        idParentCluster (str): ID of the parent cluster (default None)
+        '''
+        if self.clusterTree.addCluster(idCluster, idParentCluster):
+            self.journal.record(("removeCluster", idCluster),
+                                ("addCluster", idCluster, idParentCluster))
+
+    def moveCluster(self, idCluster, idParentCluster):
+        '''Move a cluster into another one (or at the top-level if the ID of
+        the parent is None).
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        idParentCluster (str): ID of the new parent cluster
+        '''
+        if self.clusterExists(idCluster):
+            idOldParentCluster = self.clusterTree.getParentCluster(idCluster)
+            changes = self.clusterTree.moveCluster(idCluster, idParentCluster)
+            if changes:
+                self.journal.record(
+                    ("moveCluster", idCluster, idOldParentCluster),
+                    ("moveCluster", idCluster, idParentCluster)
+                )
+                self.notifyNodesVisibility(*changes)
+
+    def removeCluster(self, idCluster):
+        '''Remove a cluster, its nodes and children are moved into its parent.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        if self.clusterExists(idCluster):
+            idParentCluster = self.clusterTree.getParentCluster(idCluster)
+
+            # Members are moved back before the cluster is restored
+            with self.journal.grouping():
+                self.expandCluster(idCluster)
+                for idChild in self.clusterTree.getChildClusters(idCluster):
+                    self.moveCluster(idChild, idParentCluster)
+                for idNode in self.clusterTree.getNodes(idCluster):
+                    self.setNodeCluster(idNode, idParentCluster)
+
+                self.clusterTree.removeCluster(idCluster)
+                self.journal.record(
+                    ("addCluster", idCluster, idParentCluster),
+                    ("removeCluster", idCluster)
+                )
+
+    def setNodeCluster(self, idNode, idCluster):
+        '''Move a node into a cluster (or out of any cluster if the ID of the
+        cluster is None).
+
+        Argument(s):
+        idNode (str): ID of the node
+        idCluster (str): ID of the cluster
+        '''
+        if self.nodeExists(idNode):
+            idOldCluster = self.clusterTree.getNodeCluster(idNode)
+            changes = self.clusterTree.setNodeCluster(idNode, idCluster)
+            if changes:
+                self.journal.record(("setNodeCluster", idNode, idOldCluster),
+                                    ("setNodeCluster", idNode, idCluster))
+                self.notifyNodesVisibility(*changes)
+
+    def collapseCluster(self, idCluster):
+        '''Collapse a cluster: its members are hidden.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        changes = self.clusterTree.collapse(idCluster)
+        if changes:
+            self.notifyNodesVisibility(*changes)
+
+    def expandCluster(self, idCluster):
+        '''Expand a cluster: its members are shown again (except the members of
+        its collapsed descendants).
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        changes = self.clusterTree.expand(idCluster)
+        if changes:
+            self.notifyNodesVisibility(*changes)
+
+    def expandClusters(self):
+        '''Expand all the collapsed clusters.'''
+        with self.batch():
+            for idCluster in list(self.clusterTree.clusters):
+                self.expandCluster(idCluster)
+
+    def notifyNodesVisibility(self, hiddenNodes, shownNodes):
+        '''Notify all observers that nodes are hidden or shown, with their
+        edges.
+
+        Argument(s):
+        hiddenNodes (Set[str]): IDs of the hidden nodes
+        shownNodes (Set[str]): IDs of the shown nodes
+        '''
+        if hiddenNodes:
+            self.notifyVisibility(
+                hiddenNodes,
+                self.clusterTree.getEdges(hiddenNodes,
+                                          self.getIncidentEdges, False),
+                False
+            )
+        if shownNodes:
+            self.notifyVisibility(
+                shownNodes,
+                self.clusterTree.getEdges(shownNodes,
+                                          self.getIncidentEdges, True),
+                True
+            )
+
+    def getSpatialIndex(self):
+        '''Return the index of the positions of the nodes, built on the first
+        call then updated with the changes of the nodes.'''
+        if not self.spatialIndex:
+            self.spatialIndex = SpatialIndex()
+            for idNode, x, y in self.getNodesPos():
+                self.spatialIndex.move(idNode, x, y)
+
+        return self.spatialIndex
+
+    def getNodesIn(self, left, top, right, bottom):
+        '''Return the IDs of the nodes in a rectangle (borders included).
+
+        Argument(s):
+        left (float): Left border of the rectangle
+        top (float): Top border of the rectangle
+        right (float): Right border of the rectangle
+        bottom (float): Bottom border of the rectangle
+        '''
+        return self.getSpatialIndex().findIn(left, top, right, bottom)
+
+    def getNearestNode(self, x, y):
+        '''Return the ID of the nearest node of a position (None if the graph
+        is empty).
+
+        Argument(s):
+        x (float): x coordinate
+        y (float): y coordinate
+        '''
+        return self.getSpatialIndex().findNearest(x, y)
+
+    def getExtremeNodes(self):
+        '''Return the IDs of the leftmost, topmost, rightmost and bottommost
+        nodes (None if the graph is empty).'''
+        return self.getSpatialIndex().findExtremes()
+
+    def getComponentTracker(self):
+        '''Return the connected components of the graph, built on the first
+        call then updated with the changes of the graph.'''
+        if not self.componentTracker:
+            self.componentTracker = ComponentTracker(self.getIncidentEdges)
+            for idNode in self.getNodeIds():
+                self.componentTracker.addNode(idNode)
+            for argsEdge in self.getEdgesArgs():
+                self.componentTracker.union(argsEdge.sourceId, argsEdge.destId)
+
+        return self.componentTracker
+
+    def areConnected(self, idNode1, idNode2):
+        '''Check if two nodes are in the same connected component (edges are
+        followed in both directions).
+
+        Argument(s):
+        idNode1 (str): ID of a node
+        idNode2 (str): ID of another node
+        '''
+        return (self.nodeExists(idNode1) and self.nodeExists(idNode2) and
+                self.getComponentTracker().areConnected(idNode1, idNode2))
+
+    def getComponent(self, idNode):
+        '''Return the IDs of the nodes of the connected component of a node
+        (empty if the node does not exist).
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        if not self.nodeExists(idNode):
+            return []
+
+        return list(self.getComponentTracker().getComponent(idNode))
+
+    def getNbComponents(self):
+        '''Return the number of connected components.'''
+        return self.getComponentTracker().getNbComponents()
+
+    def snapshot(self):
+        '''Return a read-only snapshot (GraphSnapshot) of the graph. It shares
+        the records of the graph, which are only copied when they change, so
+        it is made in O(1) (except the first one, which builds the records).'''
+        if not self.state:
+            nodes = CopyOnWriteDict()
+            for argsNode in self.getNodesArgs():
+                nodes.set(argsNode.id, argsNode)
+            edges = CopyOnWriteDict()
+            for argsEdge in self.getEdgesArgs():
+                edges.set(argsEdge.id, argsEdge)
+            self.state = GraphSnapshot(nodes, edges, self.directed)
+
+        self.state.directed = self.directed
+
+        return self.state.copy()
+
+    def beginBatch(self):
+        '''Begin a batch: changes are buffered until the end of the batch and
+        undone together.'''
+        self.journal.beginGroup()
+        Subject.beginBatch(self)
+
+    def endBatch(self):
+        '''End a batch and notify observers of the buffered changes.'''
+        Subject.endBatch(self)
+        self.journal.endGroup()
+
+    def closeUndoGroup(self):
+        '''Close the last group of changes: the next moves of the same nodes
+        are undone separately.'''
+        self.journal.closeGroup()
+
+    def undo(self):
+        '''Undo the last changes (nothing is undone during a batch).'''
+        self.journal.undo(self)
+
+    def redo(self):
+        '''Redo the last undone changes (nothing is redone during a
+        batch).'''
+        self.journal.redo(self)
+
+    def updateIndexes(self, argsNode, argsEdge, updateModeView):
+        '''Update the state shared with the snapshots and the indexes built
+        on the graph with a change of a node or of an edge.
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node
+        argsEdge (EdgeArgs): Arguments of the edge
+        updateModeView (UpdateModeView): Update mode
+        '''
+        if self.state:
+            self.state.update(argsNode, argsEdge, updateModeView)
+        if self.spatialIndex and argsNode:
+            self.spatialIndex.update(argsNode, updateModeView)
+        if self.componentTracker:
+            self.componentTracker.update(argsNode, argsEdge, updateModeView)
+
+    def notify(self, argsNode, argsEdge, updateModeView, changedAttrs=None):
+        '''Notify all observers of the creation of a Node or an Edge.
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node
+        argsEdge (EdgeArgs): Arguments of the edge
+        updateModeView (UpdateModeView): Update mode
+        changedAttrs (FrozenSet[str]): Dot attributes changed by an edit
+        (default None: unknown)
+        '''
+        # The time spent by the model is recorded like an observer's one
+        if self.profiler:
+            self.profiler.measure(
+                self,
+                EventFactory.getType(argsNode, updateModeView,
+                                     changedAttrs).__name__,
+                self.updateIndexes, argsNode, argsEdge, updateModeView
+            )
+        else:
+            self.updateIndexes(argsNode, argsEdge, updateModeView)
+
+        # Changes are notified at the end of the batch or by the dispatcher
+        changeSet = self.getChangeSet()
+        if changeSet:
+            changeSet.addChange(argsNode, argsEdge, updateModeView,
+                                changedAttrs)
+        else:
+            self.notifyEvent(EventFactory.create(argsNode, argsEdge,
+                                                 updateModeView, changedAttrs))
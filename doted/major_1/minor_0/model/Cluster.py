@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+class Cluster(object):
+    '''The Cluster class defines a cluster (subgraph) of a graph (model).
+
+
+    Argument(s):
+    id (str): ID
+    parent (Cluster): Parent cluster (default None for a top-level cluster)
+
+    Attribute(s):
+    id (str): ID
+    parent (Cluster): Parent cluster (None for a top-level cluster)
+    children (Dictionary[Cluster]): Child clusters indexed by their ID
+    idNodes (Set[str]): IDs of the nodes directly in the cluster
+    collapsed (boolean): Members of the cluster hidden or not
+    '''
+
+    __slots__ = ("id", "parent", "children", "idNodes", "collapsed")
+
+    def __init__(self, id, parent=None):
+        self.id = id
+        self.parent = parent
+        self.children = {}
+        self.idNodes = set()
+        self.collapsed = False
+
+    def isHidden(self):
+        '''Return True if an ancestor of the cluster is collapsed.'''
+        parent = self.parent
+        while parent:
+            if parent.collapsed:
+                return True
+            parent = parent.parent
+
+        return False
+
+    def isAncestorOf(self, cluster):
+        '''Return True if the cluster is an ancestor of another one (or the
+        same cluster).
+
+        Argument(s):
+        cluster (Cluster): Other cluster
+        '''
+        while cluster:
+            if cluster is self:
+                return True
+            cluster = cluster.parent
+
+        return False
+
+    def getVisibleNodes(self):
+        '''Return the IDs of the visible nodes of the cluster and of its
+        descendants, skipping the collapsed ones.'''
+        idNodes = set()
+        if self.collapsed or self.isHidden():
+            return idNodes
+
+        clusters = [self]
+        while clusters:
+            cluster = clusters.pop()
+            idNodes.update(cluster.idNodes)
+            clusters.extend(child for child in cluster.children.values()
+                            if not child.collapsed)
+
+        return idNodes
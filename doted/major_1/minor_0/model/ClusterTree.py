@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+from doted.major_1.minor_0.model.Cluster import Cluster
+
+
+class ClusterTree(object):
+    '''The ClusterTree class defines the hierarchy of the clusters (subgraphs)
+    of a graph and indexes the members of each cluster.
+
+    The methods changing the hierarchy return the IDs of the nodes hidden and
+    shown by the change (as a Tuple[Set[str]]), or None if nothing changed.
+
+
+    Attribute(s):
+    clusters (Dictionary[Cluster]): All clusters indexed by their ID
+    nodeClusters (Dictionary[Cluster]): Cluster of each node in a cluster,
+                                        indexed by the ID of the node
+    nbCollapsed (int): Number of collapsed clusters
+    '''
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        '''Forget all clusters.'''
+        self.clusters = {}
+        self.nodeClusters = {}
+        self.nbCollapsed = 0
+
+    def clusterExists(self, idCluster):
+        '''Check if a cluster exists.
+
+        Argument(s):
+        idCluster (str): ID of the cluster to check
+        '''
+        return idCluster in self.clusters
+
+    def getParentCluster(self, idCluster):
+        '''Return the ID of the parent of a cluster (None if it is a top-level
+        cluster).
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        parent = self.clusters[idCluster].parent
+
+        return parent.id if parent else None
+
+    def getChildClusters(self, idCluster):
+        '''Return the IDs of the children of a cluster.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        return list(self.clusters[idCluster].children)
+
+    def getNodes(self, idCluster):
+        '''Return the IDs of the nodes directly in a cluster.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        return list(self.clusters[idCluster].idNodes)
+
+    def getNodeCluster(self, idNode):
+        '''Return the ID of the cluster of a node (None if it is in no
+        cluster).
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        cluster = self.nodeClusters.get(idNode)
+
+        return cluster.id if cluster else None
+
+    def isNodeHidden(self, idNode):
+        '''Return True if a node is in a collapsed cluster.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        if not self.nbCollapsed:
+            return False
+
+        cluster = self.nodeClusters.get(idNode)
+
+        return bool(cluster) and (cluster.collapsed or cluster.isHidden())
+
+    def addCluster(self, idCluster, idParentCluster=None):
+        '''Add an empty cluster, return True if it has been added.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        idParentCluster (str): ID of the parent cluster (default None)
+        '''
+        if idCluster in self.clusters or (idParentCluster is not None and
+                                          idParentCluster not in
+                                          self.clusters):
+            return False
+
+        parent = self.clusters.get(idParentCluster)
+        cluster = Cluster(idCluster, parent)
+        if parent:
+            parent.children[idCluster] = cluster
+        self.clusters[idCluster] = cluster
+
+        return True
+
+    def moveCluster(self, idCluster, idParentCluster):
+        '''Move a cluster into another one (or at the top-level if the ID of
+        the parent is None).
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        idParentCluster (str): ID of the new parent cluster
+        '''
+        cluster = self.clusters.get(idCluster)
+        if not cluster or (idParentCluster is not None and
+                           idParentCluster not in self.clusters):
+            return None
+
+        # A cluster cannot be moved into itself or into its descendants
+        parent = self.clusters.get(idParentCluster)
+        if parent is cluster.parent or cluster.isAncestorOf(parent):
+            return None
+
+        visibleNodes = cluster.getVisibleNodes()
+        if cluster.parent:
+            del cluster.parent.children[idCluster]
+        cluster.parent = parent
+        if parent:
+            parent.children[idCluster] = cluster
+
+        return ClusterTree.compare(visibleNodes, cluster.getVisibleNodes())
+
+    def removeCluster(self, idCluster):
+        '''Remove a cluster, its nodes and children are moved into its parent.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        if idCluster not in self.clusters:
+            return None
+
+        # Once expanded, the cluster does not hide any member
+        changes = self.expand(idCluster) or (set(), set())
+
+        cluster = self.clusters.pop(idCluster)
+        parent = cluster.parent
+        if parent:
+            del parent.children[idCluster]
+        for child in cluster.children.values():
+            child.parent = parent
+            if parent:
+                parent.children[child.id] = child
+        for idNode in cluster.idNodes:
+            if parent:
+                parent.idNodes.add(idNode)
+                self.nodeClusters[idNode] = parent
+            else:
+                del self.nodeClusters[idNode]
+
+        return changes
+
+    def setNodeCluster(self, idNode, idCluster):
+        '''Move a node into a cluster (or out of any cluster if the ID of the
+        cluster is None).
+
+        Argument(s):
+        idNode (str): ID of the node
+        idCluster (str): ID of the cluster
+        '''
+        cluster = self.clusters.get(idCluster)
+        if ((idCluster is not None and not cluster) or
+                cluster is self.nodeClusters.get(idNode)):
+            return None
+
+        hidden = self.isNodeHidden(idNode)
+        self.removeNode(idNode)
+        if cluster:
+            cluster.idNodes.add(idNode)
+            self.nodeClusters[idNode] = cluster
+
+        if hidden == self.isNodeHidden(idNode):
+            return set(), set()
+        elif hidden:
+            return set(), {idNode}
+
+        return {idNode}, set()
+
+    def removeNode(self, idNode):
+        '''Remove a node from its cluster.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        cluster = self.nodeClusters.pop(idNode, None)
+        if cluster:
+            cluster.idNodes.discard(idNode)
+
+    def collapse(self, idCluster):
+        '''Collapse a cluster: its members are hidden.
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        cluster = self.clusters.get(idCluster)
+        if not cluster or cluster.collapsed:
+            return None
+
+        visibleNodes = cluster.getVisibleNodes()
+        cluster.collapsed = True
+        self.nbCollapsed += 1
+
+        return visibleNodes, set()
+
+    def expand(self, idCluster):
+        '''Expand a cluster: its members are shown again (except the members of
+        its collapsed descendants).
+
+        Argument(s):
+        idCluster (str): ID of the cluster
+        '''
+        cluster = self.clusters.get(idCluster)
+        if not cluster or not cluster.collapsed:
+            return None
+
+        cluster.collapsed = False
+        self.nbCollapsed -= 1
+
+        return set(), cluster.getVisibleNodes()
+
+    def getEdges(self, idNodes, incidentEdges, visible):
+        '''Return the IDs of the edges hidden or shown with nodes: all their
+        edges when they are hidden, the edges between two visible nodes when
+        they are shown.
+
+        Argument(s):
+        idNodes (Set[str]): IDs of the nodes hidden or shown
+        incidentEdges (Function): Return the arguments (EdgeArgs) of the edges
+                                  of a node
+        visible (boolean): Nodes shown or hidden
+        '''
+        idEdges = set()
+        for idNode in idNodes:
+            for argsEdge in incidentEdges(idNode):
+                if (not visible or
+                        (not self.isNodeHidden(argsEdge.sourceId) and
+                         not self.isNodeHidden(argsEdge.destId))):
+                    idEdges.add(argsEdge.id)
+
+        return idEdges
+
+    @staticmethod
+    def compare(visibleNodes, newVisibleNodes):
+        '''Return the nodes hidden and the nodes shown by a change.
+
+        Argument(s):
+        visibleNodes (Set[str]): Visible nodes before the change
+        newVisibleNodes (Set[str]): Visible nodes after the change
+        '''
+        return (visibleNodes - newVisibleNodes,
+                newVisibleNodes - visibleNodes)
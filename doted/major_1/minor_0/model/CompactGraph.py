@@ -0,0 +1,551 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+
+from doted.major_1.minor_0.model.AbstractGraph import AbstractGraph
+from doted.major_1.minor_0.model.DotAttrsStore import DotAttrsStore
+from doted.major_1.minor_0.model.EdgeArgs import EdgeArgs
+from doted.major_1.minor_0.model.NodeArgs import NodeArgs
+from doted.major_1.minor_0.enumeration.NodeDotAttrs import NodeDotAttrs
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+from doted.major_1.minor_0.utils.EdgeUtils import EdgeUtils
+from doted.major_1.minor_0.utils.NodeDotPosUtils import NodeDotPosUtils
+
+
+class CompactGraph(AbstractGraph):
+    '''The CompactGraph class defines a graph (model) stored in arrays, for
+    documents with millions of nodes. It has the same API and notifies the
+    same arguments as Graph, but does not build a Node/Edge object per item.
+
+    Node IDs are interned to indices of slots: coordinates are kept in NumPy
+    arrays and the other dot attributes are kept in one sparse column per
+    attribute, with values shared between nodes. Edges are kept as COO
+    arrays of node indices; incident edges of a node are found with a CSR
+    index built on demand, completed by the edges added since it was built.
+
+
+    Argument(s):
+    directed (boolean): Graph directed or not (default False)
+
+    Attribute(s):
+    nodeIndices (Dictionary[int]): Slot of each node, indexed by node ID
+    nodeIds (List[str]): ID of the node of each slot (None if slot is free)
+    freeNodeSlots (List[int]): Free slots of nodes
+    xs (numpy.ndarray): x coordinate of each node slot
+    ys (numpy.ndarray): y coordinate of each node slot
+    attrStore (DotAttrsStore): Dot attributes of the nodes indexed by their
+                               slot (pos is only kept if it differs from the
+                               coordinates)
+    edgeIndices (Dictionary[int]): Slot of each edge, indexed by the pair of
+                                   node slots packed in an integer (see
+                                   edgeKey())
+    sources (numpy.ndarray): Source node slot of each edge slot
+    dests (numpy.ndarray): Destination node slot of each edge slot
+    alive (numpy.ndarray): Whether each edge slot is used or not
+    nbEdgeSlots (int): Number of edge slots used (alive or not)
+    csrOffsets (numpy.ndarray): Start of the incident edges of each node slot
+                                in csrEdges (None if not built)
+    csrEdges (numpy.ndarray): Incident edge slots grouped by node slot
+    pendingEdges (List[int]): Edge slots added since the CSR index was built
+    initialCapacity (int): Initial size of the arrays
+    maxPendingEdges (int): Number of edges added before rebuilding the CSR
+                           index
+    '''
+
+    initialCapacity = 1024
+    maxPendingEdges = 4096
+
+    def __init__(self, directed=False):
+        # Parent constructor(s)
+        AbstractGraph.__init__(self, directed)
+
+        self.initArrays()
+
+    def initArrays(self):
+        '''Create empty arrays.'''
+        self.nodeIndices = {}
+        self.nodeIds = []
+        self.freeNodeSlots = []
+        self.xs = numpy.zeros(CompactGraph.initialCapacity, numpy.float64)
+        self.ys = numpy.zeros(CompactGraph.initialCapacity, numpy.float64)
+        self.attrStore = DotAttrsStore()
+
+        self.edgeIndices = {}
+        self.sources = numpy.zeros(CompactGraph.initialCapacity, numpy.int32)
+        self.dests = numpy.zeros(CompactGraph.initialCapacity, numpy.int32)
+        self.alive = numpy.zeros(CompactGraph.initialCapacity, numpy.bool_)
+        self.nbEdgeSlots = 0
+
+        self.csrOffsets = None
+        self.csrEdges = None
+        self.pendingEdges = []
+
+    def clear(self):
+        '''Clear the graph.'''
+        # Remove all nodes (will also remove all edges)
+        with self.batch():
+            for idNode in list(self.nodeIndices.keys()):
+                self.removeNode(idNode)
+            for idCluster in list(self.clusterTree.clusters):
+                self.removeCluster(idCluster)
+
+        # Release the memory
+        self.initArrays()
+
+    def setDirected(self, directed):
+        '''Set the graph directed or not. Existing edges are rebuilt with the
+        IDs of the new kind of graph.
+
+        Argument(s):
+        directed (boolean): Graph directed or not
+        '''
+        if directed != self.directed:
+            pairs = [(self.nodeIds[self.sources[e]],
+                      self.nodeIds[self.dests[e]])
+                     for e in numpy.flatnonzero(self.alive)]
+            with self.batch():
+                for idSourceNode, idDestNode in pairs:
+                    self.removeEdgeByIdNodes(idSourceNode, idDestNode)
+
+                self.directed = directed
+                self.journal.record(("setDirected", not directed),
+                                    ("setDirected", directed))
+                for idSourceNode, idDestNode in pairs:
+                    self.addEdge(idSourceNode, idDestNode)
+
+    def nodeExists(self, idNode):
+        '''Check if a node exists.
+
+        Argument(s):
+        idNode (str): ID of the node to check
+        '''
+        return idNode in self.nodeIndices
+
+    def edgeExists(self, idSourceNode, idDestNode):
+        '''Check if an edge exist.
+
+        Argument(s):
+        idSourceNode (str): ID of the source node
+        idDestNode (str): ID of the destination node
+        '''
+        return self.findEdge(idSourceNode, idDestNode) is not None
+
+    def findEdge(self, idSourceNode, idDestNode):
+        '''Return the slot of an edge, None if it does not exist.
+
+        Argument(s):
+        idSourceNode (str): ID of the source node
+        idDestNode (str): ID of the destination node
+        '''
+        if (idSourceNode not in self.nodeIndices or
+                idDestNode not in self.nodeIndices):
+            return None
+
+        return self.edgeIndices.get(self.edgeKey(
+            self.nodeIndices[idSourceNode], self.nodeIndices[idDestNode]))
+
+    def edgeKey(self, sourceSlot, destSlot):
+        '''Pack two node slots in one integer, in the same order for both
+        directions of an undirected edge.
+
+        Argument(s):
+        sourceSlot (int): Slot of the source node
+        destSlot (int): Slot of the destination node
+        '''
+        sourceSlot = int(sourceSlot)
+        destSlot = int(destSlot)
+        if not self.directed and sourceSlot > destSlot:
+            sourceSlot, destSlot = destSlot, sourceSlot
+
+        return (sourceSlot << 32) | destSlot
+
+    @staticmethod
+    def grow(array, size):
+        '''Return the array, or a copy twice larger if it can not hold size
+        items.
+
+        Argument(s):
+        array (numpy.ndarray): Array
+        size (int): Number of items to hold
+        '''
+        if size <= len(array):
+            return array
+
+        grownArray = numpy.zeros(max(size, 2 * len(array)), array.dtype)
+        grownArray[:len(array)] = array
+
+        return grownArray
+
+    def getNodeArgs(self, slot):
+        '''Return the arguments (NodeArgs) of a node.
+
+        Argument(s):
+        slot (int): Slot of the node
+        '''
+        x = float(self.xs[slot])
+        y = float(self.ys[slot])
+
+        dotAttrs = self.attrStore.getAttrs(slot)
+        # pos is only kept if it differs from the coordinates
+        if NodeDotAttrs.pos.value not in dotAttrs:
+            dotAttrs[NodeDotAttrs.pos.value] = NodeDotPosUtils.formatPos(x, y)
+
+        return NodeArgs(self.nodeIds[slot], dotAttrs, x, y)
+
+    def getEdgeArgs(self, slot):
+        '''Return the arguments (EdgeArgs) of an edge.
+
+        Argument(s):
+        slot (int): Slot of the edge
+        '''
+        idSourceNode = self.nodeIds[self.sources[slot]]
+        idDestNode = self.nodeIds[self.dests[slot]]
+
+        return EdgeArgs(EdgeUtils.createEdgeId(idSourceNode, idDestNode,
+                                               self.directed),
+                        idSourceNode, idDestNode)
+
+    def addNode(self, id, dicDotAttrs={}, x=None, y=None):
+        '''Add a Node to the graph and notify this.
+
+        Argument(s):
+        id (str): id of the node
+        dicDotAttrs (Dictionary[]): Dot attributes of the node (default {})
+        x (float): x coordinate of the node (default None)
+        y (float): y coordinate of the node (default None)
+        '''
+        # Generate an ID if it is not defined
+        if not id:
+            id = self.idAllocator.getFreeId()
+
+        # Only create the node if it doesn't exist
+        if not self.nodeExists(id):
+            if self.freeNodeSlots:
+                slot = self.freeNodeSlots.pop()
+                self.nodeIds[slot] = id
+            else:
+                slot = len(self.nodeIds)
+                self.nodeIds.append(id)
+                self.xs = CompactGraph.grow(self.xs, slot + 1)
+                self.ys = CompactGraph.grow(self.ys, slot + 1)
+            self.nodeIndices[id] = slot
+            self.idAllocator.addId(id)
+
+            # As in Node, the pos attribute is given by the coordinates
+            dictAttrs = dicDotAttrs.copy()
+            dictAttrs[NodeDotAttrs.pos.value] = NodeDotPosUtils.formatPos(
+                x if x else 0, y if y else 0)
+            self.editSlot(slot, dictAttrs)
+
+            argsNode = self.getNodeArgs(slot)
+            self.journal.record(("removeNode", id), ("restoreNode", argsNode))
+            self.notify(argsNode, None, UpdateModeView.add)
+
+    def addNodes(self, nodes):
+        '''Add Nodes to the graph and notify this once.
+
+        Argument(s):
+        nodes (Iterable[Tuple]): (id, dicDotAttrs, x, y) of each node
+        '''
+        nodes = list(nodes)
+
+        with self.batch():
+            # Grow the coordinates once
+            size = len(self.nodeIds) + len(nodes)
+            self.xs = CompactGraph.grow(self.xs, size)
+            self.ys = CompactGraph.grow(self.ys, size)
+
+            for id, dicDotAttrs, x, y in nodes:
+                self.addNode(id, dicDotAttrs, x, y)
+
+    def editSlot(self, slot, dicDotAttrs):
+        '''Edit dot attributes of a node (same rules as Node.edit()).
+
+        Argument(s):
+        slot (int): Slot of the node
+        dicDotAttrs (Dictionary[]): Dot attributes of the node
+        '''
+        for attr, val in dicDotAttrs.items():
+            # Case of pos attribute: we need to update x and y
+            if attr == NodeDotAttrs.pos.value:
+                pos = NodeDotPosUtils.getPos(val) if val else None
+                if pos:
+                    self.xs[slot], self.ys[slot] = pos
+                else:
+                    self.xs[slot] = 0.0
+                    self.ys[slot] = 0.0
+
+                # Only keep pos if it can not be deduced from coordinates
+                if val == NodeDotPosUtils.formatPos(self.xs[slot],
+                                                    self.ys[slot]):
+                    val = None
+
+            self.attrStore.set(slot, attr, val)
+
+    def editNode(self, idNode, dicDotAttrs):
+        '''Edit attributes of a node of the graph.
+
+        Argument(s):
+        idNode (str): ID of the node to edit
+        dicDotAttrs (Dictionary[]): Dot attributes of the node
+        '''
+        if self.nodeExists(idNode):
+            slot = self.nodeIndices[idNode]
+
+            # Only keep the previous values of the edited attributes
+            dotAttrs = self.getNodeArgs(slot).dotAttrs
+            oldDotAttrs = {attr: dotAttrs.get(attr) for attr in dicDotAttrs}
+            self.journal.record(("editNode", idNode, oldDotAttrs),
+                                ("editNode", idNode, dict(dicDotAttrs)))
+
+            self.editSlot(slot, dicDotAttrs)
+            self.notify(self.getNodeArgs(slot), None, UpdateModeView.edit,
+                        frozenset(attr for attr in dicDotAttrs
+                                  if dicDotAttrs[attr] != oldDotAttrs[attr]))
+
+    def findNodes(self, attr, value):
+        '''Return the IDs of the nodes whose dot attribute has a value.
+
+        Argument(s):
+        attr (str): Name of the dot attribute
+        value (str): Value of the dot attribute
+        '''
+        # pos is not kept if it can be deduced from the coordinates
+        if attr == NodeDotAttrs.pos.value:
+            return [argsNode.id for argsNode in map(self.getNodeArgs,
+                                                     self.nodeIndices.values())
+                    if argsNode.dotAttrs[attr] == value]
+
+        return [self.nodeIds[slot]
+                for slot in self.attrStore.find(attr, value)]
+
+    def removeNode(self, idNode):
+        '''Remove a Node from the graph.
+
+        Argument(s):
+        idNode (str): ID of the node to remove
+        '''
+        if self.nodeExists(idNode):
+            slot = self.nodeIndices[idNode]
+            argsNode = self.getNodeArgs(slot)
+            self.notify(argsNode, None, UpdateModeView.remove)
+
+            # Removes associated edges, the node is restored before them
+            with self.journal.grouping():
+                idCluster = self.clusterTree.getNodeCluster(idNode)
+                if idCluster:
+                    self.clusterTree.removeNode(idNode)
+                    self.journal.record(
+                        ("setNodeCluster", idNode, idCluster),
+                        ("setNodeCluster", idNode, None)
+                    )
+                for edgeSlot in self.incidentEdges(slot):
+                    self.removeEdgeSlot(edgeSlot)
+                self.journal.record(("restoreNode", argsNode),
+                                    ("removeNode", idNode))
+
+            del self.nodeIndices[idNode]
+            self.idAllocator.removeId(idNode)
+            self.nodeIds[slot] = None
+            self.attrStore.remove(slot)
+            self.freeNodeSlots.append(slot)
+
+            if not self.nodeIndices:
+                self.idAllocator.reset()
+
+    def incidentEdges(self, slot):
+        '''Return the slots of the edges of a node.
+
+        Argument(s):
+        slot (int): Slot of the node
+        '''
+        if (self.csrOffsets is None or
+                len(self.pendingEdges) > CompactGraph.maxPendingEdges):
+            self.buildIncidenceIndex()
+
+        edgeSlots = set()
+        if slot + 1 < len(self.csrOffsets):
+            edgeSlots.update(self.csrEdges[self.csrOffsets[slot]:
+                                           self.csrOffsets[slot + 1]].tolist())
+        edgeSlots.update(self.pendingEdges)
+
+        # Removed edges are not removed from the index
+        return [e for e in sorted(edgeSlots) if self.alive[e] and
+                (self.sources[e] == slot or self.dests[e] == slot)]
+
+    def getIncidentEdges(self, idNode):
+        '''Return the arguments (EdgeArgs) of the edges of a node.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        return [self.getEdgeArgs(edgeSlot)
+                for edgeSlot in self.incidentEdges(self.nodeIndices[idNode])]
+
+    def buildIncidenceIndex(self):
+        '''Build the CSR index of the incident edges of each node.'''
+        edgeSlots = numpy.flatnonzero(self.alive[:self.nbEdgeSlots])
+
+        # Pack the edges if most of the slots are free
+        if len(edgeSlots) < self.nbEdgeSlots // 2:
+            self.compactEdges(edgeSlots)
+            edgeSlots = numpy.arange(self.nbEdgeSlots)
+
+        # Each edge is incident to its source and to its destination
+        endpoints = numpy.concatenate((self.sources[edgeSlots],
+                                       self.dests[edgeSlots]))
+        incident = numpy.concatenate((edgeSlots, edgeSlots))
+        order = numpy.argsort(endpoints, kind="stable")
+
+        counts = numpy.bincount(endpoints, minlength=len(self.nodeIds))
+        self.csrOffsets = numpy.zeros(len(counts) + 1, numpy.int64)
+        numpy.cumsum(counts, out=self.csrOffsets[1:])
+        self.csrEdges = incident[order].astype(numpy.int32)
+        self.pendingEdges = []
+
+    def compactEdges(self, edgeSlots):
+        '''Move the edges at the start of the arrays.
+
+        Argument(s):
+        edgeSlots (numpy.ndarray): Slots of the edges (in increasing order)
+        '''
+        nbEdges = len(edgeSlots)
+        self.sources[:nbEdges] = self.sources[edgeSlots]
+        self.dests[:nbEdges] = self.dests[edgeSlots]
+        self.alive[:nbEdges] = True
+        self.alive[nbEdges:] = False
+        self.nbEdgeSlots = nbEdges
+
+        sources = self.sources[:nbEdges].astype(numpy.int64)
+        dests = self.dests[:nbEdges].astype(numpy.int64)
+        if not self.directed:
+            sources, dests = (numpy.minimum(sources, dests),
+                              numpy.maximum(sources, dests))
+        keys = (sources << 32) | dests
+        self.edgeIndices = dict(zip(keys.tolist(), range(nbEdges)))
+
+    def addEdges(self, edges):
+        '''Add Edges to the graph and notify this once.
+
+        Argument(s):
+        edges (Iterable[Tuple[str]]): IDs of the source and destination nodes
+        of each edge
+        '''
+        edges = list(edges)
+
+        with self.batch():
+            # Add each missing node once
+            idNodes = dict.fromkeys(idNode for edge in edges
+                                    for idNode in edge)
+            self.addNodes((idNode, {}, None, None) for idNode in idNodes
+                          if idNode not in self.nodeIndices)
+
+            # Grow the edge arrays once
+            size = self.nbEdgeSlots + len(edges)
+            self.sources = CompactGraph.grow(self.sources, size)
+            self.dests = CompactGraph.grow(self.dests, size)
+            self.alive = CompactGraph.grow(self.alive, size)
+
+            for idSourceNode, idDestNode in edges:
+                self.linkNodes(idSourceNode, idDestNode)
+
+    def linkNodes(self, idSourceNode, idDestNode):
+        '''Create an Edge between two existing nodes if it doesn't exist and
+        notify this.
+
+        Argument(s):
+        idSourceNode (str): ID of the source node
+        idDestNode (str): ID of the destination node
+        '''
+        if not self.edgeExists(idSourceNode, idDestNode):
+            sourceSlot = self.nodeIndices[idSourceNode]
+            destSlot = self.nodeIndices[idDestNode]
+
+            slot = self.nbEdgeSlots
+            self.nbEdgeSlots += 1
+            self.sources = CompactGraph.grow(self.sources, slot + 1)
+            self.dests = CompactGraph.grow(self.dests, slot + 1)
+            self.alive = CompactGraph.grow(self.alive, slot + 1)
+            self.sources[slot] = sourceSlot
+            self.dests[slot] = destSlot
+            self.alive[slot] = True
+            self.edgeIndices[self.edgeKey(sourceSlot, destSlot)] = slot
+            self.pendingEdges.append(slot)
+
+            argsEdge = self.getEdgeArgs(slot)
+            self.journal.record(("removeEdge", argsEdge.id),
+                                ("addEdge", idSourceNode, idDestNode))
+            self.notify(None, argsEdge, UpdateModeView.add)
+
+            # Hide it if a node is in a collapsed cluster
+            if (self.clusterTree.isNodeHidden(idSourceNode) or
+                    self.clusterTree.isNodeHidden(idDestNode)):
+                self.notifyVisibility([], [argsEdge.id], False)
+
+    def removeEdge(self, idEdge):
+        '''Remove an Edge from the graph.
+
+        Argument(s):
+        idEdge (Tuple[str]): ID of the edge to remove
+        '''
+        self.removeEdgeByIdNodes(idEdge[0], idEdge[1])
+
+    def removeEdgeByIdNodes(self, idSourceNode, idDestNode):
+        '''Remove an Edge from the graph with the two nodes ID.
+
+        Argument(s):
+        idSourceNode (str): ID of the source node
+        idDestNode (str): ID of the destination node
+        '''
+        slot = self.findEdge(idSourceNode, idDestNode)
+        if slot is not None:
+            self.removeEdgeSlot(slot)
+
+    def removeEdgeSlot(self, slot):
+        '''Remove an Edge from the graph with its slot.
+
+        Argument(s):
+        slot (int): Slot of the edge to remove
+        '''
+        del self.edgeIndices[self.edgeKey(self.sources[slot],
+                                          self.dests[slot])]
+        self.alive[slot] = False
+
+        argsEdge = self.getEdgeArgs(slot)
+        self.journal.record(("addEdge", argsEdge.sourceId, argsEdge.destId),
+                            ("removeEdge", argsEdge.id))
+        self.notify(None, argsEdge, UpdateModeView.remove)
+
+    def getNodeIds(self):
+        '''Return the IDs of the nodes.'''
+        return self.nodeIndices.keys()
+
+    def getNodesPos(self):
+        '''Return the ID and the coordinates (id, x, y) of each node.'''
+        slots = list(self.nodeIndices.values())
+        return zip(self.nodeIndices.keys(), self.xs[slots].tolist(),
+                   self.ys[slots].tolist())
+
+    def getNodesArgs(self):
+        '''Return the arguments (NodeArgs) of the nodes.'''
+        return map(self.getNodeArgs, self.nodeIndices.values())
+
+    def getEdgesArgs(self):
+        '''Return the arguments (EdgeArgs) of the edges.'''
+        return map(self.getEdgeArgs, self.edgeIndices.values())
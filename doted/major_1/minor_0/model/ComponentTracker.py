@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+
+
+class ComponentTracker(object):
+    '''The ComponentTracker class defines the connected components of a graph
+    kept in a union-find forest. Added edges merge two components in
+    O(alpha(n)). Removed edges and nodes only mark their component as dirty:
+    it is recomputed from the graph by the next query which needs it.
+
+
+    Argument(s):
+    incidentEdges (Function): Return the arguments (EdgeArgs) of the edges of
+                              a node
+
+    Attribute(s):
+    incidentEdges (Function): Return the arguments (EdgeArgs) of the edges of
+                              a node
+    parents (Dictionary[str]): Parent of each node in the forest, a root is
+                               its own parent
+    members (Dictionary[Set[str]]): Nodes of each component indexed by its
+                                    root
+    dirtyRoots (Set[str]): Roots of the components to recompute
+    removedNodes (Set[str]): Removed nodes still in a dirty component
+    '''
+
+    def __init__(self, incidentEdges):
+        self.incidentEdges = incidentEdges
+        self.parents = {}
+        self.members = {}
+        self.dirtyRoots = set()
+        self.removedNodes = set()
+
+    def update(self, argsNode, argsEdge, updateModeView):
+        '''Apply a change of a node or of an edge.
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node
+        argsEdge (EdgeArgs): Arguments of the edge
+        updateModeView (UpdateModeView): Update mode
+        '''
+        if argsNode:
+            if updateModeView == UpdateModeView.add:
+                self.addNode(argsNode.id)
+            elif updateModeView == UpdateModeView.remove:
+                self.removeNode(argsNode.id)
+        elif updateModeView == UpdateModeView.add:
+            self.union(argsEdge.sourceId, argsEdge.destId)
+        elif updateModeView == UpdateModeView.remove:
+            self.dirtyRoots.add(self.find(argsEdge.sourceId))
+
+    def addNode(self, idNode):
+        '''Add a node in a component of its own.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        # A node removed then added again leaves its former component first
+        if idNode in self.removedNodes:
+            self.recompute(self.find(idNode))
+
+        if idNode not in self.parents:
+            self.parents[idNode] = idNode
+            self.members[idNode] = {idNode}
+
+    def removeNode(self, idNode):
+        '''Remove a node (it is kept until its component is recomputed).
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        self.removedNodes.add(idNode)
+        self.dirtyRoots.add(self.find(idNode))
+
+    def find(self, idNode):
+        '''Return the root of the tree of a node, halving the path to it.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        parents = self.parents
+        while parents[idNode] != idNode:
+            parents[idNode] = parents[parents[idNode]]
+            idNode = parents[idNode]
+
+        return idNode
+
+    def union(self, idNode1, idNode2):
+        '''Merge the components of two nodes.
+
+        Argument(s):
+        idNode1 (str): ID of a node
+        idNode2 (str): ID of another node
+        '''
+        root1 = self.find(idNode1)
+        root2 = self.find(idNode2)
+        if root1 != root2:
+            # The smallest component joins the biggest one
+            if len(self.members[root1]) < len(self.members[root2]):
+                root1, root2 = root2, root1
+            self.parents[root2] = root1
+            self.members[root1].update(self.members.pop(root2))
+
+            if root2 in self.dirtyRoots:
+                self.dirtyRoots.discard(root2)
+                self.dirtyRoots.add(root1)
+
+    def recompute(self, root):
+        '''Split a dirty component into the components found in the graph.
+
+        Argument(s):
+        root (str): Root of the component
+        '''
+        self.dirtyRoots.discard(root)
+        members = self.members.pop(root)
+        for idNode in members:
+            del self.parents[idNode]
+        nodes = members - self.removedNodes
+        self.removedNodes.difference_update(members)
+
+        # Edges of the graph never leave the former component
+        for start in nodes:
+            if start in self.parents:
+                continue
+
+            component = {start}
+            self.parents[start] = start
+            stack = [start]
+            while stack:
+                for argsEdge in self.incidentEdges(stack.pop()):
+                    for idNode in (argsEdge.sourceId, argsEdge.destId):
+                        if idNode not in component:
+                            component.add(idNode)
+                            self.parents[idNode] = start
+                            stack.append(idNode)
+            self.members[start] = component
+
+    def getRoot(self, idNode):
+        '''Return the root of the component of a node, recomputing it if it
+        is dirty.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        root = self.find(idNode)
+        if root in self.dirtyRoots:
+            self.recompute(root)
+            root = self.find(idNode)
+
+        return root
+
+    def areConnected(self, idNode1, idNode2):
+        '''Return True if two nodes are in the same component.
+
+        Argument(s):
+        idNode1 (str): ID of a node
+        idNode2 (str): ID of another node
+        '''
+        return self.getRoot(idNode1) == self.getRoot(idNode2)
+
+    def getComponent(self, idNode):
+        '''Return the IDs of the nodes of the component of a node.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        return self.members[self.getRoot(idNode)]
+
+    def getNbComponents(self):
+        '''Return the number of components.'''
+        while self.dirtyRoots:
+            self.recompute(next(iter(self.dirtyRoots)))
+
+        return len(self.members)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+from collections.abc import Mapping
+
+
+class CopyOnWriteDict(Mapping):
+    '''The CopyOnWriteDict class defines a dictionary stored in a hash trie
+    whose nodes are shared between its copies: a copy is made in O(1) and a
+    change after a copy only copies the nodes on the path of its key.
+
+    A node is a list [owner, content] where content is a list of children
+    indexed by bits of the hash of the keys or, for a leaf, a dictionary of
+    items. A node can only be modified in place by the dictionary owning it.
+    Missing children are the shared empty leaf, owned by no dictionary.
+
+
+    Argument(s):
+    root (List): Shared root node (default None: empty dictionary)
+    size (int): Number of items of the root node (default 0)
+
+    Attribute(s):
+    root (List): Root node
+    owner (object): Token of the nodes which can be modified in place
+    size (int): Number of items
+    nbBits (int): Number of bits of the hash consumed at each level
+    mask (int): Mask of the bits of the hash consumed at each level
+    maxLeafSize (int): Number of items above which a leaf is split
+    hashSize (int): Number of bits of a hash
+    emptyLeaf (List): Leaf without items
+    '''
+
+    nbBits = 5
+    mask = (1 << nbBits) - 1
+    maxLeafSize = 32
+    hashSize = 64
+    emptyLeaf = [None, {}]
+
+    def __init__(self, root=None, size=0):
+        self.owner = object()
+        self.root = root or [self.owner, {}]
+        self.size = size
+
+    def getLeaf(self, key):
+        '''Return the items of the leaf of a key.
+
+        Argument(s):
+        key: Key
+        '''
+        h = hash(key)
+        content = self.root[1]
+        while content.__class__ is list:
+            content = content[h & CopyOnWriteDict.mask][1]
+            h >>= CopyOnWriteDict.nbBits
+
+        return content
+
+    def __getitem__(self, key):
+        return self.getLeaf(key)[key]
+
+    def __contains__(self, key):
+        return key in self.getLeaf(key)
+
+    def __iter__(self):
+        nodes = [self.root]
+        while nodes:
+            content = nodes.pop()[1]
+            if isinstance(content, dict):
+                yield from content
+            else:
+                nodes.extend(content)
+
+    def __len__(self):
+        return self.size
+
+    def getOwnedNode(self, node):
+        '''Return a node, copied first if it is shared.
+
+        Argument(s):
+        node (List): Node
+        '''
+        if node[0] is self.owner:
+            return node
+
+        content = node[1]
+        return [self.owner,
+                dict(content) if isinstance(content, dict) else list(content)]
+
+    def getOwnedLeaf(self, key):
+        '''Return the leaf of a key, copying first the shared nodes on its
+        path, and the number of bits of the hash consumed to reach it.
+
+        Argument(s):
+        key: Key
+        '''
+        h = hash(key)
+        node = self.root = self.getOwnedNode(self.root)
+        shift = 0
+        while node[1].__class__ is list:
+            children = node[1]
+            index = (h >> shift) & CopyOnWriteDict.mask
+            node = children[index]
+            if node[0] is not self.owner:
+                node = children[index] = self.getOwnedNode(node)
+            shift += CopyOnWriteDict.nbBits
+
+        return node, shift
+
+    def split(self, leaf, shift):
+        '''Replace the items of an owned leaf by children sharing them out.
+
+        Argument(s):
+        leaf (List): Leaf
+        shift (int): Number of bits of the hash consumed to reach the leaf
+        '''
+        children = [CopyOnWriteDict.emptyLeaf] * (1 << CopyOnWriteDict.nbBits)
+        for key, value in leaf[1].items():
+            index = (hash(key) >> shift) & CopyOnWriteDict.mask
+            children[index] = self.getOwnedNode(children[index])
+            children[index][1][key] = value
+        leaf[1] = children
+
+    def set(self, key, value):
+        '''Set the value of a key.
+
+        Argument(s):
+        key: Key
+        value: Value
+        '''
+        leaf, shift = self.getOwnedLeaf(key)
+        items = leaf[1]
+        if key not in items:
+            self.size += 1
+        items[key] = value
+
+        # Keys with the same hash stay in one leaf
+        if (len(items) > CopyOnWriteDict.maxLeafSize and
+                shift < CopyOnWriteDict.hashSize):
+            self.split(leaf, shift)
+
+    def remove(self, key):
+        '''Remove a key if it exists.
+
+        Argument(s):
+        key: Key
+        '''
+        if key in self:
+            del self.getOwnedLeaf(key)[0][1][key]
+            self.size -= 1
+
+    def copy(self):
+        '''Return a copy sharing all the nodes.'''
+        # Nodes are now shared: they must be copied before any change
+        self.owner = object()
+
+        return CopyOnWriteDict(self.root, self.size)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+import sys
+
+
+class DotAttrsStore(object):
+    '''The DotAttrsStore class defines a columnar storage of the dot
+    attributes of the items of a graph: one sparse column per attribute, with
+    values interned so that repeated values (color="red", ...) are shared.
+    Empty (None) attributes are not kept.
+
+
+    Attribute(s):
+    columns (Dictionary[Dictionary[str]]): Value of each dot attribute
+                                           indexed by item key
+    '''
+
+    def __init__(self):
+        self.columns = {}
+
+    @staticmethod
+    def intern(value):
+        '''Return the shared instance of a value.
+
+        Argument(s):
+        value (str): Value of an attribute
+        '''
+        # Interned strings are released when they are no longer used
+        if type(value) is str:
+            return sys.intern(value)
+
+        return value
+
+    def get(self, key, attr, default=None):
+        '''Return the value of an attribute of an item.
+
+        Argument(s):
+        key (str or int): Key of the item
+        attr (str): Name of the attribute
+        default (str): Value returned if the item has not the attribute
+        (default None)
+        '''
+        column = self.columns.get(attr)
+        if column is None:
+            return default
+
+        return column.get(key, default)
+
+    def getAttrs(self, key):
+        '''Return a new dictionary of the attributes of an item.
+
+        Argument(s):
+        key (str or int): Key of the item
+        '''
+        return {attr: column[key] for attr, column in self.columns.items()
+                if key in column}
+
+    def set(self, key, attr, value):
+        '''Set the value of an attribute of an item (remove it if the value is
+        None).
+
+        Argument(s):
+        key (str or int): Key of the item
+        attr (str): Name of the attribute
+        value (str): Value of the attribute
+        '''
+        if value is None:
+            column = self.columns.get(attr)
+            if column and column.pop(key, None) is not None and not column:
+                del self.columns[attr]
+        else:
+            self.columns.setdefault(DotAttrsStore.intern(attr), {})[key] = \
+                DotAttrsStore.intern(value)
+
+    def remove(self, key):
+        '''Remove all attributes of an item.
+
+        Argument(s):
+        key (str or int): Key of the item
+        '''
+        for attr in [attr for attr, column in self.columns.items()
+                     if key in column]:
+            self.set(key, attr, None)
+
+    def find(self, attr, value):
+        '''Return the keys of the items whose attribute has a value.
+
+        Argument(s):
+        attr (str): Name of the attribute
+        value (str): Value of the attribute
+        '''
+        column = self.columns.get(attr, {})
+
+        return [key for key, val in column.items() if val == value]
+
+    def clear(self):
+        '''Remove all attributes of all items.'''
+        self.columns = {}
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+from collections.abc import Mapping
+
+
+class DotAttrsView(Mapping):
+    '''The DotAttrsView class defines a read-only dictionary of the dot
+    attributes of an item kept in a DotAttrsStore.
+
+
+    Argument(s):
+    store (DotAttrsStore): Storage of the attributes
+    key (str or int): Key of the item
+
+    Attribute(s):
+    store (DotAttrsStore): Storage of the attributes
+    key (str or int): Key of the item
+    '''
+
+    __slots__ = ("store", "key")
+
+    def __init__(self, store, key):
+        self.store = store
+        self.key = key
+
+    def __getitem__(self, attr):
+        column = self.store.columns.get(attr)
+        if column is None or self.key not in column:
+            raise KeyError(attr)
+
+        return column[self.key]
+
+    def __iter__(self):
+        return iter([attr for attr, column in self.store.columns.items()
+                     if self.key in column])
+
+    def __len__(self):
+        return sum(1 for column in self.store.columns.values()
+                   if self.key in column)
+
+    def __repr__(self):
+        return repr(dict(self))
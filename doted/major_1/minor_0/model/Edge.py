@@ -16,7 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
-from doted.major_1.minor_0.enumeration.EdgeArgs import EdgeArgs
+from doted.major_1.minor_0.model.EdgeArgs import EdgeArgs
 
 
 class Edge(object):
@@ -27,26 +27,26 @@ class Edge(object):
     Argument(s):
     source (Node): Source node
     dest (Node): Destination node
-    id (str): ID
+    id (Tuple[str]): ID
 
     Attribute(s):
-    id (str): ID
+    id (Tuple[str]): ID
     source (Node): Source node
     dest (Node): Destination node
+    args (EdgeArgs): Arguments of the edge
     '''
 
+    __slots__ = ("id", "source", "dest", "args")
+
     def __init__(self, source, dest, id):
         self.id = id
         self.source = source
         self.dest = dest
-        source.addNeighbour(dest)
-        dest.addNeighbour(source)
+        self.args = EdgeArgs(id, source.id, dest.id)
+        source.addIncidentEdge(self)
+        dest.addIncidentEdge(self)
         # self.color enum ?
 
     def getArgs(self):
-        '''Return a dictionary of the arguments of the edge.'''
-        return {
-            EdgeArgs.id: self.id,
-            EdgeArgs.sourceId: self.source.id,
-            EdgeArgs.destId: self.dest.id
-        }
+        '''Return the arguments (EdgeArgs) of the edge.'''
+        return self.args
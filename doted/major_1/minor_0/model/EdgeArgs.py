@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import namedtuple
+
+
+class EdgeArgs(namedtuple("EdgeArgs", ["id", "sourceId", "destId"])):
+    '''The EdgeArgs class defines the (immutable) arguments of an Edge sent to
+    the observers of a Graph.
+
+
+    Attribute(s):
+    id (Tuple[str]): ID
+    sourceId (str): ID of the source node
+    destId (str): ID of the destination node
+    '''
+
+    __slots__ = ()
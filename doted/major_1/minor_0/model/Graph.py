@@ -17,13 +17,14 @@
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
 from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+from doted.major_1.minor_0.model.AbstractGraph import AbstractGraph
+from doted.major_1.minor_0.model.DotAttrsStore import DotAttrsStore
 from doted.major_1.minor_0.model.Edge import Edge
 from doted.major_1.minor_0.model.Node import Node
-from doted.major_1.minor_0.observer.Subject import Subject
 from doted.major_1.minor_0.utils.EdgeUtils import EdgeUtils
 
 
-class Graph(Subject):
+class Graph(AbstractGraph):
     '''The Graph class defines a graph (model).
 
 
@@ -32,25 +33,46 @@ class Graph(Subject):
 
     Attribute(s):
     nodes (Dictionary[Node]): All nodes
-    edges (Dictionary[Edge]): All edges
-    nbNodes (int): Number of nodes
-    directed (boolean): Graph directed or not
+    attrStore (DotAttrsStore): Dot attributes of the nodes indexed by their ID
+    edges (Dictionary[Edge]): All edges, indexed by EdgeUtils.createEdgeId()
     '''
 
     def __init__(self, directed=False):
         # Parent constructor(s)
-        Subject.__init__(self)
+        AbstractGraph.__init__(self, directed)
 
         self.nodes = {}
+        self.attrStore = DotAttrsStore()
         self.edges = {}
-        self.resetNbNodes()
-        self.directed = directed
 
     def clear(self):
         '''Clear the graph.'''
         # Remove all nodes (will also remove all edges)
-        for idNode in list(self.nodes.keys()):
-            self.removeNode(idNode)
+        with self.batch():
+            for idNode in list(self.nodes.keys()):
+                self.removeNode(idNode)
+            for idCluster in list(self.clusterTree.clusters):
+                self.removeCluster(idCluster)
+
+    def setDirected(self, directed):
+        '''Set the graph directed or not. Existing edges are rebuilt with the
+        IDs of the new kind of graph.
+
+        Argument(s):
+        directed (boolean): Graph directed or not
+        '''
+        if directed != self.directed:
+            pairs = [(edge.source.id, edge.dest.id)
+                     for edge in self.edges.values()]
+            with self.batch():
+                for idEdge in list(self.edges.keys()):
+                    self.removeEdge(idEdge)
+
+                self.directed = directed
+                self.journal.record(("setDirected", not directed),
+                                    ("setDirected", directed))
+                for idSourceNode, idDestNode in pairs:
+                    self.addEdge(idSourceNode, idDestNode)
 
     def nodeExists(self, idNode):
         '''Check if a node exists.
@@ -67,10 +89,8 @@ class Graph(Subject):
         idSourceNode (str): ID of the source node
         idDestNode (str): ID of the destination node
         '''
-        # The two nodes must exist and be neighbored
-        return (self.nodeExists(idSourceNode) and
-                self.nodeExists(idDestNode) and
-                self.nodes[idSourceNode].isNeighboringTo(idDestNode))
+        return EdgeUtils.createEdgeId(idSourceNode, idDestNode,
+                                      self.directed) in self.edges
 
     def addNode(self, id, dicDotAttrs={}, x=None, y=None):
         '''Add a Node to the graph and notify this.
@@ -83,20 +103,29 @@ class Graph(Subject):
         '''
         # Generate an ID if it is not defined
         if not id:
-            self.nbNodes += 1
-            # Increment id while the id already exists
-            while str(self.nbNodes) in self.nodes:
-                self.nbNodes += 1
-            id = str(self.nbNodes)
+            id = self.idAllocator.getFreeId()
 
         # Only create the node if it doesn't exist
         if not self.nodeExists(id):
             node = Node(id, dicDotAttrs, x if x else 0,
-                        y if y else 0)
+                        y if y else 0, self.attrStore)
 
             self.nodes[node.id] = node
+            self.idAllocator.addId(node.id)
+            self.journal.record(("removeNode", node.id),
+                                ("restoreNode", node.getArgs()))
             self.notify(node.getArgs(), None, UpdateModeView.add)
 
+    def addNodes(self, nodes):
+        '''Add Nodes to the graph and notify this once.
+
+        Argument(s):
+        nodes (Iterable[Tuple]): (id, dicDotAttrs, x, y) of each node
+        '''
+        with self.batch():
+            for id, dicDotAttrs, x, y in nodes:
+                self.addNode(id, dicDotAttrs, x, y)
+
     def editNode(self, idNode, dicDotAttrs):
         '''Edit attributes of a node of the graph.
 
@@ -106,8 +135,26 @@ class Graph(Subject):
         '''
         if self.nodeExists(idNode):
             node = self.nodes[idNode]
+
+            # Only keep the previous values of the edited attributes
+            oldDotAttrs = {attr: node.dotAttrs.get(attr)
+                           for attr in dicDotAttrs}
+            self.journal.record(("editNode", idNode, oldDotAttrs),
+                                ("editNode", idNode, dict(dicDotAttrs)))
+
             node.edit(dicDotAttrs)
-            self.notify(node.getArgs(), None, UpdateModeView.edit)
+            self.notify(node.getArgs(), None, UpdateModeView.edit,
+                        frozenset(attr for attr in dicDotAttrs
+                                  if dicDotAttrs[attr] != oldDotAttrs[attr]))
+
+    def findNodes(self, attr, value):
+        '''Return the IDs of the nodes whose dot attribute has a value.
+
+        Argument(s):
+        attr (str): Name of the dot attribute
+        value (str): Value of the dot attribute
+        '''
+        return self.attrStore.find(attr, value)
 
     def removeNode(self, idNode):
         '''Remove a Node from the graph.
@@ -117,39 +164,75 @@ class Graph(Subject):
         '''
         if self.nodeExists(idNode):
             node = self.nodes.pop(idNode)
-            self.notify(node.getArgs(), None, UpdateModeView.remove)
-
-            # Removes associated edges
-            for edge in list(self.edges.values()):
-                if node == edge.source or node == edge.dest:
+            argsNode = node.getArgs()
+            self.attrStore.remove(idNode)
+            self.idAllocator.removeId(idNode)
+            self.notify(argsNode, None, UpdateModeView.remove)
+
+            # Removes associated edges, the node is restored before them
+            with self.journal.grouping():
+                idCluster = self.clusterTree.getNodeCluster(idNode)
+                if idCluster:
+                    self.clusterTree.removeNode(idNode)
+                    self.journal.record(
+                        ("setNodeCluster", idNode, idCluster),
+                        ("setNodeCluster", idNode, None)
+                    )
+                for edge in list(node.incidentEdges.values()):
                     self.removeEdge(edge.id)
+                self.journal.record(("restoreNode", argsNode),
+                                    ("removeNode", idNode))
 
             if not self.nodes:
-                self.resetNbNodes()
+                self.idAllocator.reset()
+
+    def addEdges(self, edges):
+        '''Add Edges to the graph and notify this once.
 
-    def addEdge(self, idSourceNode, idDestNode):
-        '''Add an Edge to the graph and notify this.
+        Argument(s):
+        edges (Iterable[Tuple[str]]): IDs of the source and destination nodes
+        of each edge
+        '''
+        edges = list(edges)
+
+        with self.batch():
+            # Add each missing node once
+            idNodes = dict.fromkeys(idNode for edge in edges
+                                    for idNode in edge)
+            self.addNodes((idNode, {}, None, None) for idNode in idNodes
+                          if idNode not in self.nodes)
+
+            for idSourceNode, idDestNode in edges:
+                self.linkNodes(idSourceNode, idDestNode)
+
+    def linkNodes(self, idSourceNode, idDestNode):
+        '''Create an Edge between two existing nodes if it doesn't exist and
+        notify this.
 
         Argument(s):
         idSourceNode (str): ID of the source node
         idDestNode (str): ID of the destination node
         '''
-        # Add the two nodes
-        self.addNode(idSourceNode)
-        self.addNode(idDestNode)
-
-        # Only create the edge if it doesn't exist
-        if not self.edgeExists(idSourceNode, idDestNode):
+        idEdge = EdgeUtils.createEdgeId(idSourceNode, idDestNode,
+                                        self.directed)
+        if idEdge not in self.edges:
             edge = Edge(self.nodes[idSourceNode], self.nodes[idDestNode],
-                        EdgeUtils.createEdgeId(idSourceNode, idDestNode))
+                        idEdge)
             self.edges[edge.id] = edge
+            self.journal.record(("removeEdge", idEdge),
+                                ("addEdge", idSourceNode, idDestNode))
             self.notify(None, edge.getArgs(), UpdateModeView.add)
 
+            # Hide it if a node is in a collapsed cluster
+            if (self.clusterTree.isNodeHidden(idSourceNode) or
+                    self.clusterTree.isNodeHidden(idDestNode)):
+                self.notifyVisibility([], [idEdge], False)
+
     def removeEdge(self, idEdge):
         '''Remove an Edge from the graph.
 
         Argument(s):
-        idEdge (str): ID of the edge to remove
+        idEdge (Tuple[str]): ID of the edge to remove
         '''
         # Check if it exists
         if idEdge in self.edges:
@@ -157,11 +240,22 @@ class Graph(Subject):
             edge = self.edges.pop(idEdge)
 
             # Source and dest nodes are not neighboring anymore
-            edge.source.removeNeighbour(edge.dest)
-            edge.dest.removeNeighbour(edge.source)
+            edge.source.removeIncidentEdge(edge)
+            edge.dest.removeIncidentEdge(edge)
 
+            self.journal.record(("addEdge", edge.source.id, edge.dest.id),
+                                ("removeEdge", idEdge))
             self.notify(None, edge.getArgs(), UpdateModeView.remove)
 
+    def getIncidentEdges(self, idNode):
+        '''Return the arguments (EdgeArgs) of the edges of a node.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        return [edge.getArgs()
+                for edge in self.nodes[idNode].incidentEdges.values()]
+
     def removeEdgeByIdNodes(self, idSourceNode, idDestNode):
         '''Remove an Edge from the graph with the two nodes ID.
 
@@ -169,26 +263,21 @@ class Graph(Subject):
         idSourceNode (str): ID of the source node
         idDestNode (str): ID of the destination node
         '''
-        if self.edgeExists(idSourceNode, idDestNode):
-            for key, value in list(self.edges.items()):
-                if ((value.source.id == idSourceNode and
-                     value.dest.id == idDestNode) or
-                    (value.source.id == idDestNode and
-                     value.dest.id == idSourceNode)):
-                    self.removeEdge(key)
-                    break
-
-    def resetNbNodes(self):
-        '''Reset number of nodes.'''
-        self.nbNodes = 0
-
-    def notify(self, dictArgsNode, dictArgsEdge, updateModeView):
-        '''Notify all observers of the creation of a Node or an Edge.
+        self.removeEdge(EdgeUtils.createEdgeId(idSourceNode, idDestNode,
+                                               self.directed))
 
-        Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
-        updateModeView (UpdateModeView): Update mode
-        '''
-        for obs in self.observers:
-            obs.update(dictArgsNode, dictArgsEdge, updateModeView)
+    def getNodeIds(self):
+        '''Return the IDs of the nodes.'''
+        return self.nodes.keys()
+
+    def getNodesPos(self):
+        '''Return the ID and the coordinates (id, x, y) of each node.'''
+        return ((node.id, node.x, node.y) for node in self.nodes.values())
+
+    def getNodesArgs(self):
+        '''Return the arguments (NodeArgs) of the nodes.'''
+        return (node.getArgs() for node in self.nodes.values())
+
+    def getEdgesArgs(self):
+        '''Return the arguments (EdgeArgs) of the edges.'''
+        return (edge.getArgs() for edge in self.edges.values())
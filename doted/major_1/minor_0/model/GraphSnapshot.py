@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+
+
+class GraphSnapshot(object):
+    '''The GraphSnapshot class defines the state of a graph as immutable
+    records. A graph updates its own GraphSnapshot at each change and its
+    snapshot() method returns copies of it, which are never modified and can
+    be read from any thread.
+
+
+    Argument(s):
+    nodes (CopyOnWriteDict): Arguments (NodeArgs) of the nodes indexed by
+                             their ID
+    edges (CopyOnWriteDict): Arguments (EdgeArgs) of the edges indexed by
+                             their ID
+    directed (boolean): Graph directed or not
+
+    Attribute(s):
+    nodes (CopyOnWriteDict): Arguments (NodeArgs) of the nodes indexed by
+                             their ID
+    edges (CopyOnWriteDict): Arguments (EdgeArgs) of the edges indexed by
+                             their ID
+    directed (boolean): Graph directed or not
+    '''
+
+    def __init__(self, nodes, edges, directed):
+        self.nodes = nodes
+        self.edges = edges
+        self.directed = directed
+
+    def copy(self):
+        '''Return a copy sharing the records (in O(1)).'''
+        return GraphSnapshot(self.nodes.copy(), self.edges.copy(),
+                             self.directed)
+
+    def update(self, argsNode, argsEdge, updateModeView):
+        '''Apply a change of a node or of an edge.
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node
+        argsEdge (EdgeArgs): Arguments of the edge
+        updateModeView (UpdateModeView): Update mode
+        '''
+        if argsNode:
+            records, args = self.nodes, argsNode
+        else:
+            records, args = self.edges, argsEdge
+
+        if updateModeView == UpdateModeView.remove:
+            records.remove(args.id)
+        else:
+            records.set(args.id, args)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+from doted.major_1.minor_0.observer.Observer import Observer
+from doted.major_1.minor_0.observer.event.EdgeAdded import EdgeAdded
+from doted.major_1.minor_0.observer.event.EdgeRemoved import EdgeRemoved
+from doted.major_1.minor_0.observer.event.NodeAdded import NodeAdded
+from doted.major_1.minor_0.observer.event.NodeRemoved import NodeRemoved
+
+
+class GraphStatistics(Observer):
+    '''The GraphStatistics class defines an observer counting the nodes and
+    the edges of a graph, and the number of nodes of each degree. It only
+    subscribes to the events adding or removing items, each one is counted in
+    O(1) and the graph is never traversed (so it must be observed from its
+    creation).
+
+
+    Argument(s):
+    graph (Graph): Observed graph
+
+    Attribute(s):
+    graph (Graph): Observed graph
+    nbNodes (int): Number of nodes
+    nbEdges (int): Number of edges
+    nbLoops (int): Number of edges from a node to itself
+    degrees (Dictionary[int]): Degree of each node indexed by its ID
+    degreeCounts (Dictionary[int]): Number of nodes of each degree
+    changed (boolean): Counters changed since the last call of
+                       clearChanged()
+    '''
+
+    def __init__(self, graph):
+        # Parent constructor(s)
+        Observer.__init__(self, graph)
+
+        self.graph = graph
+        self.nbNodes = 0
+        self.nbEdges = 0
+        self.nbLoops = 0
+        self.degrees = {}
+        self.degreeCounts = {}
+        self.changed = False
+
+    def getHandlers(self):
+        '''Return the handler of each type of event changing the counters.'''
+        return {
+            NodeAdded: self.onNodeAdded,
+            NodeRemoved: self.onNodeRemoved,
+            EdgeAdded: self.onEdgeAdded,
+            EdgeRemoved: self.onEdgeRemoved
+        }
+
+    def onNodeAdded(self, event):
+        '''Count an added node.
+
+        Argument(s):
+        event (NodeAdded): Event
+        '''
+        self.nbNodes += 1
+        self.degrees[event.args.id] = 0
+        self.countDegree(0, 1)
+        self.changed = True
+
+    def onNodeRemoved(self, event):
+        '''Count a removed node.
+
+        Argument(s):
+        event (NodeRemoved): Event
+        '''
+        self.nbNodes -= 1
+        self.countDegree(self.degrees.pop(event.args.id), -1)
+        self.changed = True
+
+    def onEdgeAdded(self, event):
+        '''Count an added edge.
+
+        Argument(s):
+        event (EdgeAdded): Event
+        '''
+        self.nbEdges += 1
+        if event.args.sourceId == event.args.destId:
+            self.nbLoops += 1
+        self.addDegree(event.args.sourceId, 1)
+        self.addDegree(event.args.destId, 1)
+        self.changed = True
+
+    def onEdgeRemoved(self, event):
+        '''Count a removed edge.
+
+        Argument(s):
+        event (EdgeRemoved): Event
+        '''
+        self.nbEdges -= 1
+        if event.args.sourceId == event.args.destId:
+            self.nbLoops -= 1
+        self.addDegree(event.args.sourceId, -1)
+        self.addDegree(event.args.destId, -1)
+        self.changed = True
+
+    def addDegree(self, idNode, delta):
+        '''Change the degree of a node.
+
+        Argument(s):
+        idNode (str): ID of the node
+        delta (int): Change of the degree
+        '''
+        # The edges of a removed node are notified after it
+        if idNode in self.degrees:
+            degree = self.degrees[idNode]
+            self.countDegree(degree, -1)
+            self.countDegree(degree + delta, 1)
+            self.degrees[idNode] = degree + delta
+
+    def countDegree(self, degree, delta):
+        '''Change the number of nodes of a degree.
+
+        Argument(s):
+        degree (int): Degree
+        delta (int): Change of the number of nodes
+        '''
+        count = self.degreeCounts.get(degree, 0) + delta
+        if count:
+            self.degreeCounts[degree] = count
+        else:
+            del self.degreeCounts[degree]
+
+    def getNbIsolatedNodes(self):
+        '''Return the number of nodes without edge.'''
+        return self.degreeCounts.get(0, 0)
+
+    def getDensity(self):
+        '''Return the number of edges divided by the number of edges of the
+        complete graph (0 with less than two nodes). Loops are not counted, so
+        the density is at most 1.'''
+        if self.nbNodes < 2:
+            return 0.0
+
+        maxNbEdges = self.nbNodes * (self.nbNodes - 1)
+        if not self.graph.directed:
+            maxNbEdges //= 2
+
+        return (self.nbEdges - self.nbLoops) / maxNbEdges
+
+    def getDegreeDistribution(self):
+        '''Return the number of nodes of each degree as a sorted list of
+        (degree, number of nodes).'''
+        return sorted(self.degreeCounts.items())
+
+    def clearChanged(self):
+        '''Return True if the counters changed since the last call, and
+        clear the flag.'''
+        changed = self.changed
+        self.changed = False
+
+        return changed
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+import heapq
+import re
+
+
+class IdAllocator(object):
+    '''The IdAllocator class defines an allocator of the numeric IDs ("1", "2",
+    ...) given to the nodes created without ID.
+
+
+    Attribute(s):
+    highestId (int): Highest numeric ID used since the last reset
+    freeIds (List[int]): Heap of the freed numeric IDs, may contain IDs used
+    again
+    freeIdsSet (Set[int]): Freed numeric IDs which are still free
+    '''
+
+    numericIdPattern = re.compile("[1-9][0-9]*")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        '''Forget all used IDs.'''
+        self.highestId = 0
+        self.freeIds = []
+        self.freeIdsSet = set()
+
+    @staticmethod
+    def getNumericId(id):
+        '''Return the numeric value of an ID (None if it is not numeric).
+
+        Argument(s):
+        id (str): ID
+        '''
+        if IdAllocator.numericIdPattern.fullmatch(id):
+            return int(id)
+
+        return None
+
+    def addId(self, id):
+        '''Mark an ID as used.
+
+        Argument(s):
+        id (str): ID of an added node
+        '''
+        numericId = IdAllocator.getNumericId(id)
+        if numericId is not None:
+            if numericId > self.highestId:
+                self.highestId = numericId
+            else:
+                # The ID is lazily removed from the heap
+                self.freeIdsSet.discard(numericId)
+
+    def removeId(self, id):
+        '''Mark an ID as free.
+
+        Argument(s):
+        id (str): ID of a removed node
+        '''
+        numericId = IdAllocator.getNumericId(id)
+        if numericId is not None and numericId not in self.freeIdsSet:
+            self.freeIdsSet.add(numericId)
+            heapq.heappush(self.freeIds, numericId)
+
+    def getFreeId(self):
+        '''Return the smallest freed ID, or the ID following the highest used
+        ID if no ID has been freed.'''
+        # Drop the IDs used again
+        while self.freeIds and self.freeIds[0] not in self.freeIdsSet:
+            heapq.heappop(self.freeIds)
+
+        if self.freeIds:
+            return str(self.freeIds[0])
+
+        return str(self.highestId + 1)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+from contextlib import contextmanager
+
+from doted.major_1.minor_0.enumeration.NodeDotAttrs import NodeDotAttrs
+
+
+class Journal(object):
+    '''The Journal class defines the journal of the changes of a graph, used to
+    undo and redo them.
+
+    A change is recorded as a pair of operations (undo, redo). An operation is
+    a tuple (name of a method of the graph, arguments...) so only the delta is
+    kept. The changes recorded in a group (a batch or a single call of a
+    method of the graph) are undone and redone together. Consecutive groups
+    moving the same nodes are merged until the last group is closed (at the
+    end of a drag).
+
+
+    Attribute(s):
+    undoGroups (deque[List[Tuple]]): Groups of changes which can be undone
+    redoGroups (List[List[Tuple]]): Groups of changes which can be redone
+    group (List[Tuple]): Changes of the current group
+    groupLevel (int): Number of nested groups
+    replaying (boolean): True while undoing or redoing (nothing is recorded)
+    closed (boolean): True if the next group can not be merged with the last
+    one
+    maxGroups (int): Number of groups which can be undone
+    '''
+
+    maxGroups = 1000
+
+    def __init__(self):
+        self.undoGroups = deque(maxlen=Journal.maxGroups)
+        self.redoGroups = []
+        self.group = []
+        self.groupLevel = 0
+        self.replaying = False
+        self.closed = False
+
+    def beginGroup(self):
+        '''Begin a group of changes.'''
+        self.groupLevel += 1
+
+    def endGroup(self):
+        '''End a group of changes.'''
+        self.groupLevel -= 1
+        if not self.groupLevel and self.group:
+            group = self.group
+            self.group = []
+
+            # Consecutive moves of the same nodes are undone at once
+            if (self.undoGroups and not self.closed and
+                    Journal.areMoves(self.undoGroups[-1], group)):
+                lastGroup = self.undoGroups[-1]
+                for i, (undo, redo) in enumerate(group):
+                    lastGroup[i] = (lastGroup[i][0], redo)
+            else:
+                self.undoGroups.append(group)
+            self.redoGroups = []
+            self.closed = False
+
+    def closeGroup(self):
+        '''Close the last group of changes: the next moves are not merged with
+        it.'''
+        self.closed = True
+
+    @contextmanager
+    def grouping(self):
+        '''Group the changes recorded in a with statement.'''
+        self.beginGroup()
+        try:
+            yield self
+        finally:
+            self.endGroup()
+
+    def record(self, undo, redo):
+        '''Record a change.
+
+        Argument(s):
+        undo (Tuple): Operation undoing the change
+        redo (Tuple): Operation redoing the change
+        '''
+        if not self.replaying:
+            self.beginGroup()
+            self.group.append((undo, redo))
+            self.endGroup()
+
+    @staticmethod
+    def isMove(redo):
+        '''Return True if an operation only edits the pos of a node.
+
+        Argument(s):
+        redo (Tuple): Operation
+        '''
+        return (redo[0] == "editNode" and len(redo[2]) == 1 and
+                NodeDotAttrs.pos.value in redo[2])
+
+    @staticmethod
+    def areMoves(lastGroup, group):
+        '''Return True if two groups only move the same nodes.
+
+        Argument(s):
+        lastGroup (List[Tuple]): Changes of the previous group
+        group (List[Tuple]): Changes of the new group
+        '''
+        return (len(lastGroup) == len(group) and
+                all(Journal.isMove(lastRedo) and Journal.isMove(redo) and
+                    lastRedo[1] == redo[1]
+                    for (lastUndo, lastRedo), (undo, redo)
+                    in zip(lastGroup, group)))
+
+    def canUndo(self):
+        '''Return True if a group of changes can be undone (not while a group
+        is open: its changes would be replayed out of order).'''
+        return bool(self.undoGroups) and not self.groupLevel
+
+    def canRedo(self):
+        '''Return True if a group of changes can be redone (not while a group
+        is open).'''
+        return bool(self.redoGroups) and not self.groupLevel
+
+    def undo(self, graph):
+        '''Undo the last group of changes of a graph.
+
+        Argument(s):
+        graph (Graph): Graph of the journal
+        '''
+        if self.canUndo():
+            group = self.undoGroups.pop()
+            self.redoGroups.append(group)
+            self.closed = True
+            self.replay(graph, [undo for undo, redo in reversed(group)])
+
+    def redo(self, graph):
+        '''Redo the last undone group of changes of a graph.
+
+        Argument(s):
+        graph (Graph): Graph of the journal
+        '''
+        if self.canRedo():
+            group = self.redoGroups.pop()
+            self.undoGroups.append(group)
+            self.closed = True
+            self.replay(graph, [redo for undo, redo in group])
+
+    def replay(self, graph, operations):
+        '''Apply operations on a graph in a batch, without recording them.
+
+        Argument(s):
+        graph (Graph): Graph of the journal
+        operations (List[Tuple]): Operations to apply
+        '''
+        self.replaying = True
+        try:
+            with graph.batch():
+                for operation in operations:
+                    getattr(graph, operation[0])(*operation[1:])
+        finally:
+            self.replaying = False
@@ -17,7 +17,9 @@
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
 from doted.major_1.minor_0.utils.NodeDotPosUtils import NodeDotPosUtils
-from doted.major_1.minor_0.enumeration.NodeArgs import NodeArgs
+from doted.major_1.minor_0.model.DotAttrsStore import DotAttrsStore
+from doted.major_1.minor_0.model.DotAttrsView import DotAttrsView
+from doted.major_1.minor_0.model.NodeArgs import NodeArgs
 from doted.major_1.minor_0.enumeration.NodeDotAttrs import NodeDotAttrs
 
 
@@ -30,42 +32,47 @@ class Node(object):
     x (float): x coordinate (default 0.0)
     y (float): y coordinate (default 0.0)
     dicDotAttrs (Dictionary[]): Dot attributes (default {})
+    store (DotAttrsStore): Storage of the dot attributes, shared by the nodes
+    of a graph (default None: a storage of its own)
 
     Attribute(s):
     id (str): ID
     x (float): x coordinate
     y (float): y coordinate
-    dotAttrs (Dictionary[]): Dot attributes
-    neighbours (Dictionary[Edge]): Neighbouring nodes
+    store (DotAttrsStore): Storage of the dot attributes
+    incidentEdges (Dictionary[Edge]): Incident edges indexed by their ID
     '''
 
-    def __init__(self, id, dicDotAttrs={}, x=0.0, y=0.0):
+    __slots__ = ("id", "x", "y", "store", "incidentEdges")
+
+    def __init__(self, id, dicDotAttrs={}, x=0.0, y=0.0, store=None):
         self.id = id
         self.x = x
         self.y = y
 
-        self.neighbours = {}
-        self.dotAttrs = {}
+        self.incidentEdges = {}
+        self.store = store if store is not None else DotAttrsStore()
 
         dictAttrs = dicDotAttrs.copy()
         dictAttrs[NodeDotAttrs.pos.value] = NodeDotPosUtils.formatPos(x, y)
         self.edit(dictAttrs)
 
-    def addNeighbour(self, node):
-        '''Add a neighbour.
+    def addIncidentEdge(self, edge):
+        '''Add an incident edge.
 
         Argument(s):
-        node (Node): Neighbour
+        edge (Edge): Edge between the node and a neighbour
         '''
-        self.neighbours[node.id] = node
+        self.incidentEdges[edge.id] = edge
 
-    def removeNeighbour(self, node):
-        '''Remove a neighbour.
+    def removeIncidentEdge(self, edge):
+        '''Remove an incident edge.
 
         Argument(s):
-        node (Node): Neighbour
+        edge (Edge): Edge between the node and a neighbour
         '''
-        self.neighbours.pop(node.id)
+        # A loop is registered only once on its node
+        self.incidentEdges.pop(edge.id, None)
 
     def edit(self, dicDotAttrs):
         '''Edit dot attributes of the node.
@@ -79,8 +86,7 @@ class Node(object):
                 if val:
                     pos = NodeDotPosUtils.getPos(val)
                     if pos:
-                        self.x = pos[NodeArgs.x]
-                        self.y = pos[NodeArgs.y]
+                        self.x, self.y = pos
                     else:
                         self.x = 0.0
                         self.y = 0.0
@@ -88,21 +94,15 @@ class Node(object):
                     self.x = 0.0
                     self.y = 0.0
 
-            self.dotAttrs[attr] = val
-
-    def isNeighboringTo(self, id):
-        '''Check if the node is neighboring with another.
+            self.store.set(self.id, attr, val)
 
-        Argument(s):
-        id (str): Node id
-        '''
-        return id in self.neighbours
+    @property
+    def dotAttrs(self):
+        '''Return a read-only view (DotAttrsView) of the dot attributes of the
+        node.'''
+        return DotAttrsView(self.store, self.id)
 
     def getArgs(self):
-        '''Return a dictionary of the arguments of the node.'''
-        return {
-            NodeArgs.id: self.id,
-            NodeArgs.dotAttrs: self.dotAttrs,
-            NodeArgs.x: self.x,
-            NodeArgs.y: self.y
-        }
+        '''Return the arguments (NodeArgs) of the node.'''
+        # The NodeArgs sent to the observers must not change with the node
+        return NodeArgs(self.id, self.store.getAttrs(self.id), self.x, self.y)
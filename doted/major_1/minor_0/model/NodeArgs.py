@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import namedtuple
+
+
+class NodeArgs(namedtuple("NodeArgs", ["id", "dotAttrs", "x", "y"])):
+    '''The NodeArgs class defines the (immutable) arguments of a Node sent to
+    the observers of a Graph.
+
+
+    Attribute(s):
+    id (str): ID
+    dotAttrs (Dictionary[]): Dot attributes, must not be modified
+    x (float): x coordinate
+    y (float): y coordinate
+    '''
+
+    __slots__ = ()
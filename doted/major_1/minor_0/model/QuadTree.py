@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+import heapq
+import math
+from itertools import count
+
+
+class QuadTree(object):
+    '''The QuadTree class defines a square cell of a quadtree of points: a
+    leaf keeps its points, the other cells are split in four children.
+
+
+    Argument(s):
+    x (float): x coordinate of the top left corner
+    y (float): y coordinate of the top left corner
+    size (float): Length of a side
+
+    Attribute(s):
+    x (float): x coordinate of the top left corner
+    y (float): y coordinate of the top left corner
+    size (float): Length of a side
+    points (Dictionary[Tuple[float]]): Coordinates of the points of a leaf
+                                       indexed by their key (None if the cell
+                                       is split)
+    children (List[QuadTree]): Top left, top right, bottom left and bottom
+                               right children (None for a leaf)
+    count (int): Number of points in the cell
+    minX (float): Left border of the box bounding the points of the cell
+    minY (float): Top border of the box bounding the points of the cell
+    maxX (float): Right border of the box bounding the points of the cell
+    maxY (float): Bottom border of the box bounding the points of the cell
+
+    The bounding box is extended when points are inserted but only shrinks
+    when the cell becomes a leaf again: it may be larger than needed.
+    capacity (int): Number of points of a leaf before it is split
+    minSize (float): Size under which a leaf is not split anymore
+    '''
+
+    __slots__ = ("x", "y", "size", "points", "children", "count", "minX",
+                 "minY", "maxX", "maxY")
+
+    capacity = 16
+    minSize = 1.0
+
+    def __init__(self, x, y, size):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.points = {}
+        self.children = None
+        self.count = 0
+        self.minX = self.minY = math.inf
+        self.maxX = self.maxY = -math.inf
+
+    def contains(self, px, py):
+        '''Return True if a point is in the cell.
+
+        Argument(s):
+        px (float): x coordinate of the point
+        py (float): y coordinate of the point
+        '''
+        return (self.x <= px < self.x + self.size and
+                self.y <= py < self.y + self.size)
+
+    def getChild(self, px, py):
+        '''Return the child which contains a point.
+
+        Argument(s):
+        px (float): x coordinate of the point
+        py (float): y coordinate of the point
+        '''
+        half = self.size / 2
+
+        return self.children[(px >= self.x + half) + 2 * (py >= self.y + half)]
+
+    def insert(self, key, px, py):
+        '''Insert a point.
+
+        Argument(s):
+        key (str or int): Key of the point
+        px (float): x coordinate of the point
+        py (float): y coordinate of the point
+        '''
+        cell = self
+        while cell.children:
+            cell.extend(px, py)
+            cell = cell.getChild(px, py)
+
+        cell.extend(px, py)
+        cell.points[key] = (px, py)
+        if cell.count > QuadTree.capacity and cell.size > QuadTree.minSize:
+            cell.split()
+
+    def extend(self, px, py):
+        '''Count a new point in the cell.
+
+        Argument(s):
+        px (float): x coordinate of the point
+        py (float): y coordinate of the point
+        '''
+        self.count += 1
+        if px < self.minX:
+            self.minX = px
+        if px > self.maxX:
+            self.maxX = px
+        if py < self.minY:
+            self.minY = py
+        if py > self.maxY:
+            self.maxY = py
+
+    def split(self):
+        '''Split a leaf in four children.'''
+        half = self.size / 2
+        self.children = [QuadTree(self.x, self.y, half),
+                         QuadTree(self.x + half, self.y, half),
+                         QuadTree(self.x, self.y + half, half),
+                         QuadTree(self.x + half, self.y + half, half)]
+        for key, (px, py) in self.points.items():
+            self.getChild(px, py).insert(key, px, py)
+        self.points = None
+
+    def remove(self, key, px, py):
+        '''Remove a point.
+
+        Argument(s):
+        key (str or int): Key of the point
+        px (float): x coordinate of the point
+        py (float): y coordinate of the point
+        '''
+        cells = []
+        cell = self
+        while cell.children:
+            cells.append(cell)
+            cell.count -= 1
+            cell = cell.getChild(px, py)
+
+        cell.count -= 1
+        del cell.points[key]
+
+        # The highest cell with few points becomes a leaf again
+        for cell in cells:
+            if cell.count <= QuadTree.capacity:
+                cell.merge()
+                break
+
+    def merge(self):
+        '''Turn the cell into a leaf keeping all its points.'''
+        points = {}
+        cells = [self]
+        while cells:
+            cell = cells.pop()
+            if cell.children:
+                cells.extend(cell.children)
+            else:
+                points.update(cell.points)
+
+        self.children = None
+        self.points = points
+
+        # Shrink the bounding box
+        self.minX = min((px for px, py in points.values()), default=math.inf)
+        self.minY = min((py for px, py in points.values()), default=math.inf)
+        self.maxX = max((px for px, py in points.values()), default=-math.inf)
+        self.maxY = max((py for px, py in points.values()), default=-math.inf)
+
+    def findIn(self, left, top, right, bottom):
+        '''Return the keys of the points in a rectangle (borders included).
+
+        Argument(s):
+        left (float): Left border of the rectangle
+        top (float): Top border of the rectangle
+        right (float): Right border of the rectangle
+        bottom (float): Bottom border of the rectangle
+        '''
+        keys = []
+        cells = [self]
+        while cells:
+            cell = cells.pop()
+            if (not cell.count or cell.minX > right or cell.minY > bottom or
+                    cell.maxX < left or cell.maxY < top):
+                continue
+
+            if cell.children:
+                cells.extend(cell.children)
+            else:
+                keys.extend(key for key, (px, py) in cell.points.items()
+                            if left <= px <= right and top <= py <= bottom)
+
+        return keys
+
+    def findMin(self, cellBound, pointValue):
+        '''Return the key of the point which minimizes a value (None if the
+        tree is empty), visiting the cells in the order of their bound.
+
+        Argument(s):
+        cellBound (Function): Return a lower bound of the values of the
+                              points of a cell
+        pointValue (Function): Return the value of a point from its
+                               coordinates
+        '''
+        # The counter avoids comparing cells or keys with the same value
+        counter = count()
+        heap = [(cellBound(self), next(counter), self, None)]
+        while heap:
+            value, _, cell, key = heapq.heappop(heap)
+            if not cell:
+                return key
+
+            if cell.children:
+                for child in cell.children:
+                    if child.count:
+                        heapq.heappush(heap, (cellBound(child),
+                                              next(counter), child, None))
+            else:
+                for key, (px, py) in cell.points.items():
+                    heapq.heappush(heap, (pointValue(px, py), next(counter),
+                                          None, key))
+
+        return None
+
+    def findNearest(self, px, py):
+        '''Return the key of the nearest point (None if the tree is empty).
+
+        Argument(s):
+        px (float): x coordinate
+        py (float): y coordinate
+        '''
+        def cellBound(cell):
+            dx = max(cell.minX - px, 0, px - cell.maxX)
+            dy = max(cell.minY - py, 0, py - cell.maxY)
+            return dx * dx + dy * dy
+
+        return self.findMin(
+            cellBound,
+            lambda x, y: (x - px) * (x - px) + (y - py) * (y - py)
+        )
+
+    def findExtremes(self):
+        '''Return the keys of the leftmost, topmost, rightmost and bottommost
+        points (None if the tree is empty).'''
+        if not self.count:
+            return None
+
+        return (self.findMin(lambda cell: cell.minX, lambda x, y: x),
+                self.findMin(lambda cell: cell.minY, lambda x, y: y),
+                self.findMin(lambda cell: -cell.maxX, lambda x, y: -x),
+                self.findMin(lambda cell: -cell.maxY, lambda x, y: -y))
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+import math
+
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+from doted.major_1.minor_0.model.QuadTree import QuadTree
+
+
+class SpatialIndex(object):
+    '''The SpatialIndex class defines an index of the positions of the nodes
+    of a graph. They are kept in a quadtree whose root grows to contain every
+    position, so region and nearest node queries are made in O(log n).
+
+
+    Attribute(s):
+    root (QuadTree): Root cell of the quadtree
+    positions (Dictionary[Tuple[float]]): Position of each node indexed by
+                                          its ID
+    initialSize (float): Size of the first root cell
+    '''
+
+    initialSize = 1024.0
+
+    def __init__(self):
+        self.root = QuadTree(-SpatialIndex.initialSize / 2,
+                             -SpatialIndex.initialSize / 2,
+                             SpatialIndex.initialSize)
+        self.positions = {}
+
+    def update(self, argsNode, updateModeView):
+        '''Apply a change of a node.
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node
+        updateModeView (UpdateModeView): Update mode
+        '''
+        if updateModeView == UpdateModeView.remove:
+            self.remove(argsNode.id)
+        else:
+            self.move(argsNode.id, argsNode.x, argsNode.y)
+
+    def move(self, idNode, x, y):
+        '''Set the position of a node.
+
+        Argument(s):
+        idNode (str): ID of the node
+        x (float): x coordinate of the node
+        y (float): y coordinate of the node
+        '''
+        pos = self.positions.get(idNode)
+        if pos != (x, y):
+            self.remove(idNode)
+
+            # Infinite coordinates can not be indexed
+            if math.isfinite(x) and math.isfinite(y):
+                self.grow(x, y)
+                self.root.insert(idNode, x, y)
+                self.positions[idNode] = (x, y)
+
+    def remove(self, idNode):
+        '''Remove a node.
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        pos = self.positions.pop(idNode, None)
+        if pos:
+            self.root.remove(idNode, *pos)
+
+    def grow(self, x, y):
+        '''Double the size of the root cell until it contains a position.
+
+        Argument(s):
+        x (float): x coordinate
+        y (float): y coordinate
+        '''
+        while not self.root.contains(x, y):
+            root = self.root
+            left = x < root.x
+            top = y < root.y
+
+            # The current root becomes a child of the new one
+            self.root = QuadTree(root.x - root.size if left else root.x,
+                                 root.y - root.size if top else root.y,
+                                 root.size * 2)
+            self.root.split()
+            self.root.children[left + 2 * top] = root
+            self.root.count = root.count
+            self.root.minX, self.root.minY = root.minX, root.minY
+            self.root.maxX, self.root.maxY = root.maxX, root.maxY
+
+    def findIn(self, left, top, right, bottom):
+        '''Return the IDs of the nodes in a rectangle (borders included).
+
+        Argument(s):
+        left (float): Left border of the rectangle
+        top (float): Top border of the rectangle
+        right (float): Right border of the rectangle
+        bottom (float): Bottom border of the rectangle
+        '''
+        return self.root.findIn(left, top, right, bottom)
+
+    def findNearest(self, x, y):
+        '''Return the ID of the nearest node (None if there is no node).
+
+        Argument(s):
+        x (float): x coordinate
+        y (float): y coordinate
+        '''
+        return self.root.findNearest(x, y)
+
+    def findExtremes(self):
+        '''Return the IDs of the leftmost, topmost, rightmost and bottommost
+        nodes (None if there is no node).'''
+        return self.root.findExtremes()
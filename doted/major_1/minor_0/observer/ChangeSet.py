@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+
+
+class ChangeSet(object):
+    '''The ChangeSet class defines a set of changes of a Subject buffered
+    during a batch. Redundant changes of an item are collapsed: only its state
+    before and after the batch matters.
+
+
+    Attribute(s):
+    nodes (Dictionary[List]): Changes of the nodes indexed by their ID
+    edges (Dictionary[List]): Changes of the edges indexed by their ID
+    nodesVisibility (Dictionary[boolean]): Last visibility of the nodes hidden
+                                           or shown, indexed by their ID
+    edgesVisibility (Dictionary[boolean]): Last visibility of the edges hidden
+                                           or shown, indexed by their ID
+
+    A change is a list [existed, removedArgs, args, changedAttrs]: if the item
+    existed before the batch, its arguments when it was removed (None if it
+    was not), its current arguments (None if it does not exist anymore) and
+    the dot attributes changed by its edits (None if unknown).
+    '''
+
+    def __init__(self):
+        self.nodes = {}
+        self.edges = {}
+        self.nodesVisibility = {}
+        self.edgesVisibility = {}
+
+    def isEmpty(self):
+        '''Return True if the set contains no change.'''
+        return (not self.nodes and not self.edges and
+                not self.nodesVisibility and not self.edgesVisibility)
+
+    def addChange(self, argsNode, argsEdge, updateModeView,
+                  changedAttrs=None):
+        '''Add a change of a node or of an edge.
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node
+        argsEdge (EdgeArgs): Arguments of the edge
+        updateModeView (UpdateModeView): Update mode
+        changedAttrs (FrozenSet[str]): Dot attributes changed by an edit
+        (default None: unknown)
+        '''
+        if argsNode:
+            self.addItemChange(self.nodes, argsNode, updateModeView,
+                               changedAttrs)
+        else:
+            self.addItemChange(self.edges, argsEdge, updateModeView,
+                               changedAttrs)
+
+    def addVisibilityChange(self, idNodes, idEdges, visible):
+        '''Add a change of the visibility of nodes and edges.
+
+        Argument(s):
+        idNodes (Iterable[str]): IDs of the nodes
+        idEdges (Iterable[Tuple[str]]): IDs of the edges
+        visible (boolean): Items shown or hidden
+        '''
+        self.nodesVisibility.update(dict.fromkeys(idNodes, visible))
+        self.edgesVisibility.update(dict.fromkeys(idEdges, visible))
+
+    def addItemChange(self, changes, args, updateModeView, changedAttrs):
+        '''Collapse a change of an item with its previous changes.
+
+        Argument(s):
+        changes (Dictionary[List]): Changes of the nodes or of the edges
+        args (NodeArgs or EdgeArgs): Arguments of the item
+        updateModeView (UpdateModeView): Update mode
+        changedAttrs (FrozenSet[str]): Dot attributes changed by an edit
+        '''
+        change = changes.get(args.id)
+
+        # First change of the item: it existed if it is not added
+        if not change:
+            if updateModeView == UpdateModeView.remove:
+                changes[args.id] = [True, args, None, None]
+            else:
+                changes[args.id] = [updateModeView != UpdateModeView.add,
+                                    None, args, changedAttrs]
+
+        elif updateModeView == UpdateModeView.remove:
+            # Only the first removal of an existing item has to be sent
+            if change[0] and not change[1]:
+                change[1] = args
+            change[2] = None
+
+        # Add or edit: keep the last arguments and all the changed attributes
+        else:
+            if (updateModeView == UpdateModeView.edit and
+                    change[3] is not None and changedAttrs is not None):
+                change[3] = change[3] | changedAttrs
+            else:
+                change[3] = None
+            change[2] = args
+
+    def getRemoved(self, changes):
+        '''Return the arguments of the removed items.
+
+        Argument(s):
+        changes (Dictionary[List]): Changes of the nodes or of the edges
+        '''
+        return [change[1] for change in changes.values() if change[1]]
+
+    def getAdded(self, changes):
+        '''Return the arguments of the added (or removed then re-added) items.
+
+        Argument(s):
+        changes (Dictionary[List]): Changes of the nodes or of the edges
+        '''
+        return [change[2] for change in changes.values()
+                if change[2] and (not change[0] or change[1])]
+
+    def getEdited(self, changes):
+        '''Return the arguments of the edited items.
+
+        Argument(s):
+        changes (Dictionary[List]): Changes of the nodes or of the edges
+        '''
+        return [change[2] for change in changes.values()
+                if change[2] and change[0] and not change[1]]
+
+    def getRemovedNodes(self):
+        '''Return the arguments (NodeArgs) of the removed nodes.'''
+        return self.getRemoved(self.nodes)
+
+    def getAddedNodes(self):
+        '''Return the arguments (NodeArgs) of the added nodes.'''
+        return self.getAdded(self.nodes)
+
+    def getEditedNodes(self):
+        '''Return the arguments (NodeArgs) of the edited nodes.'''
+        return self.getEdited(self.nodes)
+
+    def getChangedAttrs(self, idNode):
+        '''Return the dot attributes changed by the edits of a node (None if
+        unknown).
+
+        Argument(s):
+        idNode (str): ID of the node
+        '''
+        return self.nodes[idNode][3]
+
+    def getRemovedEdges(self):
+        '''Return the arguments (EdgeArgs) of the removed edges.'''
+        return self.getRemoved(self.edges)
+
+    def getAddedEdges(self):
+        '''Return the arguments (EdgeArgs) of the added edges.'''
+        return self.getAdded(self.edges)
+
+    def getEditedEdges(self):
+        '''Return the arguments (EdgeArgs) of the edited edges.'''
+        return self.getEdited(self.edges)
+
+    def getChanges(self):
+        '''Return the changes (argsNode, argsEdge, updateModeView,
+        changedAttrs) in an order which can be applied one by one: removed
+        edges, removed nodes, added nodes, edited nodes, added edges and edited
+        edges.'''
+        return (
+            [(None, args, UpdateModeView.remove, None)
+             for args in self.getRemovedEdges()] +
+            [(args, None, UpdateModeView.remove, None)
+             for args in self.getRemovedNodes()] +
+            [(args, None, UpdateModeView.add, None)
+             for args in self.getAddedNodes()] +
+            [(args, None, UpdateModeView.edit, self.nodes[args.id][3])
+             for args in self.getEditedNodes()] +
+            [(None, args, UpdateModeView.add, None)
+             for args in self.getAddedEdges()] +
+            [(None, args, UpdateModeView.edit, self.edges[args.id][3])
+             for args in self.getEditedEdges()]
+        )
+
+    def getVisibilityChanges(self):
+        '''Return the changes of visibility (idNodes, idEdges, visible) to
+        apply after the other changes: hidden items, then shown items.'''
+        changes = []
+        for visible in (False, True):
+            idNodes = [idNode for idNode, v in self.nodesVisibility.items()
+                       if v == visible]
+            idEdges = [idEdge for idEdge, v in self.edgesVisibility.items()
+                       if v == visible]
+            if idNodes or idEdges:
+                changes.append((idNodes, idEdges, visible))
+
+        return changes
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import math
+import time
+from collections import deque
+
+
+class DispatchProfiler(object):
+    '''The DispatchProfiler class defines a recorder of the time spent by each
+    observer of a subject for each type of event. The last durations of each
+    pair (observer, event) are kept to compute their percentiles.
+
+
+    Attribute(s):
+    records (Dictionary[Dictionary[List]]): Number of calls, total duration
+    (in seconds) and last durations, indexed by observer then by event
+    maxSamples (int): Number of durations kept for each pair (observer, event)
+    '''
+
+    maxSamples = 10000
+
+    def __init__(self):
+        self.records = {}
+
+    def measure(self, observer, eventName, function, *args):
+        '''Call a function of an observer and record its duration.
+
+        Argument(s):
+        observer (Object): Observer (its class names it)
+        eventName (str): Name of the event
+        function (Function): Function called
+        args (List[]): Arguments of the function
+        '''
+        start = time.perf_counter()
+        try:
+            function(*args)
+        finally:
+            self.record(type(observer).__name__, eventName,
+                        time.perf_counter() - start)
+
+    def record(self, observerName, eventName, duration):
+        '''Record a duration.
+
+        Argument(s):
+        observerName (str): Name of the observer
+        eventName (str): Name of the event
+        duration (float): Duration (in seconds)
+        '''
+        events = self.records.setdefault(observerName, {})
+        record = events.get(eventName)
+        if not record:
+            record = [0, 0.0, deque(maxlen=DispatchProfiler.maxSamples)]
+            events[eventName] = record
+
+        record[0] += 1
+        record[1] += duration
+        record[2].append(duration)
+
+    def reset(self):
+        '''Forget all durations.'''
+        self.records = {}
+
+    def getStats(self):
+        '''Return, for each observer and each event, the number of calls, the
+        total duration and the median and 99th percentile of the durations (in
+        milliseconds).'''
+        stats = {}
+        for observerName, events in self.records.items():
+            stats[observerName] = {}
+            for eventName, (count, total, samples) in events.items():
+                samples = sorted(samples)
+                stats[observerName][eventName] = {
+                    "count": count,
+                    "totalMs": total * 1000,
+                    "p50Ms": DispatchProfiler.percentile(samples, 50) * 1000,
+                    "p99Ms": DispatchProfiler.percentile(samples, 99) * 1000
+                }
+
+        return stats
+
+    def dump(self, file):
+        '''Write the statistics in JSON.
+
+        Argument(s):
+        file (File): File opened for writing
+        '''
+        json.dump(self.getStats(), file, indent=4, sort_keys=True)
+
+    @staticmethod
+    def percentile(samples, rank):
+        '''Return a percentile (nearest rank) of sorted samples.
+
+        Argument(s):
+        samples (List[float]): Sorted samples
+        rank (int): Rank of the percentile (between 0 and 100)
+        '''
+        if not samples:
+            return 0.0
+
+        index = math.ceil(rank / 100 * len(samples)) - 1
+
+        return samples[max(index, 0)]
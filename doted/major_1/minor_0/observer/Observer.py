@@ -17,6 +17,9 @@
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from doted.major_1.minor_0.observer.event.EventFactory import EventFactory
+
+
 class Observer(object):
     '''The Observer class defines an observer.
 
@@ -28,6 +31,47 @@ class Observer(object):
     def __init__(self, subject):
         subject.addObserver(self)
 
+    def getHandlers(self):
+        '''Return the handler of each type of event the observer subscribes
+        to (all of them, sent to update(), by default).'''
+        return dict.fromkeys(EventFactory.eventTypes, self.onEvent)
+
+    def onEvent(self, event):
+        '''Update the observer with an event.
+
+        Argument(s):
+        event (Event): Event
+        '''
+        if event.isNodeEvent:
+            self.update(event.args, None, event.updateModeView)
+        else:
+            self.update(None, event.args, event.updateModeView)
+
     def update(self):
         '''Update the observer.'''
         pass
+
+    def updateBatch(self, changeSet):
+        '''Update the observer with a set of changes, sent one by one to the
+        handlers of their events by default.
+
+        Argument(s):
+        changeSet (ChangeSet): Changes made during a batch
+        '''
+        handlers = self.getHandlers()
+        for change in changeSet.getChanges():
+            event = EventFactory.create(*change)
+            if type(event) in handlers:
+                handlers[type(event)](event)
+        for change in changeSet.getVisibilityChanges():
+            self.updateVisibility(*change)
+
+    def updateVisibility(self, idNodes, idEdges, visible):
+        '''Update the observer when nodes and edges are hidden or shown.
+
+        Argument(s):
+        idNodes (Iterable[str]): IDs of the nodes
+        idEdges (Iterable[Tuple[str]]): IDs of the edges
+        visible (boolean): Items shown or hidden
+        '''
+        pass
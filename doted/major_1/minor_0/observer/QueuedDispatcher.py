@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+from PyQt5.QtCore import QTimer
+
+
+class QueuedDispatcher(object):
+    '''The QueuedDispatcher class defines a dispatcher notifying the changes of
+    subjects once per tick of the Qt event loop. The changes made out of a
+    batch are queued in a ChangeSet, so the changes of an item superseded
+    during the same tick are collapsed (the last one wins).
+
+
+    Attribute(s):
+    subjects (List[Subject]): Subjects whose changes are queued
+    '''
+
+    def __init__(self):
+        self.subjects = []
+
+    def schedule(self, subject):
+        '''Flush the changes of a subject at the next tick of the event loop.
+
+        Argument(s):
+        subject (Subject): Subject whose changes are queued
+        '''
+        if not self.subjects:
+            QTimer.singleShot(0, self.flush)
+        if subject not in self.subjects:
+            self.subjects.append(subject)
+
+    def flush(self):
+        '''Notify observers of the queued changes.'''
+        subjects = self.subjects
+        self.subjects = []
+        for subject in subjects:
+            subject.flush()
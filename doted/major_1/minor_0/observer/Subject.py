@@ -16,6 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
+from contextlib import contextmanager
+
+from doted.major_1.minor_0.observer.ChangeSet import ChangeSet
+
 
 class Subject(object):
     '''The Subject class defines a subject.
@@ -23,10 +27,24 @@ class Subject(object):
 
     Argument(s):
     observers (List[Observer]): All observers
+    handlers (Dictionary[List[Function]]): Handlers of the observers
+    subscribed to each type of event
+    changeSet (ChangeSet): Changes buffered during a batch or queued by the
+    dispatcher (None if there is none)
+    batchLevel (int): Number of nested batches
+    dispatcher (QueuedDispatcher): Dispatcher of the changes made out of a
+    batch (None to notify them at once)
+    profiler (DispatchProfiler): Recorder of the time spent by the observers
+    (None when they are not profiled)
     '''
 
     def __init__(self):
         self.observers = []
+        self.handlers = {}
+        self.changeSet = None
+        self.batchLevel = 0
+        self.dispatcher = None
+        self.profiler = None
 
     def addObserver(self, obs):
         '''Add an observer.
@@ -35,7 +53,116 @@ class Subject(object):
         obs (Observer): A controller
         '''
         self.observers.append(obs)
+        for eventType, handler in obs.getHandlers().items():
+            self.handlers.setdefault(eventType, []).append(handler)
+
+    def setDispatcher(self, dispatcher):
+        '''Set the dispatcher of the changes made out of a batch.
+
+        Argument(s):
+        dispatcher (QueuedDispatcher): Dispatcher (None to notify the changes
+        at once)
+        '''
+        self.flush()
+        self.dispatcher = dispatcher
+
+    def setProfiler(self, profiler):
+        '''Set the recorder of the time spent by the observers.
+
+        Argument(s):
+        profiler (DispatchProfiler): Recorder (None to stop profiling)
+        '''
+        self.profiler = profiler
+
+    def getChangeSet(self):
+        '''Return the set buffering the changes: the set of the current batch
+        or, with a dispatcher, the set of the changes queued until its next
+        flush (None if the changes are notified at once).'''
+        if not self.changeSet and self.dispatcher:
+            self.changeSet = ChangeSet()
+            self.dispatcher.schedule(self)
+
+        return self.changeSet
+
+    def beginBatch(self):
+        '''Begin a batch: changes are buffered until the end of the batch.'''
+        if not self.batchLevel:
+            # Queued changes are notified before the batch
+            self.flush()
+            self.changeSet = ChangeSet()
+        self.batchLevel += 1
+
+    def endBatch(self):
+        '''End a batch and notify observers of the buffered changes.'''
+        self.batchLevel -= 1
+        self.flush()
+
+    def flush(self):
+        '''Notify observers of the buffered changes (unless a batch is not
+        ended).'''
+        if not self.batchLevel and self.changeSet:
+            changeSet = self.changeSet
+            self.changeSet = None
+            if not changeSet.isEmpty():
+                self.notifyBatch(changeSet)
+
+    @contextmanager
+    def batch(self):
+        '''Buffer the changes made in a with statement and notify them at the
+        end of the statement.'''
+        self.beginBatch()
+        try:
+            yield self
+        finally:
+            self.endBatch()
 
     def notify(self):
         '''Notify observers.'''
         pass
+
+    def notifyEvent(self, event):
+        '''Send an event to the observers subscribed to its type.
+
+        Argument(s):
+        event (Event): Event
+        '''
+        for handler in self.handlers.get(type(event), ()):
+            if self.profiler:
+                self.profiler.measure(handler.__self__, type(event).__name__,
+                                      handler, event)
+            else:
+                handler(event)
+
+    def notifyVisibility(self, idNodes, idEdges, visible):
+        '''Notify observers that nodes and edges are hidden or shown.
+
+        Argument(s):
+        idNodes (Iterable[str]): IDs of the nodes
+        idEdges (Iterable[Tuple[str]]): IDs of the edges
+        visible (boolean): Items shown or hidden
+        '''
+        # Changes are notified at the end of the batch or by the dispatcher
+        changeSet = self.getChangeSet()
+        if changeSet:
+            changeSet.addVisibilityChange(idNodes, idEdges, visible)
+        else:
+            for obs in self.observers:
+                if self.profiler:
+                    self.profiler.measure(obs, "Visibility",
+                                          obs.updateVisibility, idNodes,
+                                          idEdges, visible)
+                else:
+                    obs.updateVisibility(idNodes, idEdges, visible)
+
+    def notifyBatch(self, changeSet):
+        '''Notify observers of a set of changes.
+
+        Argument(s):
+        changeSet (ChangeSet): Changes made during a batch
+        '''
+        for obs in self.observers:
+            if self.profiler:
+                self.profiler.measure(obs, "ChangeSet", obs.updateBatch,
+                                      changeSet)
+            else:
+                obs.updateBatch(changeSet)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+class Event(object):
+    '''The Event class defines a base class for the typed events sent by a
+    Graph to the observers subscribed to their type.
+
+
+    Argument(s):
+    args (NodeArgs or EdgeArgs): Arguments of the item
+    changedAttrs (FrozenSet[str]): Dot attributes changed by an edit (default
+    None: unknown, all of them may have changed)
+
+    Attribute(s):
+    args (NodeArgs or EdgeArgs): Arguments of the item
+    changedAttrs (FrozenSet[str]): Dot attributes changed by an edit
+    isNodeEvent (boolean): Event of a node or of an edge
+    updateModeView (UpdateModeView): Update mode of the item
+    '''
+
+    __slots__ = ("args", "changedAttrs")
+
+    isNodeEvent = True
+    updateModeView = None
+
+    def __init__(self, args, changedAttrs=None):
+        self.args = args
+        self.changedAttrs = changedAttrs
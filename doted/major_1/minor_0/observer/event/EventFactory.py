@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+from doted.major_1.minor_0.enumeration.NodeDotAttrs import NodeDotAttrs
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+from doted.major_1.minor_0.observer.event.EdgeAdded import EdgeAdded
+from doted.major_1.minor_0.observer.event.EdgeEdited import EdgeEdited
+from doted.major_1.minor_0.observer.event.EdgeRemoved import EdgeRemoved
+from doted.major_1.minor_0.observer.event.NodeAdded import NodeAdded
+from doted.major_1.minor_0.observer.event.NodeAttrChanged import \
+    NodeAttrChanged
+from doted.major_1.minor_0.observer.event.NodeMoved import NodeMoved
+from doted.major_1.minor_0.observer.event.NodeRemoved import NodeRemoved
+
+
+class EventFactory(object):
+    '''The EventFactory class defines a set of functions to create the typed
+    events of the changes of a graph.
+
+
+    Attribute(s):
+    eventTypes (List[type]): All types of events
+    nodeEventTypes (Dictionary[type]): Type of the event of each update mode
+                                       of a node (except edit)
+    edgeEventTypes (Dictionary[type]): Type of the event of each update mode
+                                       of an edge
+    movedAttrs (FrozenSet[str]): Changed attributes of a NodeMoved event
+    '''
+
+    eventTypes = [NodeAdded, NodeMoved, NodeAttrChanged, NodeRemoved,
+                  EdgeAdded, EdgeEdited, EdgeRemoved]
+    nodeEventTypes = {
+        UpdateModeView.add: NodeAdded,
+        UpdateModeView.remove: NodeRemoved
+    }
+    edgeEventTypes = {
+        UpdateModeView.add: EdgeAdded,
+        UpdateModeView.edit: EdgeEdited,
+        UpdateModeView.remove: EdgeRemoved
+    }
+    movedAttrs = frozenset([NodeDotAttrs.pos.value])
+
+    @staticmethod
+    def create(argsNode, argsEdge, updateModeView, changedAttrs=None):
+        '''Create the event of a change of a node or of an edge.
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node
+        argsEdge (EdgeArgs): Arguments of the edge
+        updateModeView (UpdateModeView): Update mode
+        changedAttrs (FrozenSet[str]): Dot attributes changed by an edit
+        (default None: unknown)
+        '''
+        eventType = EventFactory.getType(argsNode, updateModeView,
+                                         changedAttrs)
+
+        return eventType(argsNode or argsEdge, changedAttrs)
+
+    @staticmethod
+    def getType(argsNode, updateModeView, changedAttrs=None):
+        '''Return the type of the event of a change of a node or of an edge.
+
+        Argument(s):
+        argsNode (NodeArgs): Arguments of the node (None for an edge)
+        updateModeView (UpdateModeView): Update mode
+        changedAttrs (FrozenSet[str]): Dot attributes changed by an edit
+        (default None: unknown)
+        '''
+        if not argsNode:
+            return EventFactory.edgeEventTypes[updateModeView]
+
+        if updateModeView != UpdateModeView.edit:
+            return EventFactory.nodeEventTypes[updateModeView]
+        if changedAttrs == EventFactory.movedAttrs:
+            return NodeMoved
+
+        return NodeAttrChanged
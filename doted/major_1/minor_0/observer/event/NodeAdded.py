@@ -15,14 +15,13 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+from doted.major_1.minor_0.observer.event.Event import Event
 
-from enum import Enum
 
+class NodeAdded(Event):
+    '''The NodeAdded class defines the event sent when a node is added.'''
 
-class NodeArgs(Enum):
-    '''The NodeArgs enum defines the keys of the dictionary of a Node.'''
+    __slots__ = ()
 
-    id = 0
-    dotAttrs = 1
-    x = 2
-    y = 3
+    updateModeView = UpdateModeView.add
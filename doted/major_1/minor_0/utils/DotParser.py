@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+import re
+
+from doted.major_1.minor_0.model.EdgeArgs import EdgeArgs
+from doted.major_1.minor_0.utils.DotStatement import DotStatement
+from doted.major_1.minor_0.utils.EdgeUtils import EdgeUtils
+
+
+class DotParser(object):
+    '''The DotParser class defines a parser of the statements of a dot text.
+    It records the span of the declaration of each node and edge in one pass
+    over the tokens of the text, the semicolons between statements being
+    optional.
+
+    Attribute(s):
+    tokenRegex (Pattern): Dot tokens (spaces and comments are skipped, HTML
+    strings are read apart)
+    keywords (FrozenSet[str]): Dot keywords (case insensitive)
+    directed (boolean): Graph directed or not
+    nodeSpans (Dictionary[List[int]]): Start and end index of the first
+    statement declaring each node
+    edgeSpans (Dictionary[List[int]]): Start and end index of the first
+    statement declaring each edge
+    statements (List[DotStatement]): Statements declaring nodes or edges, in
+    the order of the text
+    nbOtherStatements (int): Number of the other statements (subgraphs,
+    attributes of the graph and default attributes)
+    nbErrors (int): Number of syntax errors skipped
+    tokens (List[Tuple]): Kind, text, start and end index of each token
+    index (int): Index of the current token
+    declared (List[str]): IDs of the nodes in the order of the statements
+    (for the subgraphs used in edge statements)
+    idCluster (str): ID of the current cluster (None outside any cluster)
+    '''
+
+    tokenRegex = re.compile(r'''
+        (?P<space>\s+|//[^\n]*|\#[^\n]*|/\*.*?(?:\*/|\Z))
+      | (?P<id>"(?:[^"\\]|\\.)*"?|[^\W\d]\w*|-?(?:\.\d+|\d+(?:\.\d*)?))
+      | (?P<op>->|--|[{}\[\];,=:+<])
+      | (?P<other>.)
+    ''', re.VERBOSE | re.DOTALL)
+
+    keywords = frozenset(["strict", "graph", "digraph", "subgraph", "node",
+                          "edge"])
+
+    def __init__(self, directed=False):
+        self.directed = directed
+        self.nodeSpans = {}
+        self.edgeSpans = {}
+        self.statements = []
+        self.nbOtherStatements = 0
+        self.nbErrors = 0
+        self.tokens = []
+        self.index = 0
+        self.declared = []
+        self.idCluster = None
+
+    def tokenize(self, text):
+        '''Return the tokens of a dot text.
+
+        Argument(s):
+        text (str): Dot text
+        '''
+        tokens = []
+        pos = 0
+        concat = False
+        while pos < len(text):
+            m = self.tokenRegex.match(text, pos)
+            kind = m.lastgroup
+            value = m.group()
+            pos = m.end()
+
+            if kind == "space":
+                continue
+
+            # HTML string: read until the matching >
+            if value == "<":
+                depth = 1
+                while pos < len(text) and depth:
+                    if text[pos] == "<":
+                        depth += 1
+                    elif text[pos] == ">":
+                        depth -= 1
+                    pos += 1
+                kind = "id"
+                value = text[m.start():pos]
+            elif kind == "id" and value[0] != '"':
+                if value.lower() in self.keywords:
+                    kind = value.lower()
+            elif kind == "op":
+                kind = value
+
+            # Concatenated strings ("a" + "b") form one ID
+            if kind == "+":
+                concat = bool(tokens) and tokens[-1][0] == "id"
+                continue
+            if concat and kind == "id":
+                start = tokens[-1][2]
+                tokens[-1] = ("id", text[start:pos], start, pos)
+                concat = False
+                continue
+            concat = False
+
+            tokens.append((kind, value, m.start(), pos))
+
+        return tokens
+
+    def parse(self, text, header=True):
+        '''Parse a dot text and record the statements declaring its nodes and
+        edges.
+
+        Argument(s):
+        text (str): Dot text
+        header (boolean): Text starting with the header of the graph, else a
+        list of statements (default True)
+        '''
+        self.nodeSpans = {}
+        self.edgeSpans = {}
+        self.statements = []
+        self.nbOtherStatements = 0
+        self.nbErrors = 0
+        self.tokens = self.tokenize(text)
+        self.index = 0
+        self.declared = []
+        self.idCluster = None
+
+        # Header of the graph
+        if header:
+            if self.nextKind() == "strict":
+                self.index += 1
+            if self.nextKind() in ("graph", "digraph"):
+                self.directed = self.nextKind() == "digraph"
+                self.index += 1
+            if self.nextKind() == "id":
+                self.index += 1
+            if self.nextKind() == "{":
+                self.index += 1
+            else:
+                self.nbErrors += 1
+
+        # The graph must be closed, a list of statements must not be
+        closed = self.parseStatements()
+        if closed != header or self.index < len(self.tokens):
+            self.nbErrors += 1
+
+    def nextKind(self):
+        '''Return the kind of the current token (None at the end).'''
+        if self.index < len(self.tokens):
+            return self.tokens[self.index][0]
+
+        return None
+
+    def parseStatements(self):
+        '''Parse statements until the end of the current graph or subgraph
+        and return True if it is closed by a }.'''
+        while self.index < len(self.tokens):
+            kind = self.nextKind()
+            if kind == "}":
+                self.index += 1
+                return True
+            elif kind in ("id", "subgraph", "{", "graph", "node", "edge"):
+                self.parseStatement()
+            # Ignore separators and unexpected tokens
+            else:
+                if kind not in (";", ","):
+                    self.nbErrors += 1
+                self.index += 1
+
+        return False
+
+    def parseStatement(self):
+        '''Parse a statement and record it if it declares a node or
+        edges.'''
+        kind, value, start, end = self.tokens[self.index]
+
+        # Default attributes of the graph, nodes or edges
+        if kind in ("graph", "node", "edge"):
+            self.index += 1
+            self.nbOtherStatements += 1
+            self.parseAttrList()
+            self.parseSeparator()
+            return
+
+        idNodes = self.parseOperand()
+
+        # Attribute of the graph (ID = ID)
+        if kind == "id" and self.nextKind() == "=":
+            self.index += 1
+            self.nbOtherStatements += 1
+            if self.nextKind() == "id":
+                self.index += 1
+            else:
+                self.nbErrors += 1
+            self.parseSeparator()
+            return
+
+        edges = []
+        while self.nextKind() in ("--", "->"):
+            self.index += 1
+            if self.nextKind() not in ("id", "subgraph", "{"):
+                self.nbErrors += 1
+                break
+
+            idDestNodes = self.parseOperand()
+            for idSource in idNodes:
+                for idDest in idDestNodes:
+                    edges.append(EdgeArgs(
+                        EdgeUtils.createEdgeId(idSource, idDest,
+                                               self.directed),
+                        idSource, idDest))
+            idNodes = idDestNodes
+
+        dotAttrs = self.parseAttrList()
+        end = self.parseSeparator()
+
+        if edges:
+            self.statements.append(DotStatement(start, end, None, dotAttrs,
+                                                edges, self.idCluster))
+            for argsEdge in edges:
+                self.edgeSpans.setdefault(argsEdge.id, [start, end])
+        elif kind == "id":
+            self.statements.append(DotStatement(start, end, value, dotAttrs,
+                                                edges, self.idCluster))
+            self.nodeSpans.setdefault(value, [start, end])
+
+    def parseOperand(self):
+        '''Parse a node ID or a subgraph and return the IDs of its nodes.'''
+        kind, value = self.tokens[self.index][:2]
+        self.index += 1
+
+        # Node ID, with a port and a compass point
+        if kind == "id":
+            for i in range(2):
+                if self.nextKind() != ":":
+                    break
+                self.index += 1
+                if self.nextKind() == "id":
+                    self.index += 1
+
+            self.declared.append(value)
+            return [value]
+
+        # Subgraph, a cluster if it is named
+        self.nbOtherStatements += 1
+        idCluster = self.idCluster
+        if kind == "subgraph":
+            if self.nextKind() == "id":
+                self.idCluster = self.tokens[self.index][1]
+                self.index += 1
+            if self.nextKind() != "{":
+                self.idCluster = idCluster
+                return []
+            self.index += 1
+
+        first = len(self.declared)
+        if not self.parseStatements():
+            self.nbErrors += 1
+        self.idCluster = idCluster
+
+        return list(dict.fromkeys(self.declared[first:]))
+
+    def parseAttrList(self):
+        '''Parse the attribute lists of a statement and return its
+        attributes.'''
+        dotAttrs = {}
+        while self.nextKind() == "[":
+            self.index += 1
+            while self.nextKind() not in ("]", "{", "}", None):
+                kind, attr = self.tokens[self.index][:2]
+                self.index += 1
+                if kind in (",", ";"):
+                    continue
+
+                # Attribute (ID = ID), the keywords are valid IDs here
+                if ((kind == "id" or kind in self.keywords) and
+                        self.nextKind() == "="):
+                    self.index += 1
+                    kind = self.nextKind()
+                    if kind == "id" or kind in self.keywords:
+                        dotAttrs[attr] = self.tokens[self.index][1]
+                        self.index += 1
+                        continue
+                self.nbErrors += 1
+
+            if self.nextKind() == "]":
+                self.index += 1
+            else:
+                self.nbErrors += 1
+
+        return dotAttrs
+
+    def parseSeparator(self):
+        '''Skip the semicolon ending a statement and return the end index of
+        the statement.'''
+        if self.nextKind() == ";":
+            self.index += 1
+
+        return self.tokens[self.index - 1][3]
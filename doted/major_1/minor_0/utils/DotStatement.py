@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+from collections import namedtuple
+
+
+class DotStatement(namedtuple("DotStatement", ["start", "end", "idNode",
+                                               "dotAttrs", "edges",
+                                               "idCluster"])):
+    '''The DotStatement class defines the (immutable) statement of a dot text
+    declaring a node or edges, found by a DotParser.
+
+
+    Attribute(s):
+    start (int): Index of the start of the statement in the text
+    end (int): Index of the end of the statement (after its semicolon)
+    idNode (str): ID of the node declared (None for an edge statement)
+    dotAttrs (Dictionary[]): Dot attributes of the statement
+    edges (List[EdgeArgs]): Edges declared (empty for a node statement)
+    idCluster (str): ID of the cluster (named subgraph) of the statement, None
+    outside any cluster
+    '''
+
+    __slots__ = ()
@@ -21,14 +21,38 @@ class EdgeUtils(object):
     '''The EdgeUtils class defines a set of functions for edges.'''
 
     @staticmethod
-    def createEdgeId(idSourceNode, idDestNode):
-        '''Create an ID for an edge.
+    def createEdgeId(idSourceNode, idDestNode, directed=False):
+        '''Create an ID for an edge: the pair (source, dest) for a directed
+        graph, the pair sorted for an undirected graph so that both directions
+        give the same ID.
 
         Argument(s):
         idSourceNode (str): ID of the source node
         idDestNode (str): ID of the destination node
+        directed (boolean): Graph directed or not (default False)
         '''
-        return idSourceNode + "-" + idDestNode
+        if directed or idSourceNode <= idDestNode:
+            return (idSourceNode, idDestNode)
+
+        return (idDestNode, idSourceNode)
+
+    @staticmethod
+    def edgeOp(directed):
+        '''Return the dot edge operator.
+
+        Argument(s):
+        directed (boolean): Graph directed or not
+        '''
+        return "->" if directed else "--"
+
+    @staticmethod
+    def graphType(directed):
+        '''Return the dot keyword of a graph.
+
+        Argument(s):
+        directed (boolean): Graph directed or not
+        '''
+        return "digraph" if directed else "graph"
 
     @staticmethod
     def closestPointTo(point, path):
@@ -18,8 +18,6 @@
 
 import re
 
-from doted.major_1.minor_0.enumeration.NodeArgs import NodeArgs
-
 
 class NodeDotPosUtils(object):
     '''The NodeDotPosUtils class defines a set of functions for the dot pos
@@ -43,7 +41,7 @@ class NodeDotPosUtils(object):
 
     @staticmethod
     def getPos(posAttr):
-        '''Get x and y coordinates from a dot pos attribute.
+        '''Get x and y coordinates (Tuple[float]) from a dot pos attribute.
 
         Argument(s):
         posAttr (str): Dot pos attribute
@@ -56,10 +54,7 @@ class NodeDotPosUtils(object):
         if (len(result) < 2):
             return None
 
-        return {
-            NodeArgs.x: float(result[0]),
-            NodeArgs.y: float(result[1])
-        }
+        return float(result[0]), float(result[1])
 
     @staticmethod
     def isPosValid(posAttr):
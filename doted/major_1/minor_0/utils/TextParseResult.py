@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+class TextParseResult(object):
+    '''The TextParseResult class defines the result of the parse of the text of
+    a TextGraphView: the items of the graph and their changes since the last
+    parse.
+
+
+    Argument(s):
+    importing (boolean): Parse of an imported text (all the items are new)
+    message (str): Error message (default None if the text is valid)
+
+    Attribute(s):
+    importing (boolean): Parse of an imported text (all the items are new)
+    message (str): Error message (None if the text is valid)
+    graphName (str): Name of the graph
+    directed (boolean): Graph directed (digraph) or not (graph)
+    nodes (Dictionary[Dictionary[]]): Dot attributes of the nodes
+    edges (Dictionary[EdgeArgs]): Edges
+    clusters (Dictionary[str]): Parent of each cluster (named subgraph), None
+    for a top-level cluster
+    nodeClusters (Dictionary[str]): Cluster of each node in a cluster
+    statements (List[DotStatement]): Statements declaring nodes or edges
+    changes (List[List]): IDs of the nodes added, edited and removed, edges
+    removed (EdgeArgs) and IDs of the edges added (None for an import)
+    '''
+
+    __slots__ = ("importing", "message", "graphName", "directed", "nodes",
+                 "edges", "clusters", "nodeClusters", "statements", "changes")
+
+    def __init__(self, importing, message=None):
+        self.importing = importing
+        self.message = message
+        self.graphName = None
+        self.directed = False
+        self.nodes = {}
+        self.edges = {}
+        self.clusters = {}
+        self.nodeClusters = {}
+        self.statements = []
+        self.changes = None
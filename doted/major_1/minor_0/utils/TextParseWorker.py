@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class TextParseWorker(QObject):
+    '''The TextParseWorker class defines a worker parsing texts on another
+    thread, so the GUI is not locked by large texts. Only the result of the
+    last parse is sent: a parse superseded by a newer one is cancelled if it
+    is not started yet, and its result is dropped otherwise. A parse raising
+    an error sends its message instead of a result.
+
+
+    Attribute(s):
+    parsed (pyqtSignal): Signal sending the result of the last parse, received
+    on the GUI thread
+    failed (pyqtSignal): Signal sending the error message of the last parse,
+    received on the GUI thread
+    finished (pyqtSignal): Signal sending the number and the result of a parse
+    finished on the worker thread (the error raised if it failed)
+    executor (ThreadPoolExecutor): Pool of one thread running the parses
+    future (Future): Last parse (None if no parse was run)
+    generation (int): Number of the last parse
+    '''
+
+    parsed = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    finished = pyqtSignal(int, object)
+
+    def __init__(self):
+        QObject.__init__(self)
+
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.future = None
+        self.generation = 0
+
+        # The worker lives on the GUI thread: results are queued to it
+        self.finished.connect(self.onFinished)
+
+    def parse(self, function, *args):
+        '''Call a parse function on the worker thread, superseding the current
+        parse.
+
+        Argument(s):
+        function (Callable): Parse function, which must not use widgets
+        *args: Arguments of the function
+        '''
+        self.cancel()
+        self.future = self.executor.submit(self.run, self.generation,
+                                           function, *args)
+
+    def run(self, generation, function, *args):
+        '''Run a parse function (on the worker thread).
+
+        Argument(s):
+        generation (int): Number of the parse
+        function (Callable): Parse function
+        *args: Arguments of the function
+        '''
+        if generation == self.generation:
+            # The worker must not stay busy if the parse fails
+            try:
+                result = function(*args)
+            except Exception as error:
+                result = error
+            self.finished.emit(generation, result)
+
+    def onFinished(self, generation, result):
+        '''Send the result of a parse unless it was superseded (on the GUI
+        thread).
+
+        Argument(s):
+        generation (int): Number of the parse
+        result: Result of the parse
+        '''
+        if generation == self.generation:
+            self.future = None
+            if isinstance(result, Exception):
+                self.failed.emit(str(result))
+            else:
+                self.parsed.emit(result)
+
+    def cancel(self):
+        '''Cancel the current parse.'''
+        self.generation += 1
+        if self.future:
+            self.future.cancel()
+            self.future = None
+
+    def isBusy(self):
+        '''Return True if a parse is in flight.'''
+        return self.future is not None
@@ -16,9 +16,6 @@
 # You should have received a copy of the GNU General Public License
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
-from PyQt5.Qt import Qt
-from PyQt5.QtWidgets import QGraphicsItem
-
 
 class GraphicsEdge(object):
     '''The GraphicsEdge class defines the base class of a graphics edge.
@@ -27,13 +24,13 @@ class GraphicsEdge(object):
     Argument(s):
     source (GraphicsNode): Node view
     dest (GraphicsNode): Node view
-    id (int): ID
+    id (Tuple[str]): ID
     graphicsGraphView (GraphicsGraphView): View
 
     Attribute(s):
     source (GraphicsNode): Node view
     dest (GraphicsNode): Node view
-    id (int): ID
+    id (Tuple[str]): ID
     graphicsGraphView (GraphicsGraphView): View
     '''
 
@@ -43,31 +40,10 @@ class GraphicsEdge(object):
         self.id = id
         self.graphicsGraphView = graphicsGraphView
 
-    def edit(self, dictArgsEdge):
+    def edit(self, argsEdge):
         '''Edit the edge.
 
         Argument(s):
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        argsEdge (EdgeArgs): Arguments of the edge
         '''
         pass
-
-    def getFocus(self, id):
-        '''Indicate when edge get the focus to highlight her in textual view
-
-        Argument(s):
-        id (str): ID of the node
-        '''
-        controller = self.graphicsGraphView.controller
-        controller.onSelectItem(id)
-
-    def mousePressEvent(self, event):
-        '''Handle mouse press event.
-
-        Argument(s):
-        event (QGraphicsSceneMouseEvent): Graphics scene mouse event
-        '''
-        QGraphicsItem.mousePressEvent(self, event)
-
-        # Get the focus
-        if event.buttons() == Qt.LeftButton:
-            self.getFocus(self.id)
@@ -30,7 +30,7 @@ class GraphicsLineEdge(GraphicsEdge, QGraphicsLineItem):
     Argument(s):
     source (GraphicsNode): Node view
     dest (GraphicsNode): Node view
-    id (int): ID
+    id (Tuple[str]): ID
     graphicsGraphView (GraphicsGraphView): View
     '''
 
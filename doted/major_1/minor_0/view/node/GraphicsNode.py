@@ -20,7 +20,6 @@ from PyQt5.Qt import QMarginsF, Qt
 from PyQt5.QtWidgets import QGraphicsItem, QMenu
 
 from doted.major_1.minor_0.utils.NodeDotPosUtils import NodeDotPosUtils
-from doted.major_1.minor_0.enumeration.NodeArgs import NodeArgs
 from doted.major_1.minor_0.enumeration.NodeDotAttrs import NodeDotAttrs
 from doted.major_1.minor_0.utils.NodeDotLabelUtils import NodeDotLabelUtils
 from doted.major_1.minor_0.view.edge.GraphicsSemiEdge import GraphicsSemiEdge
@@ -59,29 +58,33 @@ class GraphicsNode(object):
         editLabelAction = self.contextMenu.addAction("Edit label")
         editLabelAction.triggered.connect(self.onEditLabel)
 
-    def edit(self, dictArgsNode):
-        '''Edit all attributes of the node.
+    def edit(self, argsNode, changedAttrs=None):
+        '''Edit the attributes of the node which changed.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
+        changedAttrs (FrozenSet[str]): Dot attributes changed (default None:
+        unknown, all of them are edited)
         '''
-        self.editLabel(dictArgsNode)
-        self.editPos(dictArgsNode)
+        if changedAttrs is None or NodeDotAttrs.label.value in changedAttrs:
+            self.editLabel(argsNode)
+        if changedAttrs is None or NodeDotAttrs.pos.value in changedAttrs:
+            self.editPos(argsNode)
 
-    def editLabel(self, dictArgsNode):
+    def editLabel(self, argsNode):
         '''Edit the label.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
         '''
         # Get ID as default label
         label = self.id
 
         # Take value label if it exists
-        if (NodeDotAttrs.label.value in dictArgsNode[NodeArgs.dotAttrs] and
-                dictArgsNode[NodeArgs.dotAttrs][NodeDotAttrs.label.value]):
+        if (NodeDotAttrs.label.value in argsNode.dotAttrs and
+                argsNode.dotAttrs[NodeDotAttrs.label.value]):
             label = NodeDotLabelUtils.getLabel(
-                (dictArgsNode[NodeArgs.dotAttrs]
+                (argsNode.dotAttrs
                  [NodeDotAttrs.label.value]))
 
         # Update the text if needed
@@ -92,22 +95,22 @@ class GraphicsNode(object):
         '''Callback function when editing the label.'''
         self.graphicsTextNode.editLabel()
 
-    def editPos(self, dictArgsNode):
+    def editPos(self, argsNode):
         '''Edit the position.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
         '''
         posChanged = False
         # Update x
-        if self.x() != dictArgsNode[NodeArgs.x]:
+        if self.x() != argsNode.x:
             posChanged = True
-            self.setX(dictArgsNode[NodeArgs.x])
+            self.setX(argsNode.x)
 
         # Update y
-        if self.y() != dictArgsNode[NodeArgs.y]:
+        if self.y() != argsNode.y:
             posChanged = True
-            self.setY(dictArgsNode[NodeArgs.y])
+            self.setY(argsNode.y)
 
         if posChanged:
             self.graphicsGraphView.updateEdgesOfNode(self)
@@ -129,14 +132,6 @@ class GraphicsNode(object):
         '''Center the text in the shape.'''
         pass
 
-    def getFocus(self, id):
-        '''Indicate when node get the focus to highlight him in textual view.
-
-        Argument(s):
-        id (str): ID of the node
-        '''
-        self.graphicsGraphView.controller.onSelectItem(id)
-
     def mouseMoveEvent(self, event):
         '''Handle mouse move event.
 
@@ -159,9 +154,8 @@ class GraphicsNode(object):
         '''
         QGraphicsItem.mousePressEvent(self, event)
 
-        # Create the semi-edge and get the focus
+        # Create the semi-edge
         if event.buttons() == Qt.LeftButton:
-            self.getFocus(self.id)
             self.semiEdge = GraphicsSemiEdge(event.scenePos(), self)
             self.scene().addItem(self.semiEdge)
         elif event.buttons() == Qt.RightButton:
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt5.QtCore import QSize
+from PyQt5.QtWidgets import QWidget
+
+
+class LineNumberArea(QWidget):
+    '''The LineNumberArea class defines the gutter of a textual view, showing
+    the number of its lines.
+
+
+    Argument(s):
+    textView (TextGraphView): Textual view
+
+    Attribute(s):
+    textView (TextGraphView): Textual view painting the gutter
+    '''
+
+    def __init__(self, textView):
+        # Parent constructor(s)
+        QWidget.__init__(self, textView)
+
+        self.textView = textView
+
+    def sizeHint(self):
+        '''Return the size of the gutter.'''
+        return QSize(self.textView.lineNumberAreaWidth(), 0)
+
+    def paintEvent(self, event):
+        '''Handle paint event.
+
+        Argument(s):
+        event (QPaintEvent): Paint event
+        '''
+        self.textView.paintLineNumbers(event)
@@ -17,8 +17,10 @@
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
 from PyQt5.Qt import Qt
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import QMainWindow, QWidget, QSplitter, QVBoxLayout, \
-    QPushButton, QMessageBox
+    QPushButton, QMessageBox, QLabel, QProgressBar
 import pkg_resources
 
 
@@ -30,8 +32,16 @@ class MainWindow(QMainWindow):
     controller (MainWindowController): Controller for the view
     mainWidget (QWidget): Central widget containing all other widgets
     splitter (QSplitter): Frame that will contains widgets
+    statisticsLabel (QLabel): Statistics of the graph in the status bar
+    statisticsTimer (QTimer): Timer refreshing the statistics
+    statisticsInterval (int): Minimal time between two refreshes of the
+                              statistics (in milliseconds)
+    parseProgressBar (QProgressBar): Busy indicator shown while the text is
+                                     parsed
     '''
 
+    statisticsInterval = 250
+
     def __init__(self):
         # Parent constructor(s)
         QMainWindow.__init__(self)
@@ -49,6 +59,21 @@ class MainWindow(QMainWindow):
         # Status bar just for a test
         self.statusBar().showMessage("Double click to create a node")
 
+        # Statistics of the graph, refreshed at most once per interval
+        self.statisticsLabel = QLabel()
+        self.statusBar().addPermanentWidget(self.statisticsLabel)
+        self.statisticsTimer = QTimer(self)
+        self.statisticsTimer.timeout.connect(self.onRefreshStatistics)
+        self.statisticsTimer.start(MainWindow.statisticsInterval)
+
+        # Busy indicator of the parse of the text (no known progress)
+        self.parseProgressBar = QProgressBar()
+        self.parseProgressBar.setRange(0, 0)
+        self.parseProgressBar.setMaximumWidth(100)
+        self.parseProgressBar.setToolTip("Parsing the text")
+        self.parseProgressBar.hide()
+        self.statusBar().addPermanentWidget(self.parseProgressBar)
+
         # Layout/Splitter which will contain all widgets
         self.splitter = QSplitter(Qt.Horizontal)
         layout = QVBoxLayout(self.mainWidget)
@@ -69,6 +94,35 @@ class MainWindow(QMainWindow):
         saveAction = menuFile.addAction("Save")
         saveAction.triggered.connect(self.onSaveFile)
 
+        menuEdit = self.menuBar().addMenu("Edit")
+
+        undoAction = menuEdit.addAction("Undo")
+        undoAction.setShortcut(QKeySequence.Undo)
+        undoAction.triggered.connect(self.onUndo)
+
+        redoAction = menuEdit.addAction("Redo")
+        redoAction.setShortcut(QKeySequence.Redo)
+        redoAction.triggered.connect(self.onRedo)
+
+        liveSyncAction = menuEdit.addAction("Live synchronisation")
+        liveSyncAction.setCheckable(True)
+        liveSyncAction.toggled.connect(self.onLiveSync)
+
+        menuDebug = self.menuBar().addMenu("Debug")
+
+        profileAction = menuDebug.addAction("Profile observers")
+        profileAction.setCheckable(True)
+        profileAction.toggled.connect(self.onProfile)
+
+        showProfileAction = menuDebug.addAction("Show profile")
+        showProfileAction.triggered.connect(self.onShowProfile)
+
+        resetProfileAction = menuDebug.addAction("Reset profile")
+        resetProfileAction.triggered.connect(self.onResetProfile)
+
+        dumpProfileAction = menuDebug.addAction("Dump profile")
+        dumpProfileAction.triggered.connect(self.onDumpProfile)
+
         questionMarkMenu = self.menuBar().addMenu("?")
 
         helpAction = questionMarkMenu.addAction("Help")
@@ -77,6 +131,88 @@ class MainWindow(QMainWindow):
         aboutAction = questionMarkMenu.addAction("About")
         aboutAction.triggered.connect(self.onAboutAction)
 
+    def showStatistics(self, nbNodes, nbEdges, nbIsolatedNodes, density,
+                       degreeDistribution):
+        '''Show the statistics of the graph.
+
+        Argument(s):
+        nbNodes (int): Number of nodes
+        nbEdges (int): Number of edges
+        nbIsolatedNodes (int): Number of nodes without edge
+        density (float): Density of the graph
+        degreeDistribution (List[Tuple[int]]): Number of nodes of each degree
+        '''
+        self.statisticsLabel.setText(
+            "Nodes: {0}  Edges: {1}  Isolated: {2}  Density: {3:.4g}".format(
+                nbNodes, nbEdges, nbIsolatedNodes, density))
+        self.statisticsLabel.setToolTip(
+            "Degree: number of nodes\n" +
+            "\n".join("{0}: {1}".format(degree, count)
+                      for degree, count in degreeDistribution))
+
+    def showParsing(self, parsing):
+        '''Show or hide the busy indicator of the parse of the text.
+
+        Argument(s):
+        parsing (boolean): Text being parsed or not
+        '''
+        self.parseProgressBar.setVisible(parsing)
+
+    def showProfile(self, stats):
+        '''Show the time spent by the observers of the model.
+
+        Argument(s):
+        stats (Dictionary[Dictionary[Dictionary]]): Number of calls, total
+        time, median and 99th percentile (in milliseconds) indexed by observer
+        then by event
+        '''
+        lines = []
+        for observerName in sorted(stats):
+            lines.append(observerName)
+            for eventName, record in sorted(stats[observerName].items()):
+                lines.append(
+                    "    {0}: {1} calls, {2:.1f} ms, p50 {3:.3f} ms, p99 "
+                    "{4:.3f} ms".format(eventName, record["count"],
+                                        record["totalMs"], record["p50Ms"],
+                                        record["p99Ms"]))
+
+        QMessageBox.information(self, "Profile",
+                                "\n".join(lines) or "Nothing recorded.")
+
+    def onLiveSync(self, enabled):
+        '''Callback function when checking or unchecking Live
+        synchronisation.
+
+        Argument(s):
+        enabled (boolean): Action checked or not
+        '''
+        self.controller.onLiveSync(enabled)
+
+    def onProfile(self, enabled):
+        '''Callback function when checking or unchecking Profile observers.
+
+        Argument(s):
+        enabled (boolean): Action checked or not
+        '''
+        self.controller.onProfile(enabled)
+
+    def onShowProfile(self):
+        '''Callback function when clicking on Show profile.'''
+        self.controller.onShowProfile()
+
+    def onResetProfile(self):
+        '''Callback function when clicking on Reset profile.'''
+        self.controller.onResetProfile()
+
+    def onDumpProfile(self):
+        '''Callback function when clicking on Dump profile.'''
+        self.controller.onDumpProfile()
+
+    def onRefreshStatistics(self):
+        '''Callback function when the statistics must be refreshed.'''
+        if self.controller:
+            self.controller.onRefreshStatistics()
+
     def onClearGraph(self):
         '''Callback function when clicking on Clear graph button.'''
         self.controller.onClearGraph()
@@ -89,6 +225,14 @@ class MainWindow(QMainWindow):
         '''Callback function when clicking on Save.'''
         self.controller.onSaveFile()
 
+    def onUndo(self):
+        '''Callback function when clicking on Undo.'''
+        self.controller.onUndo()
+
+    def onRedo(self):
+        '''Callback function when clicking on Redo.'''
+        self.controller.onRedo()
+
     def onHelpAction(self):
         '''Callback function when clicking on Help.'''
         graphicsViewCommands = (
@@ -100,13 +244,19 @@ class MainWindow(QMainWindow):
             "Mutliple selection : CTRL + mouse click or use rubber band"
             " selection\n"
             "Zoom in/out : CTRL + wheel\n"
-            "Remove a node/edge : Press DEL key"
+            "Remove a node/edge : Press DEL key\n"
+            "Collapse the clusters of the selected nodes : Press - key\n"
+            "Expand all clusters : Press + key\n"
+            "Select the connected components of the selected nodes : Press C"
+            " key\n"
+            "Undo/Redo : CTRL + Z/CTRL + Y"
         )
 
         textualViewCommands = (
             "--Textual view--\n"
             "Zoom in/out : CTRL + wheel\n"
-            "Update : Click outside the view"
+            "Update : Click outside the view (or stop typing with Edit >"
+            " Live synchronisation)"
         )
 
         QMessageBox.information(self, "Help", graphicsViewCommands + "\n\n" +
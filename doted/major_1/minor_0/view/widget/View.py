@@ -36,50 +36,83 @@ class View(object):
         '''
         self.controller = controller
 
-    def addNode(self, dictArgsNode):
+    def addNode(self, argsNode):
         '''Add a node.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
         '''
         pass
 
-    def editNode(self, dictArgsNode):
+    def editNode(self, argsNode, changedAttrs=None):
         '''Edit a node.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
+        changedAttrs (FrozenSet[str]): Dot attributes changed (default None:
+        unknown, all of them may have changed)
         '''
         pass
 
-    def removeNode(self, dictArgsNode):
+    def removeNode(self, argsNode):
         '''Remove a node.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
         '''
         pass
 
-    def addEdge(self, dictArgsEdge):
+    def addEdge(self, argsEdge):
         '''Add an edge.
 
         Argument(s):
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        argsEdge (EdgeArgs): Arguments of the edge
         '''
         pass
 
-    def editEdge(self, dictArgsEdge):
+    def editEdge(self, argsEdge):
         '''Edit an edge.
 
         Argument(s):
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        argsEdge (EdgeArgs): Arguments of the edge
         '''
         pass
 
-    def removeEdge(self, dictArgsEdge):
+    def removeEdge(self, argsEdge):
         '''Remove an edge.
 
         Argument(s):
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        argsEdge (EdgeArgs): Arguments of the edge
         '''
         pass
+
+    def setItemsVisible(self, idNodes, idEdges, visible):
+        '''Hide or show nodes and edges.
+
+        Argument(s):
+        idNodes (Iterable[str]): IDs of the nodes
+        idEdges (Iterable[Tuple[str]]): IDs of the edges
+        visible (boolean): Items shown or hidden
+        '''
+        pass
+
+    def applyChanges(self, changeSet):
+        '''Apply a set of changes, one by one by default.
+
+        Argument(s):
+        changeSet (ChangeSet): Changes made during a batch
+        '''
+        for argsEdge in changeSet.getRemovedEdges():
+            self.removeEdge(argsEdge)
+        for argsNode in changeSet.getRemovedNodes():
+            self.removeNode(argsNode)
+        for argsNode in changeSet.getAddedNodes():
+            self.addNode(argsNode)
+        for argsNode in changeSet.getEditedNodes():
+            self.editNode(argsNode, changeSet.getChangedAttrs(argsNode.id))
+        for argsEdge in changeSet.getAddedEdges():
+            self.addEdge(argsEdge)
+        for argsEdge in changeSet.getEditedEdges():
+            self.editEdge(argsEdge)
+        for change in changeSet.getVisibilityChanges():
+            self.setItemsVisible(*change)
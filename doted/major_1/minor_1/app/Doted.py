@@ -23,6 +23,8 @@ from doted.major_1.minor_0.controller.MainWindowController import \
 from doted.major_1.minor_0.controller.TextGraphController import \
     TextGraphController
 from doted.major_1.minor_0.model.Graph import Graph
+from doted.major_1.minor_0.observer.QueuedDispatcher import QueuedDispatcher
+from doted.major_1.minor_0.utils.TextParseWorker import TextParseWorker
 from doted.major_1.minor_0.view.widget.MainWindow import MainWindow
 from doted.major_1.minor_1.view.widget.GraphicsGraphView import \
     GraphicsGraphView
@@ -33,6 +35,14 @@ class Doted(object):
     '''The Doted class provides a main application.
 
 
+    Argument(s):
+    compact (boolean): Use the compact model (CompactGraph) for very large
+                       graphs (default False)
+    queued (boolean): Notify the changes of the model once per tick of the
+                      event loop instead of at once (default False)
+    threaded (boolean): Parse the text on another thread instead of the GUI
+                        thread (default True)
+
     Attribute(s):
     model (Graph): Model representing the graph
     graphicsGraphView (GraphicsGraphView): Graphic view
@@ -43,13 +53,22 @@ class Doted(object):
     mainWindowController (MainWindowController): Application controller
     '''
 
-    def __init__(self):
+    def __init__(self, compact=False, queued=False, threaded=True):
         # Model
-        self.graphModel = Graph()
+        if compact:
+            # NumPy is only required by the compact model
+            from doted.major_1.minor_0.model.CompactGraph import CompactGraph
+            self.graphModel = CompactGraph()
+        else:
+            self.graphModel = Graph()
+        if queued:
+            self.graphModel.setDispatcher(QueuedDispatcher())
 
         # Views
         self.graphicsGraphView = GraphicsGraphView()
         self.textGraphView = TextGraphView()
+        if threaded:
+            self.textGraphView.setWorker(TextParseWorker())
 
         # Controllers
         self.textGraphController = TextGraphController(
@@ -20,7 +20,6 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor, QPen
 from PyQt5.QtWidgets import QColorDialog
 
-from doted.major_1.minor_0.enumeration.NodeArgs import NodeArgs
 from doted.major_1.minor_0.view.node.GraphicsNode import GraphicsNode as \
     GraphicsNodeV1_0
 from doted.major_1.minor_1.enumeration.NodeDotAttrs import NodeDotAttrs
@@ -43,28 +42,31 @@ class GraphicsNode(GraphicsNodeV1_0):
         editColorAction = self.contextMenu.addAction("Edit color")
         editColorAction.triggered.connect(self.onEditColor)
 
-    def edit(self, dictArgsNode):
-        '''Edit all attributes of the node.
+    def edit(self, argsNode, changedAttrs=None):
+        '''Edit the attributes of the node which changed.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
+        changedAttrs (FrozenSet[str]): Dot attributes changed (default None:
+        unknown, all of them are edited)
         '''
-        GraphicsNodeV1_0.edit(self, dictArgsNode)
-        self.editColor(dictArgsNode)
+        GraphicsNodeV1_0.edit(self, argsNode, changedAttrs)
+        if changedAttrs is None or NodeDotAttrs.color.value in changedAttrs:
+            self.editColor(argsNode)
 
-    def editColor(self, dictArgsNode):
+    def editColor(self, argsNode):
         '''Edit the color.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
         '''
         color = None
 
         # Check if color is defined
-        if (NodeDotAttrs.color.value in dictArgsNode[NodeArgs.dotAttrs] and
-                dictArgsNode[NodeArgs.dotAttrs][NodeDotAttrs.color.value]):
+        if (NodeDotAttrs.color.value in argsNode.dotAttrs and
+                argsNode.dotAttrs[NodeDotAttrs.color.value]):
             color = NodeDotColorUtils.getColor(
-                dictArgsNode[NodeArgs.dotAttrs][NodeDotAttrs.color.value])
+                argsNode.dotAttrs[NodeDotAttrs.color.value])
         # If not define, reset color to black
         else:
             color = QColor(Qt.black)
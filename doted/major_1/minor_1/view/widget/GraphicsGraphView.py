@@ -16,12 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
-from PyQt5.Qt import QEvent, Qt, QRectF, QTransform
+from PyQt5.Qt import QEvent, Qt, QRectF, QTransform, QTimer
 from PyQt5.QtGui import QPainter
 from PyQt5.QtWidgets import QGraphicsView, QGraphicsScene
 
-from doted.major_1.minor_0.enumeration.EdgeArgs import EdgeArgs
-from doted.major_1.minor_0.enumeration.NodeArgs import NodeArgs
 from doted.major_1.minor_0.view.edge.GraphicsEdge import GraphicsEdge
 from doted.major_1.minor_0.view.edge.GraphicsLineEdge import GraphicsLineEdge
 from doted.major_1.minor_1.view.node.GraphicsEllipseNode import \
@@ -40,9 +38,14 @@ class GraphicsGraphView(View, QGraphicsView):
     scene (QGraphicsScene): Scene to show items (nodes and edges)
     nodeHasBeenMoved (bool): Flag to check if a node has been moved
     factor (int): Used when enlarging/shrinking scene
+    highlightPending (bool): Selected items to highlight in textual view at
+    the next tick of the event loop
+    reindexThreshold (int): Minimal number of items added or removed at once
+    for which the scene rebuilds its index once instead of updating it
     '''
 
     factor = 2
+    reindexThreshold = 100
 
     def __init__(self):
         # Parent constructor(s)
@@ -52,6 +55,7 @@ class GraphicsGraphView(View, QGraphicsView):
         self.nodes = {}
         self.edges = {}
         self.nodeHasBeenMoved = False
+        self.highlightPending = False
 
         # Enable Antiliasing
         self.setRenderHint(QPainter.Antialiasing)
@@ -65,88 +69,160 @@ class GraphicsGraphView(View, QGraphicsView):
         self.setScene(self.scene)
         self.resetSceneRect()
         self.scene.installEventFilter(self)
+        self.scene.selectionChanged.connect(self.onSelectionChanged)
         self.show()
 
-    def addNode(self, dictArgsNode):
+    def addNode(self, argsNode):
         '''Add a node.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
         '''
         # Create the node
-        self.nodes[dictArgsNode[NodeArgs.id]] = GraphicsEllipseNode(
-            dictArgsNode[NodeArgs.id],
+        self.nodes[argsNode.id] = GraphicsEllipseNode(
+            argsNode.id,
             self)
         # Edit it
-        self.editNode(dictArgsNode)
+        self.editNode(argsNode)
 
         # Add it to the scene
-        self.scene.addItem(self.nodes[dictArgsNode[NodeArgs.id]])
+        self.scene.addItem(self.nodes[argsNode.id])
 
-    def editNode(self, dictArgsNode):
+    def editNode(self, argsNode, changedAttrs=None):
         '''Edit a node.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
+        changedAttrs (FrozenSet[str]): Dot attributes changed (default None:
+        unknown, all of them may have changed)
         '''
-        self.nodes[dictArgsNode[NodeArgs.id]].edit(dictArgsNode)
+        self.nodes[argsNode.id].edit(argsNode, changedAttrs)
 
-    def removeNode(self, dictArgsNode):
+    def removeNode(self, argsNode):
         '''Remove a node.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
         '''
         # Remove the node from the scene
-        self.scene.removeItem(self.nodes[dictArgsNode[NodeArgs.id]])
-        self.shrinkSceneRect(self.nodes[dictArgsNode[NodeArgs.id]])
-        self.nodes.pop(dictArgsNode[NodeArgs.id])
+        self.scene.removeItem(self.nodes[argsNode.id])
+        self.shrinkSceneRect([self.nodes[argsNode.id]])
+        self.nodes.pop(argsNode.id)
 
         # Reset scene rect
-        if not self.scene.items():
+        if not self.nodes:
             self.resetSceneRect()
 
-    def addEdge(self, dictArgsEdge):
+    def addEdge(self, argsEdge):
         '''Add an edge.
 
         Argument(s):
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        argsEdge (EdgeArgs): Arguments of the edge
         '''
         # Init source and dest nodes
-        source = self.nodes[dictArgsEdge[EdgeArgs.sourceId]]
-        dest = self.nodes[dictArgsEdge[EdgeArgs.destId]]
+        source = self.nodes[argsEdge.sourceId]
+        dest = self.nodes[argsEdge.destId]
 
         # Create the edge
-        self.edges[dictArgsEdge[EdgeArgs.id]] = GraphicsLineEdge(
+        self.edges[argsEdge.id] = GraphicsLineEdge(
             source,
             dest,
-            dictArgsEdge[EdgeArgs.id],
+            argsEdge.id,
             self
         )
 
         # Edit it
-        self.editEdge(dictArgsEdge)
+        self.editEdge(argsEdge)
 
         # Add edge to the scene
-        self.scene.addItem(self.edges[dictArgsEdge[EdgeArgs.id]])
+        self.scene.addItem(self.edges[argsEdge.id])
 
-    def editEdge(self, dictArgsEdge):
+    def editEdge(self, argsEdge):
         '''Edit an edge.
 
         Argument(s):
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        argsEdge (EdgeArgs): Arguments of the edge
         '''
-        self.edges[dictArgsEdge[EdgeArgs.id]].edit(dictArgsEdge)
+        self.edges[argsEdge.id].edit(argsEdge)
 
-    def removeEdge(self, dictArgsEdge):
+    def removeEdge(self, argsEdge):
         '''Remove an edge.
 
         Argument(s):
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        argsEdge (EdgeArgs): Arguments of the edge
         '''
         # Remove the edge from the scene
-        self.scene.removeItem(self.edges[dictArgsEdge[EdgeArgs.id]])
-        self.edges.pop(dictArgsEdge[EdgeArgs.id])
+        self.scene.removeItem(self.edges[argsEdge.id])
+        self.edges.pop(argsEdge.id)
+
+    def setItemsVisible(self, idNodes, idEdges, visible):
+        '''Hide or show nodes and edges.
+
+        Argument(s):
+        idNodes (Iterable[str]): IDs of the nodes
+        idEdges (Iterable[Tuple[str]]): IDs of the edges
+        visible (boolean): Items shown or hidden
+        '''
+        for idNode in idNodes:
+            self.nodes[idNode].setVisible(visible)
+        for idEdge in idEdges:
+            self.edges[idEdge].setVisible(visible)
+
+    def applyChanges(self, changeSet):
+        '''Apply a set of changes in one pass: the scene only indexes the items
+        and shrinks its rect once.
+
+        Argument(s):
+        changeSet (ChangeSet): Changes made during a batch
+        '''
+        removedEdges = changeSet.getRemovedEdges()
+        removedNodes = changeSet.getRemovedNodes()
+        addedNodes = changeSet.getAddedNodes()
+        addedEdges = changeSet.getAddedEdges()
+
+        # Do not index items while many of them are added or removed
+        reindex = (len(removedEdges) + len(removedNodes) + len(addedNodes) +
+                   len(addedEdges) >= GraphicsGraphView.reindexThreshold)
+        if reindex:
+            self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.setUpdatesEnabled(False)
+
+        for argsEdge in removedEdges:
+            self.removeEdge(argsEdge)
+
+        # Remove nodes from the scene
+        graphicsNodes = [self.nodes.pop(argsNode.id)
+                         for argsNode in removedNodes]
+        for graphicsNode in graphicsNodes:
+            self.scene.removeItem(graphicsNode)
+
+        for argsNode in addedNodes:
+            self.addNode(argsNode)
+        for argsNode in changeSet.getEditedNodes():
+            self.editNode(argsNode, changeSet.getChangedAttrs(argsNode.id))
+        for argsEdge in addedEdges:
+            self.addEdge(argsEdge)
+        for argsEdge in changeSet.getEditedEdges():
+            self.editEdge(argsEdge)
+
+        # The remaining nodes are known once the changes are applied
+        if graphicsNodes:
+            self.shrinkSceneRect(graphicsNodes)
+
+        # Items removed after being hidden or shown are ignored
+        for idNodes, idEdges, visible in changeSet.getVisibilityChanges():
+            self.setItemsVisible([idNode for idNode in idNodes
+                                  if idNode in self.nodes],
+                                 [idEdge for idEdge in idEdges
+                                  if idEdge in self.edges], visible)
+
+        # Reset scene rect
+        if not self.nodes:
+            self.resetSceneRect()
+
+        if reindex:
+            self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.setUpdatesEnabled(True)
 
     def updateEdgesOfNode(self, graphicsNode):
         '''Update each coordinates of each edges of the current node.
@@ -163,6 +239,22 @@ class GraphicsGraphView(View, QGraphicsView):
         '''Reset the scene rect with the viewport.'''
         self.scene.setSceneRect(QRectF(self.viewport().rect()))
 
+    def onSelectionChanged(self):
+        '''Callback function when the selection changes: the selected items
+        are highlighted once the selection stopped changing.'''
+        if not self.highlightPending:
+            self.highlightPending = True
+            QTimer.singleShot(0, self.highlightSelection)
+
+    def highlightSelection(self):
+        '''Send the selected nodes and edges to the controller to highlight
+        them in textual view.'''
+        self.highlightPending = False
+        if self.controller:
+            self.controller.onSelectItems(
+                [item.id for item in self.scene.selectedItems()
+                 if isinstance(item, (GraphicsNode, GraphicsEdge))])
+
     def eventFilter(self, source, event):
         '''Handle events for the scene.'''
         if source == self.scene:
@@ -189,14 +281,18 @@ class GraphicsGraphView(View, QGraphicsView):
                 nodes = [item for item in items if
                          isinstance(item, GraphicsNode)]
 
-                for node in nodes:
-                    # Update position
-                    node.onEditPos()
+                # Moved nodes are undone together
+                with self.controller.batch():
+                    for node in nodes:
+                        # Update position
+                        node.onEditPos()
 
-                    # Enlarge scene if outside
-                    if self.enlargeSceneRect(node):
-                        self.centerOn(node)
+                        # Enlarge scene if outside
+                        if self.enlargeSceneRect(node):
+                            self.centerOn(node)
 
+                # The next drag is undone separately
+                self.controller.onEndMove()
                 self.nodeHasBeenMoved = False
 
             # Left double click (mouse button)
@@ -216,18 +312,55 @@ class GraphicsGraphView(View, QGraphicsView):
                     # Get selected items (nodes/edges)
                     items = source.selectedItems()
 
-                    for item in items:
-                        # Remove node
-                        if (isinstance(item, GraphicsNode) and not
-                                item.graphicsTextNode.hasFocus()):
-                            self.controller.onRemoveNode(item.id)
-
-                        # Remove edge
-                        elif isinstance(item, GraphicsEdge):
-                            self.controller.onRemoveEdge(item.id)
+                    # Remove them together
+                    with self.controller.batch():
+                        for item in items:
+                            # Remove node
+                            if (isinstance(item, GraphicsNode) and not
+                                    item.graphicsTextNode.hasFocus()):
+                                self.controller.onRemoveNode(item.id)
+
+                            # Remove edge
+                            elif isinstance(item, GraphicsEdge):
+                                self.controller.onRemoveEdge(item.id)
+
+                # Collapse the clusters of the selected nodes (unless a label
+                # is edited)
+                elif (event.key() == Qt.Key_Minus and
+                      not source.focusItem()):
+                    self.controller.onCollapseClusters(
+                        [item.id for item in source.selectedItems()
+                         if isinstance(item, GraphicsNode)])
+
+                # Expand all clusters
+                elif event.key() == Qt.Key_Plus and not source.focusItem():
+                    self.controller.onExpandClusters()
+
+                # Select the connected components of the selected nodes
+                elif event.key() == Qt.Key_C and not source.focusItem():
+                    self.selectComponents(
+                        [item.id for item in source.selectedItems()
+                         if isinstance(item, GraphicsNode)])
 
         return False
 
+    def selectComponents(self, idNodes):
+        '''Select the nodes and the edges of the connected components of
+        nodes.
+
+        Argument(s):
+        idNodes (List[str]): IDs of the nodes
+        '''
+        # Queued nodes of the model are added before they are selected
+        self.controller.flush()
+
+        idComponentNodes = self.controller.getComponents(idNodes)
+        for idNode in idComponentNodes:
+            self.nodes[idNode].setSelected(True)
+        for edge in self.edges.values():
+            if edge.source.id in idComponentNodes:
+                edge.setSelected(True)
+
     def enlargeSceneRect(self, graphicsNode):
         '''Enlarge the scene rect if a node is outside the current scene rect.
 
@@ -275,60 +408,59 @@ class GraphicsGraphView(View, QGraphicsView):
 
         return sceneRectUpdated
 
-    def shrinkSceneRect(self, graphicsNode):
-        '''Shrink the scene rect if a node on the boundrary is removed.
+    def shrinkSceneRect(self, graphicsNodes):
+        '''Shrink the scene rect if nodes on the boundrary are removed.
 
         Argument(s):
-        graphicsNode (GraphicsNode): Current graphics node
+        graphicsNodes (List[GraphicsNode]): Removed graphics nodes
         '''
-        # Get nodes
-        items = self.scene.items()
-        nodes = [node for node in items if isinstance(node, GraphicsNode)]
+        # Get the nodes on the borders from the spatial index of the model
+        extremeNodes = self.controller.getExtremeNodes()
 
         # Get current scene rect to update its coordinates
         rect = self.sceneRect()
         sceneRectUpdated = False
 
-        if nodes:
-            # Case of removing a node on the min left border
-            minXPosNode = min(nodes, key=lambda node: node.pos().x())
-            if graphicsNode.pos().x() < minXPosNode.pos().x():
-                sceneRectUpdated = True
-                rect.setLeft(
-                    graphicsNode.x() +
-                    graphicsNode.boundingRect().left() *
-                    GraphicsGraphView.factor
-                )
-
-            # Case of removing a node on the max right border
-            maxXPosNode = max(nodes, key=lambda node: node.pos().x())
-            if graphicsNode.pos().x() > maxXPosNode.pos().x():
-                sceneRectUpdated = True
-                rect.setRight(
-                    maxXPosNode.x() +
-                    maxXPosNode.boundingRect().right() *
-                    GraphicsGraphView.factor
-                )
-
-            # Case of removing a node on the min top border
-            minYPosNode = min(nodes, key=lambda node: node.pos().y())
-            if graphicsNode.pos().y() < minYPosNode.pos().y():
-                sceneRectUpdated = True
-                rect.setTop(
-                    minYPosNode.y() +
-                    minYPosNode.boundingRect().top() *
-                    GraphicsGraphView.factor
-                )
-
-            # Case of removing a node on the max bottom border
-            maxYPosNode = max(nodes, key=lambda node: node.pos().y())
-            if graphicsNode.pos().y() > maxYPosNode.pos().y():
-                sceneRectUpdated = True
-                rect.setBottom(
-                    maxYPosNode.y() +
-                    maxYPosNode.boundingRect().bottom() *
-                    GraphicsGraphView.factor
-                )
+        if extremeNodes:
+            minXPosNode, minYPosNode, maxXPosNode, maxYPosNode = [
+                self.nodes[idNode] for idNode in extremeNodes]
+
+            for graphicsNode in graphicsNodes:
+                # Case of removing a node on the min left border
+                if graphicsNode.pos().x() < minXPosNode.pos().x():
+                    sceneRectUpdated = True
+                    rect.setLeft(
+                        graphicsNode.x() +
+                        graphicsNode.boundingRect().left() *
+                        GraphicsGraphView.factor
+                    )
+
+                # Case of removing a node on the max right border
+                if graphicsNode.pos().x() > maxXPosNode.pos().x():
+                    sceneRectUpdated = True
+                    rect.setRight(
+                        maxXPosNode.x() +
+                        maxXPosNode.boundingRect().right() *
+                        GraphicsGraphView.factor
+                    )
+
+                # Case of removing a node on the min top border
+                if graphicsNode.pos().y() < minYPosNode.pos().y():
+                    sceneRectUpdated = True
+                    rect.setTop(
+                        minYPosNode.y() +
+                        minYPosNode.boundingRect().top() *
+                        GraphicsGraphView.factor
+                    )
+
+                # Case of removing a node on the max bottom border
+                if graphicsNode.pos().y() > maxYPosNode.pos().y():
+                    sceneRectUpdated = True
+                    rect.setBottom(
+                        maxYPosNode.y() +
+                        maxYPosNode.boundingRect().bottom() *
+                        GraphicsGraphView.factor
+                    )
 
         if sceneRectUpdated:
             self.scene.setSceneRect(rect)
@@ -17,46 +17,137 @@
 # along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
 
 import re
+from collections import deque
 
 from pydot_ng import graph_from_dot_data
 
 from PyQt5.Qt import QMessageBox
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QTextCharFormat, QBrush, QColor, QTextCursor
-from PyQt5.QtWidgets import QTextEdit
+from PyQt5.QtCore import Qt, QTimer, QRect
+from PyQt5.QtGui import QBrush, QColor, QTextCursor, QPainter
+from PyQt5.QtWidgets import QPlainTextEdit, QTextEdit
 
-from doted.major_1.minor_0.enumeration.EdgeArgs import EdgeArgs
-from doted.major_1.minor_0.enumeration.NodeArgs import NodeArgs
+from doted.major_1.minor_0.model.EdgeArgs import EdgeArgs
+from doted.major_1.minor_0.model.NodeArgs import NodeArgs
 from doted.major_1.minor_1.utils.DotAttrsUtils import DotAttrsUtils
+from doted.major_1.minor_0.utils.DotParser import DotParser
+from doted.major_1.minor_0.utils.DotStatement import DotStatement
 from doted.major_1.minor_0.utils.EdgeUtils import EdgeUtils
+from doted.major_1.minor_0.utils.TextParseResult import TextParseResult
+from doted.major_1.minor_0.view.widget.LineNumberArea import LineNumberArea
 from doted.major_1.minor_0.view.widget.View import View
 
 
-class TextGraphView(View, QTextEdit):
+class TextGraphView(View, QPlainTextEdit):
     '''The TextGraphView class defines a text (dot file) representation of a
-    Graph.
+    Graph. The plain text layout only lays out the blocks (lines) shown, so
+    large texts stay editable.
 
     Attribute(s):
     nodes (Dictionary[Dictionary[]): Dict of Dict of attributes of nodes
     edges (Dictionary[Dictionary[]): Dict of Dict of attributes of edges
+    clusters (Dictionary[str]): Parent of each cluster (named subgraph), None
+    for a top-level cluster
+    nodeClusters (Dictionary[str]): Cluster of each node in a cluster
     graphName (str): Name of the graph
+    directed (boolean): Graph directed (digraph) or not (graph)
     acceptUpdate (bool): To avoid update during import
     checker (DotAttrsUtils): To check attributes of nodes and edges
+    spans (Dictionary[QTextCursor]): Cursor selecting the statement declaring
+    each node and edge, moved by the document when the text changes (None
+    when the text must be parsed again)
+    statements (List[List]): Cursor selecting each statement declaring nodes
+    or edges and the DotStatement parsed, in the order of the text
+    nodeDeclarations (Dictionary[int]): Number of statements declaring each
+    node
+    edgeDeclarations (Dictionary[int]): Number of statements declaring each
+    edge
+    dirtyCursor (QTextCursor): Cursor selecting the text changed by the user
+    since the last synchronisation with the model (None if unchanged)
+    writing (boolean): The view is writing the text (its changes are already
+    known by the model)
+    headCursor (QTextCursor): Cursor just after graph's {, where new
+    statements are written
+    worker (TextParseWorker): Worker parsing the whole text on another thread
+    (None to parse it on the GUI thread)
+    parseRevision (int): Revision of the document parsed by the worker
+    liveSync (boolean): Changed statements sent to the model while the user
+    types, or only when the view loses the focus
+    syncTimer (QTimer): Timer sending the changed statements once the user
+    stopped typing
+    syncInterval (int): Idle time before the changed statements are sent (in
+    milliseconds)
+    lineNumberArea (LineNumberArea): Gutter showing the number of the lines
     '''
 
+    syncInterval = 300
+
     def __init__(self):
         # Parent constructor(s)
         View.__init__(self)
-        QTextEdit.__init__(self)
+        QPlainTextEdit.__init__(self)
 
         self.acceptUpdate = True
         self.nodes = {}
         self.edges = {}
+        self.clusters = {}
+        self.nodeClusters = {}
         self.graphName = "my_graph"
-
-        self.textCursor().insertText("graph " + self.graphName + " {\n}")
+        self.directed = False
+        self.spans = {}
+        self.statements = []
+        self.nodeDeclarations = {}
+        self.edgeDeclarations = {}
+        self.dirtyCursor = None
+        self.writing = False
+        self.headCursor = None
+        self.worker = None
+        self.parseRevision = None
+        self.liveSync = False
+        self.syncTimer = QTimer(self)
+        self.syncTimer.setSingleShot(True)
+        self.syncTimer.timeout.connect(self.onSyncTimeout)
+
+        self.textCursor().insertText(EdgeUtils.graphType(self.directed) +
+                                     " " + self.graphName + " {\n}")
         self.checker = DotAttrsUtils()
 
+        self.document().contentsChange.connect(self.onContentsChange)
+
+        # Gutter, resized with the number of lines and scrolled with the text
+        self.lineNumberArea = LineNumberArea(self)
+        self.blockCountChanged.connect(self.updateLineNumberAreaWidth)
+        self.updateRequest.connect(self.updateLineNumberArea)
+        self.updateLineNumberAreaWidth()
+
+    def setWorker(self, worker):
+        '''Set a worker parsing the whole text on another thread.
+
+        Argument(s):
+        worker (TextParseWorker): Worker (None to parse on the GUI thread)
+        '''
+        if self.worker:
+            self.worker.parsed.disconnect(self.onParsed)
+            self.worker.failed.disconnect(self.onParseFailed)
+        self.worker = worker
+        if self.worker:
+            self.worker.parsed.connect(self.onParsed)
+            self.worker.failed.connect(self.onParseFailed)
+
+    def setLiveSync(self, enabled):
+        '''Enable or disable the synchronisation of the model while the user
+        types.
+
+        Argument(s):
+        enabled (boolean): Live synchronisation enabled or not
+        '''
+        self.liveSync = enabled
+        if not enabled:
+            self.syncTimer.stop()
+
+    def isParsing(self):
+        '''Return True if the text is being parsed on another thread.'''
+        return self.worker is not None and self.worker.isBusy()
+
     def wheelEvent(self, event):
         '''Handle wheel event.
 
@@ -69,47 +160,126 @@ class TextGraphView(View, QTextEdit):
                 self.zoomIn()
             else:
                 self.zoomOut()
+            self.updateLineNumberAreaWidth()
         # Move scrollbar
         else:
-            QTextEdit.wheelEvent(self, event)
+            QPlainTextEdit.wheelEvent(self, event)
+
+    def resizeEvent(self, event):
+        '''Handle resize event.
+
+        Argument(s):
+        event (QResizeEvent): Resize event
+        '''
+        QPlainTextEdit.resizeEvent(self, event)
+
+        rect = self.contentsRect()
+        self.lineNumberArea.setGeometry(QRect(rect.left(), rect.top(),
+                                              self.lineNumberAreaWidth(),
+                                              rect.height()))
+
+    def lineNumberAreaWidth(self):
+        '''Return the width of the gutter, enough for the number of the last
+        line.'''
+        digits = len(str(max(1, self.blockCount())))
+        return 6 + self.fontMetrics().width("9") * digits
+
+    def updateLineNumberAreaWidth(self, blockCount=None):
+        '''Keep room for the gutter on the left of the text.
+
+        Argument(s):
+        blockCount (int): Number of lines (default None)
+        '''
+        self.setViewportMargins(self.lineNumberAreaWidth(), 0, 0, 0)
+
+    def updateLineNumberArea(self, rect, dy):
+        '''Repaint or scroll the gutter with the text.
+
+        Argument(s):
+        rect (QRect): Area of the text to repaint
+        dy (int): Scroll of the text (in pixels)
+        '''
+        if dy:
+            self.lineNumberArea.scroll(0, dy)
+        else:
+            self.lineNumberArea.update(0, rect.y(),
+                                       self.lineNumberArea.width(),
+                                       rect.height())
+
+        if rect.contains(self.viewport().rect()):
+            self.updateLineNumberAreaWidth()
+
+    def paintLineNumbers(self, event):
+        '''Paint the number of the lines shown in the gutter.
+
+        Argument(s):
+        event (QPaintEvent): Paint event of the gutter
+        '''
+        painter = QPainter(self.lineNumberArea)
+        painter.fillRect(event.rect(), QColor(240, 240, 240))
+        painter.setPen(QColor(120, 120, 120))
+
+        # Only the blocks shown are visited
+        block = self.firstVisibleBlock()
+        top = self.blockBoundingGeometry(block).translated(
+            self.contentOffset()).top()
+        while block.isValid() and top <= event.rect().bottom():
+            bottom = top + self.blockBoundingRect(block).height()
+            if block.isVisible() and bottom >= event.rect().top():
+                painter.drawText(0, int(top), self.lineNumberArea.width() - 3,
+                                 self.fontMetrics().height(), Qt.AlignRight,
+                                 str(block.blockNumber() + 1))
+            block = block.next()
+            top = bottom
 
     def getText(self):
         '''Return the text of the view'''
         return self.toPlainText()
 
-    def addNode(self, dictArgsNode):
+    def addNode(self, argsNode):
         '''Add a node created in graphic view.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
         '''
         if self.acceptUpdate:
-            self.nodes[dictArgsNode[NodeArgs.id]] = \
-                dictArgsNode[NodeArgs.dotAttrs].copy()
+            # Dot attributes sent by the model are never modified in place
+            self.nodes[argsNode.id] = argsNode.dotAttrs
 
             # Write new node at the top just after graph's {
-            text = [e for e in self.toPlainText().split('{', 2) if e != ""]
-            self.setPlainText(text.pop(0) + "{\n" +
-                              self.strNode(dictArgsNode[NodeArgs.id]) +
-                              ''.join(text) + "\n")
+            self.writeStatements([argsNode.id])
 
-    def editNode(self, dictArgsNode):
+    def editNode(self, argsNode, changedAttrs=None):
         '''Edit a node changed in graphic view.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
+        changedAttrs (FrozenSet[str]): Dot attributes changed (default None:
+        unknown, all of them may have changed)
         '''
         if self.acceptUpdate:
-            attrs = [attr for attr in dictArgsNode[NodeArgs.dotAttrs]
-                     if dictArgsNode[NodeArgs.dotAttrs][attr]]
+            # Node only used by edges: declare it with its attributes
+            if not self.findPosItem(argsNode.id):
+                self.nodes[argsNode.id] = argsNode.dotAttrs
+                if any(argsNode.dotAttrs.values()):
+                    self.writeStatements([argsNode.id])
+                return
+
+            self.writing = True
+            attrs = [attr for attr in argsNode.dotAttrs
+                     if argsNode.dotAttrs[attr]]
             comma = ""
             # If node already have others attributes: mark comma to write
             if len(attrs) > 1:
                 comma = ", "
 
+            # Only rewrite the changed attributes
+            if changedAttrs is not None:
+                attrs = [attr for attr in attrs if attr in changedAttrs]
+
             for attr in attrs:
                 # Find node position in text
-                infoPos = self.findPosItem(dictArgsNode[NodeArgs.id])
+                infoPos = self.findPosItem(argsNode.id)
                 cursor = self.textCursor()
                 cursor.setPosition(infoPos[0], QTextCursor.MoveAnchor)
                 cursor.setPosition(infoPos[1], QTextCursor.KeepAnchor)
@@ -126,13 +296,13 @@ class TextGraphView(View, QTextEdit):
                                        QTextCursor.MoveAnchor)
 
                     # Find end position of attribute value and delete her
-                    attrs = self.nodes[dictArgsNode[NodeArgs.id]]
+                    attrs = self.nodes[argsNode.id]
                     cursor.setPosition(cursor.position() + len(attrs[attr]),
                                        QTextCursor.KeepAnchor)
                     cursor.removeSelectedText()
 
                     # Write new attribute's value
-                    cursor.insertText(dictArgsNode[NodeArgs.dotAttrs][attr])
+                    cursor.insertText(argsNode.dotAttrs[attr])
 
                 # If attribute not already exist: write all the attr
                 # decalration
@@ -145,87 +315,170 @@ class TextGraphView(View, QTextEdit):
                         cursor.insertText(
                             attr +
                             "=" +
-                            dictArgsNode[NodeArgs.dotAttrs][attr] +
+                            argsNode.dotAttrs[attr] +
                             comma
                         )
                     else:
-                        cursor.setPosition(infoPos[1] - 1,
-                                           QTextCursor.MoveAnchor)
+                        # Write the attribute before the semicolon
+                        if decNode.endswith(";"):
+                            cursor.setPosition(infoPos[1] - 1,
+                                               QTextCursor.MoveAnchor)
+                        else:
+                            cursor.setPosition(infoPos[1],
+                                               QTextCursor.MoveAnchor)
                         cursor.insertText(
                             " [" +
                             attr +
                             "=" +
-                            dictArgsNode[NodeArgs.dotAttrs][attr] +
+                            argsNode.dotAttrs[attr] +
                             "]"
                         )
 
             # Edit attributes values
-            self.nodes[dictArgsNode[NodeArgs.id]] = \
-                dictArgsNode[NodeArgs.dotAttrs].copy()
+            self.nodes[argsNode.id] = argsNode.dotAttrs
+            self.writing = False
 
-    def removeNode(self, dictArgsNode):
+    def removeNode(self, argsNode):
         '''Remove a node deleted in graphic view.
 
         Argument(s):
-        dictArgsNode (Dictionary[]): Dictionary of arguments of the node
+        argsNode (NodeArgs): Arguments of the node
         '''
         if self.acceptUpdate:
-            self.nodes.pop(dictArgsNode[NodeArgs.id])
+            self.nodes.pop(argsNode.id)
 
             # Find node position in text
-            infoPos = self.findPosItem(dictArgsNode[NodeArgs.id])
-            cursor = self.textCursor()
-            cursor.setPosition(infoPos[0], QTextCursor.MoveAnchor)
-            cursor.setPosition(infoPos[1], QTextCursor.KeepAnchor)
-            cursor.removeSelectedText()
+            self.removeStatement(self.findPosItem(argsNode.id))
 
-    def addEdge(self, dictArgsEdge):
+    def addEdge(self, argsEdge):
         '''Add an edge.
 
         Argument(s):
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        argsEdge (EdgeArgs): Arguments of the edge
         '''
-        idSource = dictArgsEdge[EdgeArgs.sourceId]
-        idDest = dictArgsEdge[EdgeArgs.destId]
+        idSource = argsEdge.sourceId
+        idDest = argsEdge.destId
 
         # If is an update from graphics view
         if self.acceptUpdate:
-            self.edges[dictArgsEdge[EdgeArgs.id]] = {
-                EdgeArgs.sourceId: idSource,
-                EdgeArgs.destId: idDest
-            }
+            self.edges[argsEdge.id] = argsEdge
 
             # Write new edge at the top just after graph's {
-            text = [e for e in self.toPlainText().split('{', 2) if e != ""]
-            self.setPlainText(text.pop(0) + "{\n" +
-                              self.strEdge(dictArgsEdge[EdgeArgs.id]) +
-                              ''.join(text) + "\n")
+            self.writeStatements([argsEdge.id])
 
         # If is an update from textual view
         else:
             # Add node source and dest if they don't exist
             self.acceptUpdate = True
             if idSource not in self.nodes:
-                self.addNode({NodeArgs.id: idSource, NodeArgs.dotAttrs: {}})
+                self.addNode(NodeArgs(idSource, {}, 0.0, 0.0))
             if idDest not in self.nodes:
-                self.addNode({NodeArgs.id: idDest, NodeArgs.dotAttrs: {}})
+                self.addNode(NodeArgs(idDest, {}, 0.0, 0.0))
             self.acceptUpdate = False
 
-    def removeEdge(self, dictArgsEdge):
+    def removeEdge(self, argsEdge):
         '''Remove an edge deleted in graphic view.
 
         Argument(s):
-        dictArgsEdge (Dictionary[]): Dictionary of arguments of the edge
+        argsEdge (EdgeArgs): Arguments of the edge
         '''
         if self.acceptUpdate:
-            self.edges.pop(dictArgsEdge[EdgeArgs.id])
+            self.edges.pop(argsEdge.id)
 
             # Find node position in text
-            infoPos = self.findPosItem(dictArgsEdge[EdgeArgs.id])
-            cursor = self.textCursor()
-            cursor.setPosition(infoPos[0], QTextCursor.MoveAnchor)
-            cursor.setPosition(infoPos[1], QTextCursor.KeepAnchor)
-            cursor.removeSelectedText()
+            self.removeStatement(self.findPosItem(argsEdge.id))
+
+    def applyChanges(self, changeSet):
+        '''Apply a set of changes: all new items are written in one pass.
+
+        Argument(s):
+        changeSet (ChangeSet): Changes made during a batch
+        '''
+        ids = []
+
+        # All changes are undone together
+        cursor = self.textCursor()
+        cursor.beginEditBlock()
+
+        # If is an update from graphics view
+        if self.acceptUpdate:
+            for argsEdge in changeSet.getRemovedEdges():
+                self.removeEdge(argsEdge)
+            for argsNode in changeSet.getRemovedNodes():
+                self.removeNode(argsNode)
+            for argsNode in changeSet.getEditedNodes():
+                self.editNode(argsNode,
+                              changeSet.getChangedAttrs(argsNode.id))
+
+            for argsNode in changeSet.getAddedNodes():
+                self.nodes[argsNode.id] = argsNode.dotAttrs
+                ids.append(argsNode.id)
+            for argsEdge in changeSet.getAddedEdges():
+                self.edges[argsEdge.id] = argsEdge
+                ids.append(argsEdge.id)
+
+        # If is an update from textual view
+        else:
+            # Add nodes source and dest if they don't exist
+            for argsEdge in changeSet.getAddedEdges():
+                for idNode in (argsEdge.sourceId, argsEdge.destId):
+                    if idNode not in self.nodes:
+                        self.nodes[idNode] = {}
+                        ids.append(idNode)
+
+        # Write new items at the top just after graph's {
+        if ids:
+            self.writeStatements(ids)
+
+        cursor.endEditBlock()
+
+    def writeStatements(self, ids):
+        '''Write the statements of items at the top of the graph just after
+        graph's {, in one insertion.
+
+        Argument(s):
+        ids (List[str or Tuple[str]]): IDs of the nodes and edges to write
+        '''
+        statements = [self.strEdge(id) if isinstance(id, tuple)
+                      else self.strNode(id) for id in ids]
+
+        # Find graph's { again if it was changed in the text
+        document = self.document()
+        if (self.headCursor is None or
+                document.characterAt(self.headCursor.position() - 1) != "{"):
+            self.headCursor = document.find("{")
+            if self.headCursor.isNull():
+                self.headCursor = QTextCursor(document)
+                self.headCursor.movePosition(QTextCursor.End)
+            self.headCursor.clearSelection()
+            # New statements are written before the previous ones
+            self.headCursor.setKeepPositionOnInsert(True)
+
+        # The anchor of the head cursor is moved by the insertions
+        cursor = QTextCursor(self.headCursor)
+        cursor.clearSelection()
+        cursor.setKeepPositionOnInsert(False)
+        self.writing = True
+        cursor.insertText("".join("\n" + s for s in statements))
+        self.writing = False
+
+        # Index the new statements
+        if self.spans is not None:
+            start = self.headCursor.position()
+            index = self.bisectStatements(start)
+            for id, s in zip(ids, statements):
+                start += 1
+                if isinstance(id, tuple):
+                    statement = DotStatement(start + len(s) - len(s.lstrip()),
+                                             start + len(s), None, {},
+                                             [self.edges[id]], None)
+                else:
+                    statement = DotStatement(start + len(s) - len(s.lstrip()),
+                                             start + len(s), id,
+                                             self.nodes[id], [], None)
+                self.addStatement(index, statement)
+                index += 1
+                start += len(s)
 
     def strNode(self, id):
         '''Build the dot string representation of a node.
@@ -262,87 +515,260 @@ class TextGraphView(View, QTextEdit):
         '''Build the dot string representation of an edge.
 
         Argument(s):
-        id (str): ID of the edge that we want to write
+        id (Tuple[str]): ID of the edge that we want to write
         '''
         e = self.edges[id]
         strEdge = ""
-        strEdge += "    " + e[EdgeArgs.sourceId] + "--" + e[EdgeArgs.destId]
+        strEdge += ("    " + e.sourceId +
+                    EdgeUtils.edgeOp(self.directed) + e.destId)
         strEdge += ";"
 
         return strEdge
 
     def findPosItem(self, id):
-        '''return index of start and end of the item's declaration
-
-        Argument(s):
-        id (str): ID of the item we want to find
-        '''
-        index = 0
-
-        text = self.toPlainText()
-        text = [e + '{' for e in text.split('{') if e != ""]
-        index += len(text[0]) + 1
-        text.pop(0)
-        text = ''.join(text)
-        text = [e + '}' for e in text.split('}') if e != ""]
-        text.pop(len(text) - 1)
-        stats = re.split(';', ''.join(text))
-
-        # Use pydot to get all statements of the graph (in order)
-        for s in stats:
-            # Parse current statement
-            pydotG = graph_from_dot_data("graph {" + s + "}")
-            if pydotG:
-                # Ignore subgraph
-                s2 = s
-                while (re.match("\s*(subgraph)*\s*.*\{", s2) or
-                       re.match("\s*\}.*", s2)):
-                    if re.match("\s*(subgraph)*\s*.*\{", s2):
-                        s2 = re.split('{', s2, 1)[1]
-                        pydotG = graph_from_dot_data("graph {" + s2 + "}")
-                    elif re.match("\s*\}.*", s2):
-                        s2 = re.split('}', s2, 1)[1]
-                        pydotG = graph_from_dot_data("graph {" + s2 + "}")
-
-                for node in pydotG.get_nodes():
-                    if node.get_name() == id:
-                        return([index, index + len(s)])
-
-                for edge in pydotG.get_edges():
-                    if EdgeUtils.createEdgeId(edge.get_source(),
-                                              edge.get_destination()) == id:
-                        return([index, index + len(s)])
-
-                index += len(s) + 1
+        '''return index of start and end of the item's declaration (None if
+        the item is not declared by a statement)
+
+        Argument(s):
+        id (str or Tuple[str]): ID of the item we want to find
+        '''
+        if self.spans is None:
+            self.indexStatements()
+
+        cursor = self.spans.get(id)
+
+        # The first statement declaring the item was removed: find the next one
+        if not cursor and (self.edgeDeclarations if isinstance(id, tuple)
+                           else self.nodeDeclarations).get(id):
+            for statementCursor, statement in self.statements:
+                if (statement.idNode == id or
+                        id in [argsEdge.id for argsEdge in statement.edges]):
+                    cursor = self.spans[id] = statementCursor
+                    break
+
+        if cursor:
+            return [cursor.selectionStart(), cursor.selectionEnd()]
+
+        return None
+
+    def indexStatements(self, statements=None):
+        '''Select the statements declaring items with cursors.
+
+        Argument(s):
+        statements (List[DotStatement]): Statements of the text (default None:
+        the text is parsed)
+        '''
+        if statements is None:
+            parser = DotParser(self.directed)
+            parser.parse(self.toPlainText())
+            statements = parser.statements
+
+        self.spans = {}
+        self.statements = []
+        self.nodeDeclarations = {}
+        self.edgeDeclarations = {}
+        for statement in statements:
+            self.addStatement(len(self.statements), statement)
+
+    def addStatement(self, index, statement):
+        '''Select a statement declaring items with a cursor and insert it in
+        the list of statements.
+
+        Argument(s):
+        index (int): Index of the statement in the list of statements
+        statement (DotStatement): Statement
+        '''
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(statement.start, QTextCursor.MoveAnchor)
+        cursor.setPosition(statement.end, QTextCursor.KeepAnchor)
+        self.statements.insert(index, [cursor, statement])
+
+        # The cursor of an item selects its first declaration
+        if statement.idNode:
+            self.nodeDeclarations[statement.idNode] = \
+                self.nodeDeclarations.get(statement.idNode, 0) + 1
+            ids = [statement.idNode]
+        else:
+            for argsEdge in statement.edges:
+                self.edgeDeclarations[argsEdge.id] = \
+                    self.edgeDeclarations.get(argsEdge.id, 0) + 1
+            ids = [argsEdge.id for argsEdge in statement.edges]
+        for id in ids:
+            if (id not in self.spans or
+                    self.spans[id].selectionStart() > statement.start):
+                self.spans[id] = cursor
+
+    def removeStatements(self, start, end):
+        '''Remove statements from the list of statements.
+
+        Argument(s):
+        start (int): Index of the first statement removed
+        end (int): Index after the last statement removed
+        '''
+        for cursor, statement in self.statements[start:end]:
+            if statement.idNode:
+                declarations = self.nodeDeclarations
+                ids = [statement.idNode]
+            else:
+                declarations = self.edgeDeclarations
+                ids = [argsEdge.id for argsEdge in statement.edges]
+
+            for id in ids:
+                declarations[id] -= 1
+                if not declarations[id]:
+                    declarations.pop(id)
+                if self.spans.get(id) is cursor:
+                    self.spans.pop(id)
+
+        del self.statements[start:end]
+
+    def bisectStatements(self, position, end=False):
+        '''Return the index of the first statement starting (or ending) at or
+        after a position.
+
+        Argument(s):
+        position (int): Position in the text
+        end (boolean): Compare the end of the statements (default False)
+        '''
+        low = 0
+        high = len(self.statements)
+        while low < high:
+            middle = (low + high) // 2
+            cursor = self.statements[middle][0]
+            if end:
+                middlePosition = cursor.selectionEnd()
+            else:
+                middlePosition = cursor.selectionStart()
+
+            if middlePosition < position:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def syncPendingText(self, id):
+        '''Send to the model the text changed by the user on the lines of the
+        declaration of an item, before the view rewrites them.
+
+        Argument(s):
+        id (str or Tuple[str]): ID of the node or of the edge
+        '''
+        infoPos = self.findPosItem(id)
+        if not infoPos or not self.dirtyCursor or self.isParsing():
+            return
+
+        document = self.document()
+        start = document.findBlock(infoPos[0]).position()
+        endBlock = document.findBlock(infoPos[1])
+        end = endBlock.position() + endBlock.length()
+        if (self.dirtyCursor.selectionStart() <= end and
+                self.dirtyCursor.selectionEnd() >= start and
+                not self.syncStatements()):
+            self.startParse(False)
+
+    def removeStatement(self, infoPos):
+        '''Remove the declaration of an item, with its line if nothing else is
+        written on it.
+
+        Argument(s):
+        infoPos (List[int]): Index of start and end of the declaration (None
+        if the item is not declared by a statement)
+        '''
+        if not infoPos:
+            return
+
+        # Only the lines of the declaration are read
+        start, end = infoPos
+        document = self.document()
+        startBlock = document.findBlock(start)
+        endBlock = document.findBlock(end)
+        if (not startBlock.text()[:start - startBlock.position()].strip() and
+                not endBlock.text()[end - endBlock.position():].strip()):
+            start = startBlock.position()
+            end = min(endBlock.position() + endBlock.length(),
+                      document.characterCount() - 1)
+
+        # Statements deleted by the user but not synchronised yet are kept
+        if self.spans is not None:
+            for index in reversed(range(self.bisectStatements(start),
+                                        self.bisectStatements(end))):
+                if self.statements[index][0].hasSelection():
+                    self.removeStatements(index, index + 1)
+
+        cursor = self.textCursor()
+        cursor.setPosition(start, QTextCursor.MoveAnchor)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        self.writing = True
+        cursor.removeSelectedText()
+        self.writing = False
+
+    def onContentsChange(self, position, charsRemoved, charsAdded):
+        '''Extend the range of the text changed by the user since the last
+        synchronisation.
+
+        Argument(s):
+        position (int): Position of the change
+        charsRemoved (int): Number of characters removed
+        charsAdded (int): Number of characters added
+        '''
+        if self.writing:
+            return
+
+        last = self.document().characterCount() - 1
+        start = min(position, last)
+        end = min(position + charsAdded, last)
+        if self.dirtyCursor:
+            start = min(start, self.dirtyCursor.selectionStart())
+            end = max(end, self.dirtyCursor.selectionEnd())
+        else:
+            self.dirtyCursor = QTextCursor(self.document())
+
+        self.dirtyCursor.setPosition(start, QTextCursor.MoveAnchor)
+        self.dirtyCursor.setPosition(end, QTextCursor.KeepAnchor)
+
+        # Each change postpones the live synchronisation
+        if self.liveSync:
+            self.syncTimer.start(TextGraphView.syncInterval)
+
+    def onSyncTimeout(self):
+        '''Send the statements changed while the user typed to the model. The
+        text is left as is if they cannot be parsed alone (e.g. a statement is
+        being typed): it is parsed when the view loses the focus.'''
+        if self.dirtyCursor and not self.isParsing():
+            # Queued changes of the model are written before the text is read
+            self.controller.flush()
+            self.syncStatements()
 
     def highlightItem(self, id):
         '''Inform the view that it must highlight an Item.
 
         Argument(s):
-        id (str): ID of the node we want to highlight
+        id (str or Tuple[str]): ID of the item we want to highlight
         '''
-        cursor = self.textCursor()
-        fmt = self.textCursor().charFormat()
+        self.highlightItems([id])
 
-        # Set BackgroundColor of all text in white
-        cursor.movePosition(QTextCursor.Start, QTextCursor.MoveAnchor)
-        cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
-        fmt.setBackground(QBrush(QColor(0, 0, 0, 0)))
-        cursor.mergeCharFormat(fmt)
+    def highlightItems(self, ids):
+        '''Highlight items (and only them) with extra selections, which change
+        neither the format of the text nor its undo history.
 
-        # Highlight item
-        infoPos = self.findPosItem(id)
-        cursor.setPosition(infoPos[0], QTextCursor.MoveAnchor)
-        cursor.setPosition(infoPos[1], QTextCursor.KeepAnchor)
-        # If subgraph in statement
-        if re.match("\s*(subgraph)*\s*.*\{", cursor.selectedText()):
-            indItem = cursor.selectedText().find(id)
-            cursor.setPosition(infoPos[0] + indItem, QTextCursor.MoveAnchor)
-            cursor.setPosition(infoPos[1], QTextCursor.KeepAnchor)
-        format = QTextCharFormat()
-        format.setBackground(QBrush(QColor(190, 180, 0, 80)))
-        cursor.mergeCharFormat(format)
-        self.setCurrentCharFormat(fmt)
+        Argument(s):
+        ids (List[str or Tuple[str]]): IDs of the items we want to highlight
+        '''
+        selections = []
+        for id in ids:
+            infoPos = self.findPosItem(id)
+            if infoPos:
+                selection = QTextEdit.ExtraSelection()
+                selection.cursor = QTextCursor(self.document())
+                selection.cursor.setPosition(infoPos[0],
+                                             QTextCursor.MoveAnchor)
+                selection.cursor.setPosition(infoPos[1],
+                                             QTextCursor.KeepAnchor)
+                selection.format.setBackground(QBrush(QColor(190, 180, 0,
+                                                             80)))
+                selections.append(selection)
+        self.setExtraSelections(selections)
 
     def checkItemsAttributes(self, nodes, edges):
         '''Return None if attributes of all items are in valid form, else an
@@ -364,39 +790,209 @@ class TextGraphView(View, QTextEdit):
 
         return None
 
-    def rebuildTextModel(self, text, pydotG):
-        '''rebuild self.nodes and self.edges from text.
+    def rebuildTextModel(self, result, pydotG):
+        '''Rebuild the items of a parse result from a pydot graph.
 
         Argument(s):
-        text (str): Textual representation of the graph
-        pydotGraph (PydotGraph): pydotGraph from text
+        result (TextParseResult): Result of the parse
+        pydotG (PydotGraph): pydotGraph from text
         '''
-        # Get name of the graph
-        self.graphName = pydotG.get_name()
+        # Get name and type of the graph
+        result.graphName = pydotG.get_name()
+        result.directed = pydotG.get_type() == EdgeUtils.graphType(True)
 
-        graphs = []
-        graphs.append(pydotG)
-        # Get all item in graph or subgraph
-        while len(graphs) > 0:
-            G = graphs[0]
+        # Get all item in graph or subgraph, with the cluster of the subgraph
+        # (the members of a subgraph also belong to its descendants, which are
+        # visited after it)
+        graphs = deque([(pydotG, None)])
+        while graphs:
+            G, idCluster = graphs.popleft()
 
             for node in G.get_nodes():
-                if node.get_name() not in self.nodes:
-                    self.nodes[node.get_name()] = node.get_attributes()
+                if node.get_name() not in result.nodes:
+                    result.nodes[node.get_name()] = node.get_attributes()
+                if idCluster:
+                    result.nodeClusters[node.get_name()] = idCluster
 
             for edge in G.get_edges():
                 idEdge = EdgeUtils.createEdgeId(edge.get_source(),
-                                                edge.get_destination())
-                if idEdge not in self.edges:
-                    self.edges[idEdge] = {
-                        EdgeArgs.sourceId: edge.get_source(),
-                        EdgeArgs.destId: edge.get_destination()
-                    }
+                                                edge.get_destination(),
+                                                result.directed)
+                if idEdge not in result.edges:
+                    result.edges[idEdge] = EdgeArgs(idEdge, edge.get_source(),
+                                                    edge.get_destination())
+                if idCluster:
+                    result.nodeClusters[edge.get_source()] = idCluster
+                    result.nodeClusters[edge.get_destination()] = idCluster
 
             for subG in G.get_subgraphs():
-                graphs.append(subG)
+                # Members of an anonymous subgraph belong to its parent
+                idSubCluster = subG.get_name() or idCluster
+                if subG.get_name() and subG.get_name() not in result.clusters:
+                    result.clusters[subG.get_name()] = idCluster
+                graphs.append((subG, idSubCluster))
+
+    def parseText(self, text, oldNodes, oldEdges, oldDirected, importing):
+        '''Parse a text and compare its items with the old ones. Return a
+        TextParseResult. May be called on another thread: the widget is not
+        used.
+
+        Argument(s):
+        text (str): Textual representation of the graph
+        oldNodes (Dictionary[Dictionary[]]): Old attributes of the nodes
+        oldEdges (Dictionary[EdgeArgs]): Old edges
+        oldDirected (boolean): Old type of the graph
+        importing (boolean): Parse of an imported text (not compared)
+        '''
+        # Create pydot graph from text
+        pydotGraph = graph_from_dot_data(text)
+        if not pydotGraph:
+            return TextParseResult(importing, "The dot structure is invalid.")
+
+        # Check that attributes are in valid form (an attribute without value
+        # cannot be checked)
+        try:
+            message = self.checkItemsAttributes(pydotGraph.get_nodes(),
+                                                pydotGraph.get_edges())
+        except TypeError as error:
+            message = "Invalid attribute: " + str(error)
+        if message:
+            return TextParseResult(importing, message)
+
+        result = TextParseResult(importing)
+        self.rebuildTextModel(result, pydotGraph)
+
+        parser = DotParser(result.directed)
+        parser.parse(text)
+        result.statements = parser.statements
+
+        if not importing:
+            # Graph type changed: compare edges with the IDs of the new type of
+            # graph
+            if result.directed != oldDirected:
+                oldEdges = {
+                    EdgeUtils.createEdgeId(args.sourceId, args.destId,
+                                           result.directed): args
+                    for args in oldEdges.values()
+                }
+            result.changes = self.diffItems(oldNodes, result.nodes, oldEdges,
+                                            result.edges)
+
+        return result
+
+    def startParse(self, importing):
+        '''Parse the whole text and send its changes to the model, on the
+        worker thread if any. Return False if the text is invalid.
+
+        Argument(s):
+        importing (boolean): Parse of an imported text
+        '''
+        args = (self.toPlainText(), dict(self.nodes), dict(self.edges),
+                self.directed, importing)
+        if self.worker:
+            self.parseRevision = self.document().revision()
+            self.worker.parse(self.parseText, *args)
+            return True
+
+        return self.applyParse(self.parseText(*args))
+
+    def onParsed(self, result):
+        '''Handle the result of a parse run by the worker.
+
+        Argument(s):
+        result (TextParseResult): Result of the parse
+        '''
+        # The text was changed during the parse: parse it again once the user
+        # left it
+        if self.document().revision() != self.parseRevision:
+            if result.importing or (self.dirtyCursor and not self.hasFocus()):
+                self.startParse(result.importing)
+            return
+
+        self.applyParse(result)
+
+    def onParseFailed(self, message):
+        '''Handle an error raised by a parse run by the worker.
+
+        Argument(s):
+        message (str): Error message
+        '''
+        QMessageBox.warning(self, "Syntax error", message)
 
-            graphs.pop(0)
+    def applyParse(self, result):
+        '''Apply the result of a parse of the whole text: send its changes to
+        the model, or show its error. Return False if the text is invalid.
+
+        Argument(s):
+        result (TextParseResult): Result of the parse
+        '''
+        # Some attributes are in invalid form or the pydot graph is invalid:
+        # show an error window
+        if result.message:
+            QMessageBox.warning(self, "Syntax error", result.message)
+            if not result.importing:
+                self.setFocus()
+            return False
+
+        self.acceptUpdate = False
+        oldDirected = self.directed
+        oldClusters = self.clusters
+        oldNodeClusters = self.nodeClusters
+        self.graphName = result.graphName
+        self.directed = result.directed
+        self.nodes = result.nodes
+        self.edges = result.edges
+        self.clusters = result.clusters
+        self.nodeClusters = result.nodeClusters
+        self.indexStatements(result.statements)
+        self.dirtyCursor = None
+
+        if result.importing:
+            self.controller.onSetDirected(self.directed)
+
+            # Send every elements to the model to build him
+            with self.controller.batch():
+                self.controller.onCreateNodes(self.nodes.items())
+                self.controller.onCreateEdges(
+                    (args.sourceId, args.destId)
+                    for args in self.edges.values()
+                )
+                self.controller.onCreateClusters(self.clusters.items(),
+                                                 self.nodeClusters.items())
+
+        else:
+            # Send changes to the model together
+            with self.controller.batch():
+                if self.directed != oldDirected:
+                    self.controller.onSetDirected(self.directed)
+
+                # Send the changes between old and new text to the model
+                self.sendChanges(result.changes, self.nodes, self.edges)
+
+                # Add or move clusters, parents first
+                for idCluster, idParentCluster in self.clusters.items():
+                    if idCluster not in oldClusters:
+                        self.controller.onCreateCluster(idCluster,
+                                                        idParentCluster)
+                    elif oldClusters[idCluster] != idParentCluster:
+                        self.controller.onMoveCluster(idCluster,
+                                                      idParentCluster)
+
+                # Move nodes whose cluster changed
+                for idNode, idCluster in self.nodeClusters.items():
+                    if oldNodeClusters.get(idNode) != idCluster:
+                        self.controller.onSetNodeCluster(idNode, idCluster)
+                for idNode in oldNodeClusters.keys() - \
+                        self.nodeClusters.keys():
+                    self.controller.onSetNodeCluster(idNode, None)
+
+                # Remove clusters deleted
+                for idCluster in oldClusters.keys() - self.clusters.keys():
+                    self.controller.onRemoveCluster(idCluster)
+
+        self.acceptUpdate = True
+
+        return True
 
     def importGraph(self, text):
         '''Init text after an import.
@@ -404,113 +1000,216 @@ class TextGraphView(View, QTextEdit):
         Argument(s):
         text (str): Textual representation of the graph
         '''
+        # Queued changes of the model are applied to the old text
+        self.controller.flush()
+
         self.acceptUpdate = False
         self.setPlainText(text)
+        self.acceptUpdate = True
+        self.spans = None
+
+        self.startParse(True)
+
+    def syncStatements(self):
+        '''Parse only the statements changed since the last synchronisation
+        and send their changes to the model. Return False if they cannot be
+        parsed alone (the whole text must be parsed).'''
+        if self.spans is None:
+            return False
+
+        # Statements touched by the changed text
+        start = self.dirtyCursor.selectionStart()
+        end = self.dirtyCursor.selectionEnd()
+        first = self.bisectStatements(start, True)
+        last = self.bisectStatements(end + 1)
+        if first < last:
+            start = min(start, self.statements[first][0].selectionStart())
+            end = max(end, self.statements[last - 1][0].selectionEnd())
+        statements = [statement for cursor, statement
+                      in self.statements[first:last]]
+
+        # The cluster of the changed text must be known: outside any cluster
+        if ((not statements and self.clusters) or
+                any(statement.idCluster for statement in statements)):
+            return False
+
+        # The changed text must start and end between two statements
+        document = self.document()
+        position = start - 1
+        while position >= 0 and document.characterAt(position).isspace():
+            position -= 1
+        if (position >= 0 and document.characterAt(position) not in "{};" and
+                (first == 0 or self.statements[first - 1][0].selectionEnd() !=
+                 position + 1)):
+            return False
+
+        position = end
+        while (position < document.characterCount() - 1 and
+               document.characterAt(position).isspace()):
+            position += 1
+        if document.characterAt(position) == ";":
+            end = position + 1
+        elif (position < document.characterCount() - 1 and
+              document.characterAt(position) != "}" and
+              (last == len(self.statements) or
+               self.statements[last][0].selectionStart() != position)):
+            return False
+
+        # Parse the changed statements, which must only declare nodes and edges
+        cursor = QTextCursor(document)
+        cursor.setPosition(start, QTextCursor.MoveAnchor)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        parser = DotParser(self.directed)
+        parser.parse(cursor.selection().toPlainText(), False)
+        if parser.nbErrors or parser.nbOtherStatements:
+            return False
+
+        # Check attributes
+        for statement in parser.statements:
+            if statement.edges:
+                message = self.checker.checkEdgeAttrsForm(statement.dotAttrs)
+            else:
+                message = self.checker.checkNodeAttrsForm(statement.dotAttrs)
+            if message:
+                return False
+
+        # Old and new items declared by the statements
+        oldNodes = {}
+        oldEdges = {}
+        for statement in statements:
+            if statement.idNode in self.nodes:
+                oldNodes[statement.idNode] = self.nodes[statement.idNode]
+            for argsEdge in statement.edges:
+                if argsEdge.id in self.edges:
+                    oldEdges[argsEdge.id] = self.edges[argsEdge.id]
+        nodes = {}
+        edges = {}
+        for statement in parser.statements:
+            if statement.idNode:
+                nodes.setdefault(statement.idNode, statement.dotAttrs)
+            for argsEdge in statement.edges:
+                edges.setdefault(argsEdge.id, argsEdge)
+
+        # The items must not be declared by other statements
+        nbDeclarations = {}
+        for statement in statements:
+            for id in ([statement.idNode] if statement.idNode else
+                       [argsEdge.id for argsEdge in statement.edges]):
+                nbDeclarations[id] = nbDeclarations.get(id, 0) + 1
+        for id in nodes.keys() | oldNodes.keys():
+            if self.nodeDeclarations.get(id, 0) != nbDeclarations.get(id, 0):
+                return False
+        for id in edges.keys() | oldEdges.keys():
+            if self.edgeDeclarations.get(id, 0) != nbDeclarations.get(id, 0):
+                return False
+
+        # Replace the statements
+        self.removeStatements(first, last)
+        for statement in parser.statements:
+            self.addStatement(first, statement._replace(
+                start=statement.start + start, end=statement.end + start))
+            first += 1
+        self.dirtyCursor = None
+
+        for idNode in oldNodes:
+            self.nodes.pop(idNode)
+        self.nodes.update(nodes)
+        for idEdge in oldEdges:
+            self.edges.pop(idEdge)
+        self.edges.update(edges)
 
-        pydotGraph = graph_from_dot_data(text)
+        self.acceptUpdate = False
+        with self.controller.batch():
+            self.sendChanges(self.diffItems(oldNodes, nodes, oldEdges, edges),
+                             nodes, edges)
+        self.acceptUpdate = True
 
-        # Check that attributes are in valid form
-        message = self.checkItemsAttributes(pydotGraph.get_nodes(),
-                                            pydotGraph.get_edges())
-        if not message:
-            self.rebuildTextModel(text, pydotGraph)
+        return True
 
-            # Send every elements to the model to build him
-            for id, args in self.nodes.items():
-                self.controller.onCreateNode(id, args)
-            for id, args in self.edges.items():
-                self.controller.onCreateEdge(args[EdgeArgs.sourceId],
-                                             args[EdgeArgs.destId])
+    def diffItems(self, oldNodes, nodes, oldEdges, edges):
+        '''Return the IDs of the nodes added, edited and removed, the edges
+        removed (EdgeArgs) and the IDs of the edges added between the old and
+        the new items of the text.
 
-        # Some attributes are in invalid form
-        else:
-            QMessageBox.warning(self, "Syntax error", message)
+        Argument(s):
+        oldNodes (Dictionary[Dictionary[]]): Old attributes of the nodes
+        nodes (Dictionary[Dictionary[]]): New attributes of the nodes
+        oldEdges (Dictionary[EdgeArgs]): Old edges
+        edges (Dictionary[EdgeArgs]): New edges
+        '''
+        addedNodes = list(nodes.keys() - oldNodes.keys())
+        editedNodes = [idNode for idNode in nodes.keys() & oldNodes.keys()
+                       if nodes[idNode] != oldNodes[idNode]]
+        removedNodes = list(oldNodes.keys() - nodes.keys())
+        removedEdges = [oldEdges[idEdge]
+                        for idEdge in oldEdges.keys() - edges.keys()]
+        addedEdges = list(edges.keys() - oldEdges.keys())
 
-        self.acceptUpdate = True
+        return [addedNodes, editedNodes, removedNodes, removedEdges,
+                addedEdges]
 
-    def focusOutEvent(self, event):
-        '''Handle focus out event.
+    def sendChanges(self, changes, nodes, edges):
+        '''Send to the model the changes between the old and the new items of
+        the text.
 
         Argument(s):
-        event (QFocusEvent): Focus event
+        changes (List[List]): Changes returned by diffItems
+        nodes (Dictionary[Dictionary[]]): New attributes of the nodes
+        edges (Dictionary[EdgeArgs]): New edges
         '''
-        self.acceptUpdate = False
+        addedNodes, editedNodes, removedNodes, removedEdges, addedEdges = \
+            changes
+
+        # Add nodes added
+        for idNode in addedNodes:
+            self.controller.onCreateNode(idNode, nodes[idNode])
+
+        # Edit nodes changed
+        for idNode in editedNodes:
+            self.controller.onEditNode(idNode, nodes[idNode])
+
+        # Remove nodes deleted
+        for idNode in removedNodes:
+            self.controller.onRemoveNode(idNode)
+
+            # Delete edges which contain the node
+            edgeToRemove = []
+            for edge in self.edges:
+                if (idNode == self.edges[edge].sourceId or
+                        idNode == self.edges[edge].destId):
+                    edgeToRemove.append(edge)
+            self.acceptUpdate = True
+            for edge in edgeToRemove:
+                self.removeEdge(self.edges[edge])
+                edges.pop(edge, None)
+            self.acceptUpdate = False
 
-        # Create pydot graph from text
-        pydotGraph = graph_from_dot_data(self.toPlainText())
+        # Remove edges deleted
+        for argsEdge in removedEdges:
+            self.controller.onRemoveEdge(argsEdge.sourceId, argsEdge.destId)
 
-        # If the pydot graph is valid we can rewrite the text and check changes
-        if pydotGraph:
-            # If attributes are in valid form
-            message = self.checkItemsAttributes(pydotGraph.get_nodes(),
-                                                pydotGraph.get_edges())
-            if not message:
-                oldNodes = self.nodes
-                oldEdges = self.edges
-                self.nodes = {}
-                self.edges = {}
-                self.rebuildTextModel(self.toPlainText(), pydotGraph)
-
-                # Compare old and new text and send changes to the model
-                # Add nodes added
-                added = self.nodes.keys() - oldNodes.keys()
-                for idNode in added:
-                    self.controller.onCreateNode(idNode, self.nodes[idNode])
-
-                # Edit nodes changed
-                intersect = set(self.nodes.keys()).intersection(
-                    set(oldNodes.keys()))
-                for idNode in intersect:
-                    if self.nodes[idNode] != oldNodes[idNode]:
-                        self.controller.onEditNode(idNode, self.nodes[idNode])
-
-                # Remove nodes deleted
-                removed = oldNodes.keys() - self.nodes.keys()
-                for idNode in removed:
-                    self.controller.onRemoveNode(idNode)
-
-                    # Delete edges which contain the node
-                    edgeToRemove = []
-                    for edge in self.edges:
-                        if (idNode == self.edges[edge][EdgeArgs.sourceId] or
-                                idNode == self.edges[edge][EdgeArgs.destId]):
-                            edgeToRemove.append(edge)
-                    self.acceptUpdate = True
-                    for edge in edgeToRemove:
-                        self.removeEdge({
-                            EdgeArgs.id: edge,
-                            EdgeArgs.sourceId:
-                            self.edges[edge][EdgeArgs.sourceId],
-                            EdgeArgs.destId:
-                            self.edges[edge][EdgeArgs.destId]
-                        })
-                    self.acceptUpdate = False
-
-                # Remove edges deleted
-                removed = oldEdges.keys() - self.edges.keys()
-                for idEdge in removed:
-                    self.controller.onRemoveEdge(
-                        oldEdges[idEdge][EdgeArgs.sourceId],
-                        oldEdges[idEdge][EdgeArgs.destId])
-
-                # Add edges added
-                added = self.edges.keys() - oldEdges.keys()
-                for idEdge in added:
-                    nodeSource = self.edges[idEdge][EdgeArgs.sourceId]
-                    nodeDest = self.edges[idEdge][EdgeArgs.destId]
-                    self.controller.onCreateEdge(nodeSource, nodeDest)
-
-                QTextEdit.focusOutEvent(self, event)
-
-            # Some attributes are in invalid form: show an error window
-            else:
-                QMessageBox.warning(self, "Syntax error", message)
-                self.setFocus()
+        # Add edges added (unless removed with their node)
+        for idEdge in addedEdges:
+            if idEdge in edges:
+                self.controller.onCreateEdge(edges[idEdge].sourceId,
+                                             edges[idEdge].destId)
 
-        # Pydot graph invalid: show an error window
-        else:
-            QMessageBox.warning(self, "Syntax error",
-                                "The dot structure is invalid.")
-            self.setFocus()
+    def focusOutEvent(self, event):
+        '''Handle focus out event.
 
-        self.acceptUpdate = True
+        Argument(s):
+        event (QFocusEvent): Focus event
+        '''
+        # Queued changes of the model are written before the text is read
+        self.controller.flush()
+
+        # Nothing to do if the text was not changed or is being parsed, and
+        # only the changed statements are parsed if they can be parsed alone
+        if (not self.dirtyCursor or self.isParsing() or
+                self.syncStatements()):
+            QPlainTextEdit.focusOutEvent(self, event)
+            return
+
+        # Parse the whole text (the window keeps the focus on an error)
+        if self.startParse(False):
+            QPlainTextEdit.focusOutEvent(self, event)
@@ -37,6 +37,10 @@ setup(
 
     install_requires=['pydot-ng'],
 
+    extras_require={
+        'compact': ['numpy'],
+    },
+
     include_package_data=True,
 
     package_data={'doted': ['ressources/*.txt']},
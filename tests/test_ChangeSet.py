@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+'''Tests of the collapsing of the changes buffered during a batch.'''
+
+import unittest
+
+from doted.major_1.minor_0.enumeration.UpdateModeView import UpdateModeView
+from doted.major_1.minor_0.model.EdgeArgs import EdgeArgs
+from doted.major_1.minor_0.model.NodeArgs import NodeArgs
+from doted.major_1.minor_0.observer.ChangeSet import ChangeSet
+
+
+class TestChangeSet(unittest.TestCase):
+    '''Tests of the changes left by ChangeSet.'''
+
+    def setUp(self):
+        self.changeSet = ChangeSet()
+
+    def addNodeChange(self, label, updateModeView, changedAttrs=None):
+        '''Add a change of the node "a".
+
+        Argument(s):
+        label (str): Label of the node
+        updateModeView (UpdateModeView): Update mode
+        changedAttrs (FrozenSet[str]): Dot attributes changed by an edit
+        (default None: unknown)
+        '''
+        self.changeSet.addChange(NodeArgs("a", {"label": label}, 0, 0), None,
+                                 updateModeView, changedAttrs)
+
+    def testAddThenRemoveIsEmpty(self):
+        self.addNodeChange("x", UpdateModeView.add)
+        self.addNodeChange("y", UpdateModeView.edit)
+        self.addNodeChange("y", UpdateModeView.remove)
+
+        self.assertEqual(self.changeSet.getChanges(), [])
+
+    def testAddThenEditIsAdd(self):
+        self.addNodeChange("x", UpdateModeView.add)
+        self.addNodeChange("y", UpdateModeView.edit, frozenset(["label"]))
+
+        [(argsNode, argsEdge, updateModeView, changedAttrs)] = \
+            self.changeSet.getChanges()
+        self.assertEqual(updateModeView, UpdateModeView.add)
+        self.assertEqual(argsNode.dotAttrs["label"], "y")
+
+    def testEditsMergeChangedAttrs(self):
+        self.addNodeChange("x", UpdateModeView.edit, frozenset(["label"]))
+        self.addNodeChange("y", UpdateModeView.edit, frozenset(["pos"]))
+
+        [(argsNode, argsEdge, updateModeView, changedAttrs)] = \
+            self.changeSet.getChanges()
+        self.assertEqual(updateModeView, UpdateModeView.edit)
+        self.assertEqual(changedAttrs, frozenset(["label", "pos"]))
+
+    def testUnknownChangedAttrs(self):
+        self.addNodeChange("x", UpdateModeView.edit, frozenset(["label"]))
+        self.addNodeChange("y", UpdateModeView.edit)
+
+        self.assertIsNone(self.changeSet.getChangedAttrs("a"))
+
+    def testRemoveThenAddIsSentAsBoth(self):
+        self.addNodeChange("x", UpdateModeView.remove)
+        self.addNodeChange("y", UpdateModeView.add)
+
+        self.assertEqual([(argsNode.dotAttrs["label"], updateModeView)
+                          for argsNode, argsEdge, updateModeView, changedAttrs
+                          in self.changeSet.getChanges()],
+                         [("x", UpdateModeView.remove),
+                          ("y", UpdateModeView.add)])
+
+    def testOrderOfChanges(self):
+        argsEdge = EdgeArgs(("a", "b"), "a", "b")
+        self.changeSet.addChange(None, argsEdge, UpdateModeView.add)
+        self.addNodeChange("x", UpdateModeView.add)
+        self.changeSet.addChange(NodeArgs("c", {}, 0, 0), None,
+                                 UpdateModeView.remove)
+
+        self.assertEqual([(argsNode and argsNode.id,
+                           argsEdge and argsEdge.id, updateModeView)
+                          for argsNode, argsEdge, updateModeView, changedAttrs
+                          in self.changeSet.getChanges()],
+                         [("c", None, UpdateModeView.remove),
+                          ("a", None, UpdateModeView.add),
+                          (None, ("a", "b"), UpdateModeView.add)])
+
+    def testLastVisibilityIsKept(self):
+        self.changeSet.addVisibilityChange(["a", "b"], [("a", "b")], False)
+        self.changeSet.addVisibilityChange(["a"], [], True)
+
+        self.assertEqual(self.changeSet.getVisibilityChanges(),
+                         [(["b"], [("a", "b")], False), (["a"], [], True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
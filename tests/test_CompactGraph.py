@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+'''Tests of the equivalence of CompactGraph with Graph.'''
+
+import random
+import unittest
+
+from doted.major_1.minor_0.model.Graph import Graph
+from doted.major_1.minor_0.observer.Observer import Observer
+
+try:
+    from doted.major_1.minor_0.model.CompactGraph import CompactGraph
+except ImportError:
+    # NumPy is only required by the compact model
+    CompactGraph = None
+
+
+class Recorder(Observer):
+    '''Observer recording the notifications of a graph.
+
+
+    Argument(s):
+    graph (Graph): Observed graph
+
+    Attribute(s):
+    notifications (List[Tuple]): Notifications
+    '''
+
+    def __init__(self, graph):
+        # Parent constructor(s)
+        Observer.__init__(self, graph)
+
+        self.notifications = []
+
+    def update(self, argsNode, argsEdge, updateModeView):
+        if argsNode:
+            self.notifications.append((updateModeView, argsNode.id,
+                                       getAttrs(argsNode), argsNode.x,
+                                       argsNode.y))
+        else:
+            self.notifications.append((updateModeView, argsEdge.id))
+
+
+def getAttrs(argsNode):
+    '''Return the dot attributes of a node without the removed ones.
+
+    Argument(s):
+    argsNode (NodeArgs): Arguments of the node
+    '''
+    return {attr: value for attr, value in argsNode.dotAttrs.items()
+            if value is not None}
+
+
+@unittest.skipIf(CompactGraph is None, "NumPy is not installed")
+class TestCompactGraph(unittest.TestCase):
+    '''Tests of the same changes applied to Graph and CompactGraph.'''
+
+    def setUp(self):
+        # Rebuild the incidence index often
+        self.maxPendingEdges = CompactGraph.maxPendingEdges
+        CompactGraph.maxPendingEdges = 4
+
+        self.graphs = [Graph(), CompactGraph()]
+        self.recorders = [Recorder(graph) for graph in self.graphs]
+
+    def tearDown(self):
+        CompactGraph.maxPendingEdges = self.maxPendingEdges
+
+    def apply(self, method, *args):
+        '''Call a method of both graphs.
+
+        Argument(s):
+        method (str): Name of the method
+        *args: Arguments of the method
+        '''
+        for graph in self.graphs:
+            getattr(graph, method)(*args)
+
+    def getState(self, graph):
+        '''Return the nodes, the edges and the incident edges of a graph.
+
+        Argument(s):
+        graph (Graph): Graph
+        '''
+        nodes = {argsNode.id: (getAttrs(argsNode), argsNode.x, argsNode.y)
+                 for argsNode in graph.getNodesArgs()}
+        edges = {argsEdge.id for argsEdge in graph.getEdgesArgs()}
+        incidentEdges = {idNode: sorted(argsEdge.id for argsEdge
+                                        in graph.getIncidentEdges(idNode))
+                         for idNode in nodes}
+
+        return nodes, edges, incidentEdges
+
+    def assertSameGraphs(self):
+        '''Check that both graphs have the same items and sent the same
+        notifications.'''
+        graph, compactGraph = self.graphs
+        self.assertEqual(self.getState(graph), self.getState(compactGraph))
+        self.assertEqual(self.recorders[0].notifications,
+                         self.recorders[1].notifications)
+
+    def testRandomChanges(self):
+        r = random.Random(0)
+        for i in range(1500):
+            idNode1, idNode2 = str(r.randrange(30)), str(r.randrange(30))
+            operation = r.random()
+            if operation < 0.35:
+                self.apply("addEdge", idNode1, idNode2)
+            elif operation < 0.5:
+                self.apply("addNode", r.choice([idNode1, None]),
+                           {"label": idNode2}, 1.0, 2.0)
+            elif operation < 0.6:
+                self.apply("removeNode", idNode1)
+            elif operation < 0.75:
+                self.apply("removeEdgeByIdNodes", idNode1, idNode2)
+            elif operation < 0.9:
+                self.apply("editNode", idNode1,
+                           {"pos": '"{0},2"'.format(idNode2), "color": None})
+            elif operation < 0.92:
+                self.apply("setDirected", not self.graphs[0].directed)
+            elif operation < 0.93:
+                self.apply("clear")
+            else:
+                self.apply("addEdges", [(idNode1, idNode2),
+                                        (idNode2, str(r.randrange(30)))])
+
+            if i % 50 == 0:
+                self.assertSameGraphs()
+        self.assertSameGraphs()
+
+    def testCompactionKeepsEdgeKeys(self):
+        self.apply("setDirected", True)
+        self.apply("addEdges", [(str(i), str(i + 1)) for i in range(20)])
+        self.apply("addEdges", [("1", "0"), ("2", "1")])
+
+        # Most of the edge slots are freed: the edges are packed
+        for i in range(2, 20):
+            self.apply("removeEdgeByIdNodes", str(i), str(i + 1))
+        self.assertSameGraphs()
+        self.assertEqual(self.graphs[1].nbEdgeSlots, 4)
+
+        # The packed keys still tell (s, d) from (d, s)
+        self.apply("removeEdgeByIdNodes", "0", "1")
+        self.assertTrue(self.graphs[1].edgeExists("1", "0"))
+        self.assertFalse(self.graphs[1].edgeExists("0", "1"))
+        self.assertSameGraphs()
+
+    def testNodeSlotIsReused(self):
+        self.apply("addNode", "a", {"label": "x"}, 1.0, 2.0)
+        self.apply("addNode", "b", {"color": "red"}, 3.0, 4.0)
+        self.apply("addEdges", [("a", "b"), ("b", "b")])
+        slot = self.graphs[1].nodeIndices["b"]
+
+        self.apply("removeNode", "b")
+        self.apply("addNode", "c", {}, 5.0, 6.0)
+        self.assertEqual(self.graphs[1].nodeIndices["c"], slot)
+
+        # The new node has none of the edges and attributes of the old one
+        self.assertFalse(self.graphs[1].edgeExists("a", "c"))
+        self.assertFalse(self.graphs[1].edgeExists("c", "c"))
+        self.assertSameGraphs()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+'''Tests of the connected components tracked by ComponentTracker.'''
+
+import random
+import unittest
+
+from doted.major_1.minor_0.model.Graph import Graph
+
+
+class TestComponentTracker(unittest.TestCase):
+    '''Tests of the connected components of a graph against a breadth-first
+    search.'''
+
+    def setUp(self):
+        self.graph = Graph()
+        self.graph.addEdges([("a", "b"), ("b", "c"), ("c", "d"), ("e", "f")])
+
+        # The tracker is built before the changes
+        self.graph.getNbComponents()
+
+    def getComponents(self):
+        '''Return the connected components of the graph found by a
+        breadth-first search.'''
+        neighbours = {idNode: set() for idNode in self.graph.nodes}
+        for idSourceNode, idDestNode in self.graph.edges:
+            neighbours[idSourceNode].add(idDestNode)
+            neighbours[idDestNode].add(idSourceNode)
+
+        components = []
+        visited = set()
+        for idNode in neighbours:
+            if idNode not in visited:
+                component = {idNode}
+                queue = [idNode]
+                for idCurrentNode in queue:
+                    for idNeighbour in neighbours[idCurrentNode]:
+                        if idNeighbour not in component:
+                            component.add(idNeighbour)
+                            queue.append(idNeighbour)
+                visited |= component
+                components.append(component)
+
+        return components
+
+    def assertComponentsMatchSearch(self):
+        '''Check the components of the graph against a breadth-first
+        search.'''
+        components = self.getComponents()
+        self.assertEqual(self.graph.getNbComponents(), len(components))
+
+        for component in components:
+            for idNode in component:
+                self.assertEqual(set(self.graph.getComponent(idNode)),
+                                 component)
+        for idNode1 in self.graph.nodes:
+            for idNode2 in self.graph.nodes:
+                self.assertEqual(self.graph.areConnected(idNode1, idNode2),
+                                 any(idNode1 in component and
+                                     idNode2 in component
+                                     for component in components))
+
+    def testAdd(self):
+        self.assertComponentsMatchSearch()
+        self.assertEqual(self.graph.getNbComponents(), 2)
+
+    def testRemoveEdgeSplitsComponent(self):
+        self.graph.removeEdgeByIdNodes("b", "c")
+
+        self.assertEqual(self.graph.getNbComponents(), 3)
+        self.assertFalse(self.graph.areConnected("a", "d"))
+        self.assertTrue(self.graph.areConnected("c", "d"))
+        self.assertComponentsMatchSearch()
+
+    def testRemoveEdgeOfCycle(self):
+        self.graph.addEdge("d", "a")
+        self.graph.removeEdgeByIdNodes("b", "c")
+
+        self.assertEqual(self.graph.getNbComponents(), 2)
+        self.assertTrue(self.graph.areConnected("b", "c"))
+        self.assertComponentsMatchSearch()
+
+    def testRemoveNode(self):
+        self.graph.removeNode("b")
+
+        self.assertFalse(self.graph.areConnected("a", "c"))
+        self.assertFalse(self.graph.areConnected("b", "b"))
+        self.assertComponentsMatchSearch()
+
+    def testRandomChanges(self):
+        r = random.Random(0)
+        for i in range(300):
+            idNode1, idNode2 = str(r.randrange(40)), str(r.randrange(40))
+            operation = r.random()
+            if operation < 0.5:
+                self.graph.addEdge(idNode1, idNode2)
+            elif operation < 0.9:
+                self.graph.removeEdgeByIdNodes(idNode1, idNode2)
+            else:
+                self.graph.removeNode(idNode1)
+
+            if i % 30 == 0:
+                self.assertComponentsMatchSearch()
+        self.assertComponentsMatchSearch()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+'''Tests of the copies of CopyOnWriteDict and of the snapshots of a graph.'''
+
+import unittest
+
+from doted.major_1.minor_0.model.CopyOnWriteDict import CopyOnWriteDict
+from doted.major_1.minor_0.model.Graph import Graph
+
+
+def getNodes(root):
+    '''Return the nodes of a trie.
+
+    Argument(s):
+    root (List): Root node of the trie
+    '''
+    nodes = [root]
+    for node in nodes:
+        if isinstance(node[1], list):
+            nodes.extend(child for child in node[1] if child is not None)
+
+    return nodes
+
+
+class TestCopyOnWriteDict(unittest.TestCase):
+    '''Tests of the nodes shared by the copies of CopyOnWriteDict.'''
+
+    def setUp(self):
+        self.records = CopyOnWriteDict()
+        for i in range(10000):
+            self.records.set(i, str(i))
+
+    def testCopyIsUnchangedByEdits(self):
+        copy = self.records.copy()
+        self.records.set(0, "x")
+        self.records.set(10000, "y")
+        self.records.remove(1)
+
+        self.assertEqual(dict(copy.items()),
+                         {i: str(i) for i in range(10000)})
+        self.assertEqual(len(self.records), 10000)
+        self.assertEqual((self.records[0], self.records[10000]), ("x", "y"))
+        self.assertNotIn(1, self.records)
+
+    def testOnlyTheTouchedPathIsCopied(self):
+        copy = self.records.copy()
+        sharedNodes = {id(node) for node in getNodes(copy.root)}
+        self.records.set(0, "x")
+
+        copiedNodes = [node for node in getNodes(self.records.root)
+                       if id(node) not in sharedNodes]
+        self.assertGreater(len(copiedNodes), 1)
+        self.assertLess(len(copiedNodes), 5)
+        # The copied nodes are the path of the key, from the root to its leaf
+        for parent, child in zip(copiedNodes, copiedNodes[1:]):
+            self.assertTrue(any(node is child for node in parent[1]))
+        self.assertIn(0, copiedNodes[-1][1])
+        self.assertLessEqual(len(copiedNodes[-1][1]),
+                             CopyOnWriteDict.maxLeafSize)
+
+        # The next changes of the same key are made in place
+        self.records.set(0, "y")
+        self.assertEqual(len(getNodes(self.records.root)),
+                         len(getNodes(copy.root)))
+
+
+class TestGraphSnapshot(unittest.TestCase):
+    '''Tests of the snapshots of a graph.'''
+
+    def testSnapshotIsUnchangedByEdits(self):
+        graph = Graph()
+        graph.addNode("a", {"label": "x"}, 0, 0)
+        graph.addNode("b", {}, 0, 0)
+        graph.addEdge("a", "b")
+        snapshot = graph.snapshot()
+
+        graph.editNode("a", {"label": "y"})
+        graph.removeNode("b")
+        graph.addNode("c", {}, 0, 0)
+
+        self.assertEqual(set(snapshot.nodes), {"a", "b"})
+        self.assertEqual(snapshot.nodes["a"].dotAttrs["label"], "x")
+        self.assertEqual(list(snapshot.edges), [("a", "b")])
+        self.assertEqual(set(graph.snapshot().nodes), {"a", "c"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+'''Tests of the spans of the statements found by DotParser.'''
+
+import unittest
+
+from doted.major_1.minor_0.utils.DotParser import DotParser
+
+
+class TestDotParser(unittest.TestCase):
+    '''Tests of the statements and spans recorded by DotParser.'''
+
+    def setUp(self):
+        self.parser = DotParser()
+
+    def getTexts(self, text):
+        '''Parse a text and return the text of each statement.
+
+        Argument(s):
+        text (str): Dot text
+        '''
+        self.parser.parse(text)
+        return [text[statement.start:statement.end]
+                for statement in self.parser.statements]
+
+    def testSpans(self):
+        text = "graph g {\n    a [label=x];\n    b\n    a -- b -- c;\n}"
+
+        self.assertEqual(self.getTexts(text),
+                         ["a [label=x];", "b", "a -- b -- c;"])
+        self.assertEqual(self.parser.nbErrors, 0)
+
+    def testNodeAndEdgeSpans(self):
+        text = "graph g {\n    a;\n    a -- b;\n    a [color=red];\n}"
+        self.parser.parse(text)
+
+        start, end = self.parser.nodeSpans["a"]
+        self.assertEqual(text[start:end], "a;")
+        start, end = self.parser.edgeSpans[("a", "b")]
+        self.assertEqual(text[start:end], "a -- b;")
+
+    def testStatementAttributes(self):
+        self.parser.parse('digraph { a [label="x y"]; a -> b -> c; }')
+        nodeStatement, edgeStatement = self.parser.statements
+
+        self.assertTrue(self.parser.directed)
+        self.assertEqual(nodeStatement.idNode, "a")
+        self.assertEqual(nodeStatement.dotAttrs, {"label": '"x y"'})
+        self.assertEqual([argsEdge.id for argsEdge in edgeStatement.edges],
+                         [("a", "b"), ("b", "c")])
+
+    def testClusters(self):
+        text = "graph g {\n    subgraph cluster_1 { d; }\n    e;\n}"
+        self.parser.parse(text)
+
+        self.assertEqual([(statement.idNode, statement.idCluster)
+                          for statement in self.parser.statements],
+                         [("d", "cluster_1"), ("e", None)])
+        self.assertEqual(self.parser.nbOtherStatements, 1)
+
+    def testCommentsAndStrings(self):
+        text = 'graph g {\n    // a;\n    "b;c" [label="d;"];\n}'
+
+        self.assertEqual(self.getTexts(text), ['"b;c" [label="d;"];'])
+
+    def testStatementsWithoutHeader(self):
+        self.parser.parse("a; b -- c;", False)
+
+        self.assertEqual(len(self.parser.statements), 2)
+        self.assertEqual(self.parser.nbErrors, 0)
+
+    def testErrors(self):
+        self.parser.parse("graph g {\n    a -- ;\n")
+
+        self.assertTrue(self.parser.nbErrors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+'''Tests of the counters of GraphStatistics.'''
+
+import unittest
+
+from doted.major_1.minor_0.model.Graph import Graph
+from doted.major_1.minor_0.model.GraphStatistics import GraphStatistics
+
+
+class TestGraphStatistics(unittest.TestCase):
+    '''Tests of the counters of GraphStatistics against the graph.'''
+
+    def setUp(self):
+        self.graph = Graph()
+        self.statistics = GraphStatistics(self.graph)
+        for idNode in "abcd":
+            self.graph.addNode(idNode)
+        self.graph.addEdges([("a", "b"), ("b", "c"), ("c", "a")])
+
+    def assertCountersMatchGraph(self):
+        '''Check the counters against the items of the graph.'''
+        degrees = dict.fromkeys(self.graph.nodes, 0)
+        for idSourceNode, idDestNode in self.graph.edges:
+            degrees[idSourceNode] += 1
+            degrees[idDestNode] += 1
+        degreeCounts = {}
+        for degree in degrees.values():
+            degreeCounts[degree] = degreeCounts.get(degree, 0) + 1
+
+        self.assertEqual(self.statistics.nbNodes, len(self.graph.nodes))
+        self.assertEqual(self.statistics.nbEdges, len(self.graph.edges))
+        self.assertEqual(self.statistics.getDegreeDistribution(),
+                         sorted(degreeCounts.items()))
+
+    def testAdd(self):
+        self.assertCountersMatchGraph()
+        self.assertEqual(self.statistics.getNbIsolatedNodes(), 1)
+        self.assertEqual(self.statistics.getDensity(), 0.5)
+
+    def testRemove(self):
+        self.graph.removeNode("a")
+        self.assertCountersMatchGraph()
+        self.assertEqual(self.statistics.getNbIsolatedNodes(), 1)
+
+        self.graph.removeEdgeByIdNodes("b", "c")
+        self.assertCountersMatchGraph()
+        self.assertEqual(self.statistics.getNbIsolatedNodes(), 3)
+
+    def testUndo(self):
+        self.graph.removeNode("a")
+        self.graph.undo()
+        self.assertCountersMatchGraph()
+        self.assertEqual(self.statistics.getDensity(), 0.5)
+
+        self.graph.undo()
+        self.assertCountersMatchGraph()
+        self.assertEqual(self.statistics.nbEdges, 0)
+
+    def testLoopsAreNotCountedInDensity(self):
+        self.graph.addEdges([("a", "a"), ("a", "d"), ("b", "d"), ("c", "d"),
+                             ("d", "d")])
+        self.assertCountersMatchGraph()
+        self.assertEqual(self.statistics.getDensity(), 1.0)
+
+        self.graph.removeEdgeByIdNodes("d", "d")
+        self.assertEqual(self.statistics.nbLoops, 1)
+        self.assertEqual(self.statistics.getDensity(), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
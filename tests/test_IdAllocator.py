@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+'''Tests of the IDs given by IdAllocator to the nodes created without ID.'''
+
+import unittest
+
+from doted.major_1.minor_0.model.Graph import Graph
+from doted.major_1.minor_0.model.IdAllocator import IdAllocator
+
+
+class TestIdAllocator(unittest.TestCase):
+    '''Tests of the freed and highest IDs of IdAllocator.'''
+
+    def setUp(self):
+        self.allocator = IdAllocator()
+        for id in ["1", "2", "3", "4", "5"]:
+            self.allocator.addId(id)
+
+    def testFreedIdsAreReusedLowestFirst(self):
+        self.allocator.removeId("4")
+        self.allocator.removeId("2")
+
+        self.assertEqual(self.allocator.getFreeId(), "2")
+        self.allocator.addId("2")
+        self.assertEqual(self.allocator.getFreeId(), "4")
+        self.allocator.addId("4")
+        self.assertEqual(self.allocator.getFreeId(), "6")
+
+    def testExplicitAddSkipsFreedId(self):
+        self.allocator.removeId("1")
+        self.allocator.removeId("2")
+        self.allocator.addId("1")
+
+        self.assertEqual(self.allocator.getFreeId(), "2")
+
+        # A freed ID can be freed again after its explicit add
+        self.allocator.removeId("1")
+        self.assertEqual(self.allocator.getFreeId(), "1")
+
+    def testHighestId(self):
+        self.allocator.addId("10")
+        self.assertEqual(self.allocator.highestId, 10)
+        self.assertEqual(self.allocator.getFreeId(), "11")
+
+        # Lower and non numeric IDs do not change it
+        for id in ["7", "a", "08", "0", "-12"]:
+            self.allocator.addId(id)
+        self.assertEqual(self.allocator.highestId, 10)
+
+        self.allocator.removeId("10")
+        self.assertEqual(self.allocator.getFreeId(), "10")
+        self.allocator.addId("10")
+        self.allocator.addId("11")
+        self.assertEqual(self.allocator.highestId, 11)
+        self.assertEqual(self.allocator.getFreeId(), "12")
+
+    def testNodesCreatedWithoutId(self):
+        graph = Graph()
+        for i in range(3):
+            graph.addNode(None)
+        graph.removeNode("2")
+        graph.addNode(None)
+        graph.addNode("4")
+        graph.addNode(None)
+
+        self.assertEqual(set(graph.nodes), {"1", "2", "3", "4", "5"})
+
+        # The IDs start again from 1 when the graph is empty
+        for idNode in list(graph.nodes):
+            graph.removeNode(idNode)
+        graph.addNode(None)
+        self.assertEqual(set(graph.nodes), {"1"})
+
+
+if __name__ == "__main__":
+    unittest.main()
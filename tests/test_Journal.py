@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+'''Tests of the undo/redo journal of the graph.'''
+
+import unittest
+
+from doted.major_1.minor_0.model.Graph import Graph
+
+
+class TestJournal(unittest.TestCase):
+    '''Tests of Journal through the methods of Graph.'''
+
+    def setUp(self):
+        self.graph = Graph()
+        self.graph.addNode("a", {}, 0, 0)
+
+    def moveNode(self, x, y):
+        '''Move the node "a" like a step of a drag.
+
+        Argument(s):
+        x (float): x coordinate of the node
+        y (float): y coordinate of the node
+        '''
+        self.graph.editNode("a", {"pos": '"{0},{1}"'.format(x, y)})
+
+    def getPos(self):
+        '''Return the coordinates of the node "a".'''
+        node = self.graph.nodes["a"]
+        return (node.x, node.y)
+
+    def testUndoRedoAddEdge(self):
+        self.graph.addEdge("b", "c")
+
+        self.graph.undo()
+        self.assertEqual(set(self.graph.nodes), {"a"})
+        self.assertEqual(self.graph.edges, {})
+        self.graph.redo()
+        self.assertEqual(set(self.graph.nodes), {"a", "b", "c"})
+        self.assertEqual(set(self.graph.edges), {("b", "c")})
+
+    def testUndoRemoveNodeRestoresEdges(self):
+        self.graph.addEdge("a", "b")
+        self.graph.editNode("a", {"label": "x"})
+        self.graph.removeNode("a")
+
+        self.graph.undo()
+        self.assertEqual(set(self.graph.edges), {("a", "b")})
+        self.assertEqual(self.graph.nodes["a"].dotAttrs["label"], "x")
+
+    def testUndoEdit(self):
+        self.graph.editNode("a", {"label": "x"})
+        self.graph.editNode("a", {"label": "y"})
+
+        self.graph.undo()
+        self.assertEqual(self.graph.nodes["a"].dotAttrs["label"], "x")
+        self.graph.undo()
+        self.assertIsNone(self.graph.nodes["a"].dotAttrs.get("label"))
+
+    def testBatchIsUndoneAtOnce(self):
+        with self.graph.batch():
+            self.graph.addNode("b")
+            self.graph.editNode("a", {"label": "x"})
+
+        self.graph.undo()
+        self.assertEqual(set(self.graph.nodes), {"a"})
+        self.assertIsNone(self.graph.nodes["a"].dotAttrs.get("label"))
+
+    def testNoUndoRedoDuringBatch(self):
+        self.graph.addNode("b")
+        self.graph.undo()
+        with self.graph.batch():
+            self.graph.addNode("c")
+            self.graph.undo()
+            self.graph.redo()
+            self.graph.editNode("c", {"label": "x"})
+
+        self.assertEqual(set(self.graph.nodes), {"a", "c"})
+        self.graph.undo()
+        self.assertEqual(set(self.graph.nodes), {"a"})
+        self.graph.undo()
+        self.assertEqual(set(self.graph.nodes), set())
+
+    def testNewChangeClearsRedo(self):
+        self.graph.addNode("b")
+        self.graph.undo()
+        self.graph.addNode("c")
+
+        self.assertFalse(self.graph.journal.canRedo())
+
+    def testMovesOfADragAreMerged(self):
+        self.moveNode(1, 1)
+        self.moveNode(2, 2)
+        self.moveNode(3, 3)
+
+        self.graph.undo()
+        self.assertEqual(self.getPos(), (0, 0))
+        self.graph.redo()
+        self.assertEqual(self.getPos(), (3, 3))
+
+    def testDragsAreUndoneSeparately(self):
+        self.moveNode(1, 1)
+        self.moveNode(2, 2)
+        self.graph.closeUndoGroup()
+        self.moveNode(5, 5)
+        self.graph.closeUndoGroup()
+
+        self.graph.undo()
+        self.assertEqual(self.getPos(), (2, 2))
+        self.graph.undo()
+        self.assertEqual(self.getPos(), (0, 0))
+
+    def testMoveAfterUndoIsNotMerged(self):
+        self.moveNode(1, 1)
+        self.graph.closeUndoGroup()
+        self.moveNode(2, 2)
+        self.graph.undo()
+        self.moveNode(3, 3)
+
+        self.graph.undo()
+        self.assertEqual(self.getPos(), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+'''Tests of the region and nearest node queries of the spatial index.'''
+
+import math
+import random
+import unittest
+
+from doted.major_1.minor_0.model.Graph import Graph
+
+
+class TestSpatialIndex(unittest.TestCase):
+    '''Tests of the queries of the spatial index of a graph against a scan of
+    its nodes.'''
+
+    def setUp(self):
+        self.random = random.Random(0)
+        self.graph = Graph()
+        for i in range(300):
+            self.graph.addNode(str(i), {}, *self.getRandomPos())
+
+        # The index is built before the changes
+        self.graph.getSpatialIndex()
+
+    def getRandomPos(self):
+        '''Return random coordinates, out of the first root cell of the
+        quadtree for some of them.'''
+        return (self.random.uniform(-3000, 3000),
+                self.random.uniform(-3000, 3000))
+
+    def moveNode(self, idNode, x, y):
+        '''Move a node like a drag.
+
+        Argument(s):
+        idNode (str): ID of the node
+        x (float): x coordinate of the node
+        y (float): y coordinate of the node
+        '''
+        self.graph.editNode(idNode, {"pos": '"{0},{1}"'.format(x, y)})
+
+    def assertQueriesMatchScan(self):
+        '''Check region and nearest node queries against a scan of the
+        nodes.'''
+        nodes = self.graph.nodes.values()
+        for i in range(20):
+            x1, y1 = self.getRandomPos()
+            x2, y2 = self.getRandomPos()
+            left, right = min(x1, x2), max(x1, x2)
+            top, bottom = min(y1, y2), max(y1, y2)
+            self.assertEqual(
+                set(self.graph.getNodesIn(left, top, right, bottom)),
+                {node.id for node in nodes
+                 if left <= node.x <= right and top <= node.y <= bottom})
+
+            x, y = self.getRandomPos()
+            nearest = self.graph.nodes[self.graph.getNearestNode(x, y)]
+            self.assertEqual(math.hypot(nearest.x - x, nearest.y - y),
+                             min(math.hypot(node.x - x, node.y - y)
+                                 for node in nodes))
+
+        self.assertEqual(self.graph.getSpatialIndex().root.count, len(nodes))
+
+    def testAdd(self):
+        self.assertQueriesMatchScan()
+
+    def testMove(self):
+        for i in range(200):
+            self.moveNode(str(self.random.randrange(300)),
+                          *self.getRandomPos())
+        self.assertQueriesMatchScan()
+
+        # Moves in a small area split the cells down to their minimal size
+        for i in range(100):
+            self.moveNode(str(i), self.random.uniform(0, 2),
+                          self.random.uniform(0, 2))
+        self.assertQueriesMatchScan()
+
+    def testRemove(self):
+        for i in range(0, 300, 2):
+            self.graph.removeNode(str(i))
+        self.assertQueriesMatchScan()
+
+        self.graph.addNode("new", {}, 5000, -5000)
+        self.assertEqual(self.graph.getNearestNode(6000, -6000), "new")
+        self.assertQueriesMatchScan()
+
+    def testRemoveAll(self):
+        for i in range(300):
+            self.graph.removeNode(str(i))
+
+        root = self.graph.getSpatialIndex().root
+        self.assertEqual((root.count, root.children), (0, None))
+        self.assertIsNone(self.graph.getNearestNode(0, 0))
+        self.assertEqual(self.graph.getNodesIn(-1e9, -1e9, 1e9, 1e9), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+'''Tests of the synchronisation of TextGraphView with the model.'''
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QFocusEvent, QTextCursor
+from PyQt5.QtCore import QEvent
+from PyQt5.QtWidgets import QApplication
+
+from doted.major_1.minor_1.app.Doted import Doted
+
+
+app = QApplication.instance() or QApplication([])
+
+
+class TestTextGraphView(unittest.TestCase):
+    '''Tests of the text written by the user and of the model.'''
+
+    def setUp(self):
+        self.doted = Doted(threaded=False)
+        self.view = self.doted.textGraphView
+        self.model = self.doted.graphModel
+
+    def importGraph(self, text):
+        '''Import a dot text in the application.
+
+        Argument(s):
+        text (str): Dot text
+        '''
+        self.doted.textGraphController.importGraph(text)
+
+    def removeLine(self, text):
+        '''Remove the line of the text like the user would do it.
+
+        Argument(s):
+        text (str): Text of the line without indentation
+        '''
+        cursor = self.view.document().find(text)
+        self.assertFalse(cursor.isNull())
+        cursor.movePosition(QTextCursor.StartOfBlock)
+        cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+
+    def replaceText(self, old, new):
+        '''Replace a part of the text like the user would do it.
+
+        Argument(s):
+        old (str): Text to replace
+        new (str): New text
+        '''
+        cursor = self.view.document().find(old)
+        self.assertFalse(cursor.isNull())
+        cursor.insertText(new)
+
+    def focusOut(self):
+        '''Make the view lose the focus, which sends the text to the model.'''
+        self.view.focusOutEvent(QFocusEvent(QEvent.FocusOut))
+
+    def getNodes(self, model=None):
+        '''Return the IDs of the nodes of a model.
+
+        Argument(s):
+        model (Graph): Model (default None: the model of the application)
+        '''
+        model = model or self.model
+        return {idNode for idNode in model.nodes if idNode != '"\\n"'}
+
+    def getLabels(self, model):
+        '''Return the label of each node of a model.
+
+        Argument(s):
+        model (Graph): Model
+        '''
+        return {idNode: model.nodes[idNode].dotAttrs.get("label")
+                for idNode in self.getNodes(model)}
+
+    def assertSameAsReparse(self):
+        '''Check that the model is the one built by a full parse of the
+        text.'''
+        doted = Doted(threaded=False)
+        doted.textGraphController.importGraph(self.view.toPlainText())
+
+        self.assertEqual(self.getLabels(self.model),
+                         self.getLabels(doted.graphModel))
+        self.assertEqual(set(self.model.edges), set(doted.graphModel.edges))
+
+    def testEditLabel(self):
+        self.importGraph("graph g {\n    a [label=x];\n    b;\n    a -- b;\n}")
+        self.replaceText("label=x", "label=y")
+        self.focusOut()
+
+        self.assertEqual(self.getLabels(self.model)["a"], "y")
+        self.assertSameAsReparse()
+
+    def testAddAndRemoveStatements(self):
+        self.importGraph("graph g {\n    a;\n    b;\n    a -- b;\n}")
+        self.replaceText("a -- b;", "a -- b;\n    b -- c;")
+        self.removeLine("a -- b;")
+        self.focusOut()
+
+        self.assertEqual(set(self.model.edges), {("b", "c")})
+        self.assertEqual(self.getNodes(), {"a", "b", "c"})
+        self.assertSameAsReparse()
+
+    def testModelWriteDuringPendingEdit(self):
+        self.importGraph("graph g {\n    a [label=x];\n    b;\n    a -- b;\n}")
+        self.replaceText("label=x", "label=y")
+        self.doted.graphicsGraphController.onCreateNode(10, 20)
+        self.focusOut()
+
+        self.assertEqual(self.getLabels(self.model)["a"], "y")
+        self.assertEqual(len(self.getNodes()), 3)
+        self.assertSameAsReparse()
+
+    def testRemoveNodeKeepsPendingDeletion(self):
+        self.importGraph("graph g {\n    a [label=x];\n    b;\n    a -- b;\n"
+                         "    c -- d;\n}")
+        self.removeLine("b;")
+        self.doted.graphicsGraphController.onRemoveNode("a")
+        self.focusOut()
+
+        self.assertEqual(self.getNodes(), {"c", "d"})
+        self.assertEqual(set(self.model.edges), {("c", "d")})
+        self.assertNotIn("b", self.view.toPlainText())
+        self.assertSameAsReparse()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016 Victor Nea, Morvan Lassauzay, Matthieu Dien, Marwan Ghanem
+# This file is part of dotEd.
+#
+# dotEd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# dotEd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with dotEd.  If not, see <http://www.gnu.org/licenses/>.
+
+'''Tests of the parses run by TextParseWorker on another thread.'''
+
+import os
+import threading
+import time
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from doted.major_1.minor_0.utils.TextParseWorker import TextParseWorker
+
+
+app = QApplication.instance() or QApplication([])
+
+
+def fail(message):
+    '''Parse function raising an error.
+
+    Argument(s):
+    message (str): Message of the error
+    '''
+    raise ValueError(message)
+
+
+class TestTextParseWorker(unittest.TestCase):
+    '''Tests of the results and errors sent by TextParseWorker.'''
+
+    def setUp(self):
+        self.worker = TextParseWorker()
+        self.results = []
+        self.errors = []
+        self.worker.parsed.connect(self.results.append)
+        self.worker.failed.connect(self.errors.append)
+
+    def wait(self):
+        '''Process the events until the worker is not busy anymore.'''
+        deadline = time.time() + 5
+        while self.worker.isBusy() and time.time() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+        self.assertFalse(self.worker.isBusy())
+
+    def testParse(self):
+        self.worker.parse(str.upper, "a")
+        self.assertTrue(self.worker.isBusy())
+        self.wait()
+
+        self.assertEqual(self.results, ["A"])
+        self.assertEqual(self.errors, [])
+
+    def testFailedParse(self):
+        self.worker.parse(fail, "error")
+        self.wait()
+
+        self.assertEqual(self.results, [])
+        self.assertEqual(self.errors, ["error"])
+
+        # The worker is still usable
+        self.worker.parse(str.upper, "b")
+        self.wait()
+        self.assertEqual(self.results, ["B"])
+
+    def testSupersededParse(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def block(text):
+            started.set()
+            release.wait(5)
+            return text
+
+        self.worker.parse(block, "old")
+        started.wait(5)
+        self.worker.parse(str.upper, "new")
+        release.set()
+        self.wait()
+
+        self.assertEqual(self.results, ["NEW"])
+
+    def testCancel(self):
+        self.worker.parse(str.upper, "a")
+        self.worker.cancel()
+        self.assertFalse(self.worker.isBusy())
+
+        # The result of the cancelled parse is dropped
+        time.sleep(0.05)
+        app.processEvents()
+        self.assertEqual(self.results, [])
+
+
+if __name__ == "__main__":
+    unittest.main()